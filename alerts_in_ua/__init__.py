@@ -1,6 +1,80 @@
 __version__ = "0.3.2"
 
-from .client import Client
-from .async_client import AsyncClient
-from .location_uid_resolver import LocationUidResolver
-__all__ = ['Client','AsyncClient']
\ No newline at end of file
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the submodules defining them. Submodules are imported on first
+# attribute access, so `import alerts_in_ua` does not load requests, aiohttp or pytz
+# and a program using only Client never imports aiohttp.
+_EXPORTS = {
+    'Client': 'client',
+    'AsyncClient': 'async_client',
+    'LocationUidResolver': 'location_uid_resolver',
+    'LocationRegistry': 'location_registry',
+    'ColumnarAlerts': 'columnar_alerts',
+    'AlertIntervalIndex': 'alert_interval_index',
+    'AlertAnalytics': 'alert_analytics',
+    'DurationStats': 'alert_analytics',
+    'AnalyticsBackend': 'alert_analytics',
+    'NumpyAnalyticsBackend': 'alert_analytics',
+    'RateLimiter': 'rate_limiter',
+    'RetryPolicy': 'retry_policy',
+    'JsonCodec': 'json_codec',
+    'OrjsonCodec': 'json_codec',
+    'AirRaidAlertStatusDiff': 'air_raid_alert_status_diff',
+    'AirRaidAlertStatusChange': 'air_raid_alert_status_diff',
+    'AirRaidAlertStatusSnapshot': 'air_raid_alert_status_snapshot',
+    'ResponseCache': 'response_cache',
+    'MemoryResponseCache': 'response_cache',
+    'SqliteResponseCache': 'sqlite_response_cache',
+    'RequestEvent': 'instrumentation',
+    'PrometheusAggregator': 'prometheus_aggregator',
+    'ApiProtocol': 'api_protocol',
+    'Transport': 'transport',
+    'AsyncTransport': 'transport',
+    'TransportResponse': 'transport',
+    'RequestsTransport': 'requests_transport',
+    'AiohttpTransport': 'aiohttp_transport',
+    'HttpxTransport': 'httpx_transport',
+    'AsyncHttpxTransport': 'httpx_transport',
+}
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .async_client import AsyncClient
+    from .location_uid_resolver import LocationUidResolver
+    from .location_registry import LocationRegistry
+    from .columnar_alerts import ColumnarAlerts
+    from .alert_interval_index import AlertIntervalIndex
+    from .alert_analytics import AlertAnalytics, DurationStats, AnalyticsBackend, NumpyAnalyticsBackend
+    from .rate_limiter import RateLimiter
+    from .retry_policy import RetryPolicy
+    from .json_codec import JsonCodec, OrjsonCodec
+    from .air_raid_alert_status_diff import AirRaidAlertStatusDiff, AirRaidAlertStatusChange
+    from .air_raid_alert_status_snapshot import AirRaidAlertStatusSnapshot
+    from .response_cache import ResponseCache, MemoryResponseCache
+    from .sqlite_response_cache import SqliteResponseCache
+    from .instrumentation import RequestEvent
+    from .prometheus_aggregator import PrometheusAggregator
+    from .api_protocol import ApiProtocol
+    from .transport import Transport, AsyncTransport, TransportResponse
+    from .requests_transport import RequestsTransport
+    from .aiohttp_transport import AiohttpTransport
+    from .httpx_transport import HttpxTransport, AsyncHttpxTransport
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Cache in the module namespace so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
+
+__all__ = ['Client','AsyncClient','ColumnarAlerts','AlertIntervalIndex','AlertAnalytics','DurationStats','AnalyticsBackend','NumpyAnalyticsBackend','RateLimiter','RetryPolicy','JsonCodec','OrjsonCodec','AirRaidAlertStatusDiff','AirRaidAlertStatusChange','ResponseCache','MemoryResponseCache','SqliteResponseCache','AirRaidAlertStatusSnapshot','LocationRegistry','RequestEvent','PrometheusAggregator','ApiProtocol','Transport','AsyncTransport','TransportResponse','RequestsTransport','AiohttpTransport','HttpxTransport','AsyncHttpxTransport']
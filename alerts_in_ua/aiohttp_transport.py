@@ -0,0 +1,112 @@
+import asyncio
+import time
+from typing import Dict, Optional
+import aiohttp
+from .instrumentation import Instrumentation, RequestEvent
+from .transport import AsyncTransport, TransportResponse
+
+
+class AiohttpTransport(AsyncTransport):
+    """
+    Transport on aiohttp, the default for AsyncClient.
+
+    A single session with a shared TCPConnector is created lazily, because aiohttp
+    needs a running event loop. When instrumentation has listeners as the session is
+    created, an aiohttp TraceConfig records DNS, connect and time-to-first-byte
+    timings on the request events.
+    """
+
+    CONNECTION_LIMIT = 100
+    CONNECTION_LIMIT_PER_HOST = 0
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 30
+    REQUEST_TIMEOUT = 5
+
+    transient_errors = (asyncio.TimeoutError, aiohttp.ClientConnectionError)
+
+    def __init__(self, limit: int = CONNECTION_LIMIT, limit_per_host: int = CONNECTION_LIMIT_PER_HOST,
+                 ttl_dns_cache: int = DNS_CACHE_TTL, keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+                 timeout: float = REQUEST_TIMEOUT, instrumentation: Optional[Instrumentation] = None):
+        """
+        Args:
+            limit (int): Maximum number of simultaneous connections
+            limit_per_host (int): Maximum connections per host, 0 for no limit
+            ttl_dns_cache (int): Seconds DNS results are cached
+            keepalive_timeout (float): Seconds idle connections are kept open
+            timeout (float): Total timeout of a request in seconds; per read for streamed responses
+            instrumentation (Instrumentation, optional): Enables timing traces when it has listeners
+        """
+        self.connector_options = {
+            "limit": limit,
+            "limit_per_host": limit_per_host,
+            "ttl_dns_cache": ttl_dns_cache,
+            "keepalive_timeout": keepalive_timeout,
+        }
+        self.timeout = timeout
+        self.instrumentation = instrumentation
+        self.session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self.connector_options),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                # Tracing is only wired in when listeners exist as the session is created
+                trace_configs=[self._trace_config()] if self.instrumentation else None,
+            )
+        return self.session
+
+    @staticmethod
+    def _trace_config() -> aiohttp.TraceConfig:
+        # Fills DNS, connect and time-to-first-byte timings of the RequestEvent passed as trace_request_ctx
+        async def on_request_start(session, context, params):
+            context.request_started = time.perf_counter()
+
+        async def on_request_end(session, context, params):
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx.ttfb = time.perf_counter() - context.request_started
+
+        async def on_dns_start(session, context, params):
+            context.dns_started = time.perf_counter()
+
+        async def on_dns_end(session, context, params):
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx.add_time('dns_time', time.perf_counter() - context.dns_started)
+
+        async def on_connect_start(session, context, params):
+            context.connect_started = time.perf_counter()
+
+        async def on_connect_end(session, context, params):
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx.add_time('connect_time', time.perf_counter() - context.connect_started)
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_request_end.append(on_request_end)
+        trace_config.on_dns_resolvehost_start.append(on_dns_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_end)
+        trace_config.on_connection_create_start.append(on_connect_start)
+        trace_config.on_connection_create_end.append(on_connect_end)
+        return trace_config
+
+    async def send(self, url: str, headers: Dict[str, str], stream: bool = False,
+                   event: Optional[RequestEvent] = None) -> TransportResponse:
+        session = self._get_session()
+        if stream:
+            # The total timeout would cut off long downloads, so only individual reads are bounded
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=self.timeout, sock_read=self.timeout)
+            response = await session.get(url, headers=headers, timeout=timeout, trace_request_ctx=event)
+
+            async def close():
+                response.release()
+
+            return TransportResponse(response.status, response.headers, iter_chunks=response.content.iter_chunked, close=close)
+        # The body is read before the connection goes back to the pool
+        async with session.get(url, headers=headers, trace_request_ctx=event) as response:
+            body = await response.read()
+        return TransportResponse(response.status, response.headers, body)
+
+    async def close(self) -> None:
+        if self.session is not None and not self.session.closed:
+            await self.session.close()
+        self.session = None
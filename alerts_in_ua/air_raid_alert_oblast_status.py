@@ -1,4 +1,5 @@
 class AirRaidAlertOblastStatus:
+    __slots__ = ('status', 'location_title')
     STATUS_MAP = {'A': 'active', 'P': 'partly', 'N': 'no_alert'}
     def __init__(self, location_title: str, status: str, oblast_level_only: bool = False):
         status = self.STATUS_MAP.get(status, 'no_alert')
@@ -16,8 +17,13 @@ class AirRaidAlertOblastStatus:
     def is_no_alert(self) -> bool:
         return self.status == "no_alert"
 
-    def location_title(self) -> str:
-        return self.location_title
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AirRaidAlertOblastStatus):
+            return NotImplemented
+        return self.status == other.status and self.location_title == other.location_title
+
+    def __hash__(self) -> int:
+        return hash((self.status, self.location_title))
 
     def __repr__(self) -> str:
         if self.status == "active":
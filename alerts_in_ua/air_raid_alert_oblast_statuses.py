@@ -1,3 +1,4 @@
+import copy
 from typing import List
 from .air_raid_alert_oblast_status import AirRaidAlertOblastStatus
 class AirRaidAlertOblastStatuses:
@@ -53,5 +54,16 @@ class AirRaidAlertOblastStatuses:
      def __iter__(self) -> List[AirRaidAlertOblastStatus]:
         return iter(self.oblast_statuses)
 
+     def __eq__(self, other) -> bool:
+        if not isinstance(other, AirRaidAlertOblastStatuses):
+            return NotImplemented
+        return self.oblast_statuses == other.oblast_statuses
+
+     def __copy__(self) -> 'AirRaidAlertOblastStatuses':
+        clone = AirRaidAlertOblastStatuses.__new__(AirRaidAlertOblastStatuses)
+        clone.__dict__.update(self.__dict__)
+        clone.oblast_statuses = [copy.copy(oblast_status) for oblast_status in self.oblast_statuses]
+        return clone
+
      def __repr__(self) -> str:
          return str(self.oblast_statuses)
\ No newline at end of file
@@ -3,7 +3,9 @@ class AirRaidAlertStatus:
     Represents air raid alert status for a specific location.
     This class is used for the get_air_raid_alert_statuses method.
     """
-    
+
+    __slots__ = ('location_title', 'status', 'uid')
+
     def __init__(self, location_title: str, status: str, uid: int = None):
         """
         Initialize AirRaidAlertStatus.
@@ -17,6 +19,14 @@ class AirRaidAlertStatus:
         self.status = status
         self.uid = uid
     
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AirRaidAlertStatus):
+            return NotImplemented
+        return self.uid == other.uid and self.status == other.status and self.location_title == other.location_title
+
+    def __hash__(self) -> int:
+        return hash((self.uid, self.status, self.location_title))
+
     def __repr__(self) -> str:
         if self.status == "active":
             return f"🔴 {self.location_title}"
@@ -0,0 +1,174 @@
+from typing import Dict, List, Optional, Union
+from .air_raid_alert_oblast_statuses import AirRaidAlertOblastStatuses
+from .air_raid_alert_statuses import AirRaidAlertStatuses
+from .air_raid_alert_status_vector import AirRaidAlertStatusVector
+from .location_registry import LocationRegistry
+
+Snapshot = Union[str, AirRaidAlertStatusVector, AirRaidAlertStatuses, AirRaidAlertOblastStatuses]
+
+
+class AirRaidAlertStatusChange:
+    """
+    A single UID whose air raid alert status differs between two snapshots.
+    """
+
+    STARTED = 'started'
+    ENDED = 'ended'
+    ESCALATED = 'escalated'
+    DOWNGRADED = 'downgraded'
+
+    __slots__ = ('uid', 'old_status', 'new_status', 'kind', 'location_title')
+
+    def __init__(self, uid: int, old_status: str, new_status: str, kind: str, location_title: Optional[str] = None):
+        """
+        Initialize AirRaidAlertStatusChange.
+
+        Args:
+            uid (int): The UID of the location that changed
+            old_status (str): Status in the previous snapshot
+            new_status (str): Status in the current snapshot
+            kind (str): One of 'started', 'ended', 'escalated' (partly -> active) or 'downgraded' (active -> partly)
+            location_title (str, optional): The title of the location, None if it is unknown
+        """
+        self.uid = uid
+        self.old_status = old_status
+        self.new_status = new_status
+        self.kind = kind
+        self.location_title = location_title
+
+    def __repr__(self) -> str:
+        title = self.location_title if self.location_title is not None else f"#{self.uid}"
+        return f"AirRaidAlertStatusChange({title}: {self.old_status} -> {self.new_status}, {self.kind})"
+
+
+class AirRaidAlertStatusDiff:
+    """
+    Changes between two snapshots of air raid statuses, keyed by location UID.
+
+    Works directly on the raw strings returned by iot/active_air_raid_alerts.json or, with
+    by_oblast=True, iot/active_air_raid_alerts_by_oblast.json, on AirRaidAlertStatusVector
+    objects and on the AirRaidAlertStatuses and AirRaidAlertOblastStatuses containers.
+    Positions of the by-oblast string and oblast titles are mapped to UIDs with the location registry.
+    Identical snapshots cost a single comparison; otherwise only differing chunks are
+    inspected byte by byte. Transitions between no_alert and undefined are not alerts
+    starting or ending and are ignored.
+    """
+
+    CHUNK_SIZE = 64
+
+    _ACTIVE = AirRaidAlertStatusVector.ACTIVE
+    _PARTLY = AirRaidAlertStatusVector.PARTLY
+
+    def __init__(self, old: Optional[Snapshot], new: Snapshot, uid_to_location: Optional[Dict[int, str]] = None,
+                 registry: LocationRegistry = None, by_oblast: bool = False):
+        """
+        Initialize AirRaidAlertStatusDiff.
+
+        Args:
+            old: The previous snapshot, or None for the first poll
+            new: The current snapshot
+            uid_to_location (dict, optional): Mapping of UID to location title, the registry titles by default
+            registry (LocationRegistry, optional): Location registry, the packaged registry by default
+            by_oblast (bool): Raw strings come from iot/active_air_raid_alerts_by_oblast.json
+                rather than iot/active_air_raid_alerts.json
+
+        Raises:
+            ValueError: If a raw string does not have the length of the endpoint it should come from
+        """
+        self.changes: List[AirRaidAlertStatusChange] = []
+        registry = registry if registry is not None else LocationRegistry.default()
+        for snapshot in (old, new):
+            if isinstance(snapshot, str):
+                self._check_string(snapshot, registry, by_oblast)
+        if isinstance(old, str) and isinstance(new, str) and old == new:
+            return
+        old_codes = self._codes(old, registry, by_oblast) if old is not None else b''
+        new_codes = self._codes(new, registry, by_oblast)
+        if old_codes == new_codes:
+            return
+
+        size = max(len(old_codes), len(new_codes))
+        old_codes = old_codes.ljust(size, b'\x00')
+        new_codes = new_codes.ljust(size, b'\x00')
+        names = AirRaidAlertStatusVector.STATUS_NAMES
+        chunk = self.CHUNK_SIZE
+        for start in range(0, size, chunk):
+            end = start + chunk
+            if old_codes[start:end] == new_codes[start:end]:
+                continue
+            for uid in range(start, min(end, size)):
+                old_code = old_codes[uid]
+                new_code = new_codes[uid]
+                if old_code == new_code:
+                    continue
+                kind = self._kind(old_code, new_code)
+                if kind is None:
+                    continue
+                location_title = uid_to_location.get(uid) if uid_to_location is not None else registry.title(uid)
+                self.changes.append(AirRaidAlertStatusChange(uid, names[old_code], names[new_code], kind, location_title))
+
+    @staticmethod
+    def _check_string(snapshot: str, registry: LocationRegistry, by_oblast: bool) -> None:
+        if by_oblast:
+            if len(snapshot) != len(AirRaidAlertOblastStatuses.LOCATIONS):
+                raise ValueError(f"Expected a by-oblast status string of {len(AirRaidAlertOblastStatuses.LOCATIONS)}"
+                                 f" characters, got {len(snapshot)}")
+            return
+        # The full-country string is indexed by UID, so it always covers every oblast
+        required = max(registry.uid(location) or 0 for location in AirRaidAlertOblastStatuses.LOCATIONS) + 1
+        if len(snapshot) < required:
+            raise ValueError(f"Expected a status string of at least {required} characters, got {len(snapshot)};"
+                             f" pass by_oblast=True for the by-oblast string")
+
+    @staticmethod
+    def _codes(snapshot: Snapshot, registry: LocationRegistry, by_oblast: bool) -> bytes:
+        if isinstance(snapshot, AirRaidAlertStatusVector):
+            return snapshot.codes
+        if isinstance(snapshot, AirRaidAlertStatuses):
+            return AirRaidAlertStatusVector.from_statuses(
+                {status.uid: status.status for status in snapshot if status.uid is not None}
+            ).codes
+        if isinstance(snapshot, AirRaidAlertOblastStatuses):
+            return AirRaidAlertStatusVector.from_oblast_statuses(snapshot, registry).codes
+        if by_oblast:
+            return AirRaidAlertStatusVector.from_oblast_string(snapshot, registry).codes
+        return AirRaidAlertStatusVector(snapshot).codes
+
+    @classmethod
+    def _kind(cls, old_code: int, new_code: int) -> Optional[str]:
+        old_alerted = old_code == cls._ACTIVE or old_code == cls._PARTLY
+        new_alerted = new_code == cls._ACTIVE or new_code == cls._PARTLY
+        if new_alerted and not old_alerted:
+            return AirRaidAlertStatusChange.STARTED
+        if old_alerted and not new_alerted:
+            return AirRaidAlertStatusChange.ENDED
+        if old_alerted and new_alerted:
+            return AirRaidAlertStatusChange.ESCALATED if new_code == cls._ACTIVE else AirRaidAlertStatusChange.DOWNGRADED
+        return None
+
+    def filter_by_kind(self, kind: str) -> List[AirRaidAlertStatusChange]:
+        return [change for change in self.changes if change.kind == kind]
+
+    def started(self) -> List[AirRaidAlertStatusChange]:
+        return self.filter_by_kind(AirRaidAlertStatusChange.STARTED)
+
+    def ended(self) -> List[AirRaidAlertStatusChange]:
+        return self.filter_by_kind(AirRaidAlertStatusChange.ENDED)
+
+    def escalated(self) -> List[AirRaidAlertStatusChange]:
+        return self.filter_by_kind(AirRaidAlertStatusChange.ESCALATED)
+
+    def downgraded(self) -> List[AirRaidAlertStatusChange]:
+        return self.filter_by_kind(AirRaidAlertStatusChange.DOWNGRADED)
+
+    def __iter__(self):
+        return iter(self.changes)
+
+    def __len__(self) -> int:
+        return len(self.changes)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def __repr__(self) -> str:
+        return f"AirRaidAlertStatusDiff({self.changes})"
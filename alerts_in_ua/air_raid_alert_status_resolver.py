@@ -1,3 +1,5 @@
+from .air_raid_alert_status_vector import AirRaidAlertStatusVector
+
 class AirRaidAlertStatusResolver:
     """
     Resolves air raid alert status characters from the API to meaningful status values.
@@ -61,3 +63,16 @@ class AirRaidAlertStatusResolver:
        
                 
         return resolved_statuses
+
+    @classmethod
+    def resolve_status_vector(cls, status_string: str) -> AirRaidAlertStatusVector:
+        """
+        Decodes a complete status string at once into a compact status vector.
+        
+        Args:
+            status_string (str): The complete status string from the API
+            
+        Returns:
+            AirRaidAlertStatusVector: Status codes indexed by UID
+        """
+        return AirRaidAlertStatusVector(status_string)
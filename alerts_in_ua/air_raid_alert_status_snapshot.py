@@ -0,0 +1,118 @@
+from typing import List, Union
+from .errors import InvalidParameterException
+from .location_registry import LocationRegistry
+from .air_raid_alert_status import AirRaidAlertStatus
+from .air_raid_alert_statuses import AirRaidAlertStatuses
+from .air_raid_alert_oblast_status import AirRaidAlertOblastStatus
+from .air_raid_alert_oblast_statuses import AirRaidAlertOblastStatuses
+from .air_raid_alert_status_vector import AirRaidAlertStatusVector
+
+
+class AirRaidAlertStatusSnapshot:
+    """
+    Answers status queries for any location from one iot/active_air_raid_alerts.json response.
+
+    The full-country status string already holds every UID, so per-oblast statuses,
+    the by-oblast overview and raion-under-oblast queries are all computed in memory
+    from the decoded vector and the location registry instead of one request each.
+    """
+
+    __slots__ = ('vector', 'registry')
+
+    def __init__(self, vector: AirRaidAlertStatusVector, registry: LocationRegistry = None):
+        """
+        Initialize AirRaidAlertStatusSnapshot.
+
+        Args:
+            vector (AirRaidAlertStatusVector): The decoded full-country status string
+            registry (LocationRegistry, optional): Location hierarchy, the packaged registry by default
+        """
+        self.vector = vector
+        self.registry = registry if registry is not None else LocationRegistry.default()
+
+    def _uid(self, uid_or_location_title: Union[int, str]) -> int:
+        if isinstance(uid_or_location_title, str):
+            if uid_or_location_title.isdigit():
+                return int(uid_or_location_title)
+            uid = self.registry.uid(uid_or_location_title)
+            if uid is None:
+                raise InvalidParameterException(f"Unknown location: {uid_or_location_title}")
+            return uid
+        return uid_or_location_title
+
+    def _status_char(self, uid: int) -> str:
+        status_string = self.vector.status_string
+        return status_string[uid] if 0 <= uid < len(status_string) else ' '
+
+    def status(self, uid_or_location_title: Union[int, str], oblast_level_only: bool = False) -> AirRaidAlertOblastStatus:
+        """
+        Return the status of one location, like Client.get_air_raid_alert_status but without a request.
+
+        Args:
+            uid_or_location_title (int or str): The UID or title of the location
+            oblast_level_only (bool): Report partly alerted oblasts as no_alert
+
+        Returns:
+            AirRaidAlertOblastStatus: The status of the location
+        """
+        uid = self._uid(uid_or_location_title)
+        return AirRaidAlertOblastStatus(
+            location_title=self.registry.title(uid) or "Unknown location",
+            status=self._status_char(uid),
+            oblast_level_only=oblast_level_only,
+        )
+
+    def oblast_statuses(self, oblast_level_only: bool = False) -> AirRaidAlertOblastStatuses:
+        """
+        Return the statuses of all oblasts, like Client.get_air_raid_alert_statuses_by_oblast.
+
+        Args:
+            oblast_level_only (bool): Report partly alerted oblasts as no_alert
+
+        Returns:
+            AirRaidAlertOblastStatuses: Oblast statuses in the same order as the by-oblast endpoint
+        """
+        data = ''.join(self._status_char(self.registry.uid(title)) for title in AirRaidAlertOblastStatuses.LOCATIONS)
+        return AirRaidAlertOblastStatuses(data, oblast_level_only=oblast_level_only)
+
+    def raion_statuses(self, oblast_uid_or_location_title: Union[int, str]) -> AirRaidAlertStatuses:
+        """
+        Return the statuses of the locations directly under an oblast.
+
+        Args:
+            oblast_uid_or_location_title (int or str): The UID or title of the oblast
+
+        Returns:
+            AirRaidAlertStatuses: One status per raion (or city) with data in the snapshot
+        """
+        oblast_uid = self._uid(oblast_uid_or_location_title)
+        names = AirRaidAlertStatusVector.STATUS_NAMES
+        statuses = []
+        for uid in self.registry.children(oblast_uid):
+            code = self.vector.status_code_of(uid)
+            if code != AirRaidAlertStatusVector.UNDEFINED:
+                statuses.append(AirRaidAlertStatus(location_title=self.registry.title(uid), status=names[code], uid=uid))
+        return AirRaidAlertStatuses(statuses)
+
+    def alerted_raions(self, oblast_uid_or_location_title: Union[int, str]) -> List[int]:
+        """Return the UIDs of the locations under an oblast with an active or partly active alert."""
+        oblast_uid = self._uid(oblast_uid_or_location_title)
+        return [
+            uid for uid in self.registry.children(oblast_uid)
+            if self.vector.status_code_of(uid) in (AirRaidAlertStatusVector.ACTIVE, AirRaidAlertStatusVector.PARTLY)
+        ]
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, AirRaidAlertStatusSnapshot):
+            return NotImplemented
+        return self.vector == other.vector
+
+    def __hash__(self) -> int:
+        return hash(self.vector)
+
+    def __copy__(self) -> 'AirRaidAlertStatusSnapshot':
+        # Immutable, so memoized instances can be shared as is
+        return self
+
+    def __repr__(self) -> str:
+        return f"AirRaidAlertStatusSnapshot({self.vector!r})"
@@ -0,0 +1,158 @@
+from typing import Dict, Set
+from .air_raid_alert_status import AirRaidAlertStatus
+from .air_raid_alert_statuses import AirRaidAlertStatuses
+from .air_raid_alert_oblast_statuses import AirRaidAlertOblastStatuses
+from .location_registry import LocationRegistry
+
+
+class AirRaidAlertStatusVector:
+    """
+    Compact decoding of the status string returned by iot/active_air_raid_alerts.json.
+
+    The whole string is mapped at once with bytes.translate into one status code
+    byte per UID, so lookups are O(1) and no per-location objects are created
+    until to_statuses() is called.
+    """
+
+    UNDEFINED = 0
+    NO_ALERT = 1
+    ACTIVE = 2
+    PARTLY = 3
+    STATUS_NAMES = ('undefined', 'no_alert', 'active', 'partly')
+    # Status string character of each code, the inverse of _TRANSLATION
+    STATUS_CHARS = ' NAP'
+
+    # Unknown characters resolve to no_alert, like AirRaidAlertStatusResolver.resolve_status_char
+    _TRANSLATION = bytearray([NO_ALERT]) * 256
+    _TRANSLATION[ord(' ')] = UNDEFINED
+    _TRANSLATION[ord('A')] = ACTIVE
+    _TRANSLATION[ord('P')] = PARTLY
+    _TRANSLATION = bytes(_TRANSLATION)
+
+    __slots__ = ('status_string', 'codes')
+
+    def __init__(self, status_string: str):
+        """
+        Initialize AirRaidAlertStatusVector.
+
+        Args:
+            status_string (str): The complete status string from the API
+        """
+        self.status_string = status_string
+        self.codes = status_string.encode('ascii', 'replace').translate(self._TRANSLATION)
+
+    @classmethod
+    def from_statuses(cls, statuses: Dict[int, str]) -> 'AirRaidAlertStatusVector':
+        """
+        Build a vector from status names by UID; UIDs that are not given are undefined.
+
+        Args:
+            statuses (dict): Mapping of UID to 'no_alert', 'active', 'partly' or 'undefined'
+        """
+        chars = [' '] * (max(statuses, default=-1) + 1)
+        for uid, status in statuses.items():
+            chars[uid] = cls.STATUS_CHARS[cls.STATUS_NAMES.index(status)] if status in cls.STATUS_NAMES else 'N'
+        return cls(''.join(chars))
+
+    @classmethod
+    def from_oblast_statuses(cls, oblast_statuses: AirRaidAlertOblastStatuses, registry: LocationRegistry = None) -> 'AirRaidAlertStatusVector':
+        """
+        Build a vector indexed by oblast UID from get_air_raid_alert_statuses_by_oblast() results.
+
+        Args:
+            oblast_statuses (AirRaidAlertOblastStatuses): Statuses by oblast title
+            registry (LocationRegistry, optional): Resolves titles to UIDs, the packaged registry by default
+        """
+        registry = registry if registry is not None else LocationRegistry.default()
+        statuses = {}
+        for oblast_status in oblast_statuses:
+            uid = registry.uid(oblast_status.location_title)
+            if uid is not None:
+                statuses[uid] = oblast_status.status
+        return cls.from_statuses(statuses)
+
+    @classmethod
+    def from_oblast_string(cls, status_string: str, registry: LocationRegistry = None) -> 'AirRaidAlertStatusVector':
+        """
+        Build a vector indexed by oblast UID from the iot/active_air_raid_alerts_by_oblast.json
+        string, whose positions follow AirRaidAlertOblastStatuses.LOCATIONS rather than UIDs.
+        """
+        registry = registry if registry is not None else LocationRegistry.default()
+        uids = [registry.uid(location) for location in AirRaidAlertOblastStatuses.LOCATIONS]
+        chars = [' '] * (max((uid for uid in uids if uid is not None), default=-1) + 1)
+        for uid, char in zip(uids, status_string):
+            if uid is not None:
+                chars[uid] = char
+        return cls(''.join(chars))
+
+    def status_code_of(self, uid: int) -> int:
+        """Return the status code of a UID, UNDEFINED if it is out of range."""
+        if 0 <= uid < len(self.codes):
+            return self.codes[uid]
+        return self.UNDEFINED
+
+    def status_of(self, uid: int) -> str:
+        """Return the status ('no_alert', 'active', 'partly' or 'undefined') of a UID."""
+        return self.STATUS_NAMES[self.status_code_of(uid)]
+
+    def uids_with_code(self, code: int) -> Set[int]:
+        """Return the set of UIDs having the given status code."""
+        uids = set()
+        needle = bytes((code,))
+        find = self.codes.find
+        position = find(needle)
+        while position != -1:
+            uids.add(position)
+            position = find(needle, position + 1)
+        return uids
+
+    def active_uids(self) -> Set[int]:
+        return self.uids_with_code(self.ACTIVE)
+
+    def partly_uids(self) -> Set[int]:
+        return self.uids_with_code(self.PARTLY)
+
+    def no_alert_uids(self) -> Set[int]:
+        return self.uids_with_code(self.NO_ALERT)
+
+    def as_numpy(self):
+        """Return the status codes as a read-only numpy uint8 array (requires numpy)."""
+        import numpy
+        return numpy.frombuffer(self.codes, dtype=numpy.uint8)
+
+    def to_statuses(self, uid_to_location_mapping: Dict[int, str]) -> AirRaidAlertStatuses:
+        """
+        Materialize AirRaidAlertStatus objects for every defined UID.
+
+        Args:
+            uid_to_location_mapping (dict): Mapping of UID to location title
+
+        Returns:
+            AirRaidAlertStatuses: The same container get_air_raid_alert_statuses returns
+        """
+        names = self.STATUS_NAMES
+        statuses = [
+            AirRaidAlertStatus(
+                location_title=uid_to_location_mapping.get(uid, f"Локація #{uid}"),
+                status=names[code],
+                uid=uid,
+            )
+            for uid, code in enumerate(self.codes) if code
+        ]
+        return AirRaidAlertStatuses(statuses)
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, AirRaidAlertStatusVector) and self.codes == other.codes
+
+    def __hash__(self) -> int:
+        return hash(self.codes)
+
+    def __copy__(self) -> 'AirRaidAlertStatusVector':
+        # Immutable, so memoized instances can be shared as is
+        return self
+
+    def __repr__(self) -> str:
+        return f"AirRaidAlertStatusVector(active={len(self.active_uids())}, partly={len(self.partly_uids())})"
@@ -1,3 +1,4 @@
+import copy
 from typing import List, Optional
 from .air_raid_alert_status import AirRaidAlertStatus
 
@@ -86,6 +87,16 @@ class AirRaidAlertStatuses:
         """Allow indexing into the statuses list."""
         return self.get_status(index)
     
+    def __eq__(self, other) -> bool:
+        """Statuses are equal when they hold the same statuses in the same order."""
+        if not isinstance(other, AirRaidAlertStatuses):
+            return NotImplemented
+        return self.statuses == other.statuses
+
+    def __copy__(self) -> 'AirRaidAlertStatuses':
+        """Return a copy with its own status objects, so changes to it never affect the original."""
+        return AirRaidAlertStatuses([copy.copy(status) for status in self.statuses])
+
     def __repr__(self) -> str:
         return f"AirRaidAlertStatuses({self.statuses})"
     
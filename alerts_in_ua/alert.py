@@ -1,18 +1,27 @@
 from typing import Optional, Dict, List, Union
 import json
 import datetime
-import pytz
 from .ua_date_parser import UaDateParser
 
 class Alert:
+    # Public fields, compared by __eq__
+    FIELDS = (
+        'id', 'location_title', 'location_type', 'started_at', 'finished_at', 'updated_at', 'alert_type',
+        'location_uid', 'location_oblast', 'location_oblast_uid', 'location_raion', 'notes', 'calculated',
+    )
+    __slots__ = (
+        'id', 'location_title', 'location_type', '_started_at', '_finished_at', '_updated_at', 'alert_type',
+        'location_uid', 'location_oblast', 'location_oblast_uid', 'location_raion', 'notes', 'calculated',
+    )
 
     def __init__(self, data: Dict):
         self.id = data["id"]
         self.location_title = data.get("location_title")
         self.location_type = data.get("location_type")
-        self.started_at = UaDateParser.parse_date(data.get("started_at"))
-        self.finished_at = UaDateParser.parse_date(data.get("finished_at"))
-        self.updated_at = UaDateParser.parse_date(data.get("updated_at"))
+        # Timestamps are kept as raw strings and parsed on first access
+        self._started_at = data.get("started_at")
+        self._finished_at = data.get("finished_at")
+        self._updated_at = data.get("updated_at")
         self.alert_type = data.get("alert_type")
         self.location_uid = data.get("location_uid")
         self.location_oblast = data.get("location_oblast")
@@ -21,8 +30,53 @@ class Alert:
         self.notes = data.get("notes")
         self.calculated = data.get("calculated")
 
+    @property
+    def started_at(self) -> Optional[datetime.datetime]:
+        if isinstance(self._started_at, str):
+            self._started_at = UaDateParser.parse_date(self._started_at)
+        elif isinstance(self._started_at, int):
+            self._started_at = UaDateParser.from_epoch_us(self._started_at)
+        return self._started_at
+
+    @started_at.setter
+    def started_at(self, value: Optional[datetime.datetime]):
+        self._started_at = value
+
+    @property
+    def finished_at(self) -> Optional[datetime.datetime]:
+        if isinstance(self._finished_at, str):
+            self._finished_at = UaDateParser.parse_date(self._finished_at)
+        elif isinstance(self._finished_at, int):
+            self._finished_at = UaDateParser.from_epoch_us(self._finished_at)
+        return self._finished_at
+
+    @finished_at.setter
+    def finished_at(self, value: Optional[datetime.datetime]):
+        self._finished_at = value
+
+    @property
+    def updated_at(self) -> Optional[datetime.datetime]:
+        if isinstance(self._updated_at, str):
+            self._updated_at = UaDateParser.parse_date(self._updated_at)
+        elif isinstance(self._updated_at, int):
+            self._updated_at = UaDateParser.from_epoch_us(self._updated_at)
+        return self._updated_at
+
+    @updated_at.setter
+    def updated_at(self, value: Optional[datetime.datetime]):
+        self._updated_at = value
 
     def is_finished(self) -> bool:
-        return self.finished_at is not None
+        # Checked on the raw value so that no parsing is needed
+        return self._finished_at is not None and self._finished_at != ""
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Alert):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in Alert.FIELDS)
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
     def __repr__(self):
         return f"Alert({{'id': {self.id!r}, 'location_title': {self.location_title!r}, 'location_type': {self.location_type!r}, 'started_at': {self.started_at!r}, 'finished_at': {self.finished_at!r}, 'updated_at': {self.updated_at!r}, 'alert_type': {self.alert_type!r}, 'location_uid': {self.location_uid!r}, 'location_oblast': {self.location_oblast!r}, 'location_oblast_uid': {self.location_oblast_uid!r}, 'location_raion': {self.location_raion!r}, 'notes': {self.notes!r}, 'calculated': {self.calculated!r}}}"
\ No newline at end of file
@@ -0,0 +1,407 @@
+import datetime
+import statistics
+from array import array
+from bisect import bisect_right
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple
+from .ua_date_parser import UaDateParser, NO_TIME
+
+if TYPE_CHECKING:
+    from .alerts import Alerts
+
+MICROSECONDS = 1000000
+HOUR_US = 3600 * MICROSECONDS
+
+
+class DurationStats:
+    """Summary of alert durations; all times are in seconds."""
+
+    __slots__ = ('count', 'total', 'mean', 'median', 'longest', 'shortest')
+
+    def __init__(self, count: int, total: float, median: Optional[float], longest: Optional[float], shortest: Optional[float]):
+        self.count = count
+        self.total = total
+        self.mean = total / count if count else None
+        self.median = median
+        self.longest = longest
+        self.shortest = shortest
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DurationStats):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"DurationStats(count={self.count}, total={self.total}, mean={self.mean}, median={self.median}, longest={self.longest}, shortest={self.shortest})"
+
+
+class AnalyticsBackend:
+    """
+    Column operations used by AlertAnalytics, in pure Python on array('q') buffers.
+
+    Columns hold epoch microseconds or integer group codes. NumpyAnalyticsBackend
+    implements the same operations on NumPy arrays.
+    """
+
+    name = "python"
+
+    def column(self, values: array):
+        return values
+
+    def take(self, column, positions: Sequence[int]):
+        return array('q', [column[position] for position in positions])
+
+    def durations(self, starts, ends):
+        return array('q', [end - start for start, end in zip(starts, ends)])
+
+    def to_seconds(self, values) -> List[float]:
+        return [value / MICROSECONDS for value in values]
+
+    def total(self, values) -> int:
+        return sum(values)
+
+    def minimum(self, values) -> int:
+        return min(values)
+
+    def maximum(self, values) -> int:
+        return max(values)
+
+    def stats(self, durations) -> DurationStats:
+        if not durations:
+            return DurationStats(0, 0.0, None, None, None)
+        return DurationStats(
+            len(durations), self.total(durations) / MICROSECONDS, statistics.median(durations) / MICROSECONDS,
+            self.maximum(durations) / MICROSECONDS, self.minimum(durations) / MICROSECONDS,
+        )
+
+    def split(self, codes, values, groups: int) -> List[Sequence[int]]:
+        """Partition values by their group code, keeping their order within each group."""
+        parts = [array('q') for _ in range(groups)]
+        for code, value in zip(codes, values):
+            parts[code].append(value)
+        return parts
+
+    def count_by(self, codes, groups: int) -> List[int]:
+        counts = [0] * groups
+        for code in codes:
+            counts[code] += 1
+        return counts
+
+    def sum_by(self, codes, values, groups: int) -> List[int]:
+        sums = [0] * groups
+        for code, value in zip(codes, values):
+            sums[code] += value
+        return sums
+
+    def bucket_counts(self, boundaries: Sequence[int], values) -> List[int]:
+        """Count values in each [boundaries[i], boundaries[i + 1]) bucket; values outside are ignored."""
+        counts = [0] * (len(boundaries) - 1)
+        last = len(boundaries) - 1
+        for value in values:
+            bucket = bisect_right(boundaries, value) - 1
+            if 0 <= bucket < last:
+                counts[bucket] += 1
+        return counts
+
+    def merge(self, starts, ends) -> Tuple[Sequence[int], Sequence[int]]:
+        """Merge overlapping or touching intervals into disjoint ones, ordered by start."""
+        merged_starts = array('q')
+        merged_ends = array('q')
+        for position in sorted(range(len(starts)), key=starts.__getitem__):
+            start, end = starts[position], ends[position]
+            if merged_ends and start <= merged_ends[-1]:
+                if end > merged_ends[-1]:
+                    merged_ends[-1] = end
+            else:
+                merged_starts.append(start)
+                merged_ends.append(end)
+        return merged_starts, merged_ends
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class NumpyAnalyticsBackend(AnalyticsBackend):
+    """Analytics backend on NumPy, used automatically when it is installed."""
+
+    name = "numpy"
+
+    def __init__(self):
+        import numpy
+        self._np = numpy
+
+    def column(self, values: array):
+        # array('q') exposes the buffer protocol, so this is a single copy of the raw bytes
+        return self._np.array(values, dtype=self._np.int64)
+
+    def take(self, column, positions: Sequence[int]):
+        return column[self._np.asarray(positions, dtype=self._np.intp)]
+
+    def durations(self, starts, ends):
+        return ends - starts
+
+    def to_seconds(self, values) -> List[float]:
+        return (values / MICROSECONDS).tolist()
+
+    def total(self, values) -> int:
+        return int(values.sum())
+
+    def minimum(self, values) -> int:
+        return int(values.min())
+
+    def maximum(self, values) -> int:
+        return int(values.max())
+
+    def stats(self, durations) -> DurationStats:
+        if not len(durations):
+            return DurationStats(0, 0.0, None, None, None)
+        return DurationStats(
+            len(durations), self.total(durations) / MICROSECONDS, float(self._np.median(durations)) / MICROSECONDS,
+            self.maximum(durations) / MICROSECONDS, self.minimum(durations) / MICROSECONDS,
+        )
+
+    def split(self, codes, values, groups: int) -> List[Sequence[int]]:
+        np = self._np
+        order = np.argsort(codes, kind='stable')
+        bounds = np.cumsum(np.bincount(codes, minlength=groups))[:-1]
+        return np.split(values[order], bounds)
+
+    def count_by(self, codes, groups: int) -> List[int]:
+        return self._np.bincount(codes, minlength=groups).tolist()
+
+    def sum_by(self, codes, values, groups: int) -> List[int]:
+        # Summed per group in int64; bincount weights would round through float64
+        return [int(part.sum()) for part in self.split(codes, values, groups)]
+
+    def bucket_counts(self, boundaries: Sequence[int], values) -> List[int]:
+        np = self._np
+        buckets = np.searchsorted(np.asarray(boundaries, dtype=np.int64), values, side='right') - 1
+        buckets = buckets[(buckets >= 0) & (buckets < len(boundaries) - 1)]
+        return np.bincount(buckets, minlength=len(boundaries) - 1).tolist()
+
+    def merge(self, starts, ends) -> Tuple[Sequence[int], Sequence[int]]:
+        np = self._np
+        if not len(starts):
+            return starts[:0], ends[:0]
+        order = np.argsort(starts, kind='stable')
+        starts, ends = starts[order], ends[order]
+        # An interval opens a new merged one when it starts after every earlier interval has ended
+        reach = np.maximum.accumulate(ends)
+        opens = np.empty(len(starts), dtype=bool)
+        opens[0] = True
+        np.greater(starts[1:], reach[:-1], out=opens[1:])
+        first = np.flatnonzero(opens)
+        return starts[first], np.maximum.reduceat(ends, first)
+
+
+def default_backend() -> AnalyticsBackend:
+    """Return the fastest available backend: NumPy if installed, otherwise pure Python."""
+    try:
+        return NumpyAnalyticsBackend()
+    except ImportError:
+        return AnalyticsBackend()
+
+
+class AlertAnalytics:
+    """
+    Durations, totals, counts and coverage computed over the timestamp columns of an Alerts history.
+
+    Timestamps are extracted once as epoch-microsecond columns (free for ColumnarAlerts),
+    and every statistic is a column operation instead of a loop over Alert objects and
+    datetimes. Methods take the same keyword criteria as Alerts.query(), e.g.
+    alert_type='air_raid'. Unfinished alerts last until `until`. Alerts without
+    started_at are ignored. All durations are in seconds.
+    """
+
+    GROUP_FIELDS = ('location_title', 'location_type', 'alert_type', 'location_uid', 'location_oblast',
+                    'location_oblast_uid', 'location_raion')
+    PERIODS = ('hour', 'day', 'week', 'month')
+
+    def __init__(self, alerts: 'Alerts', until: Optional[datetime.datetime] = None, backend: Optional[AnalyticsBackend] = None):
+        """
+        Initialize AlertAnalytics.
+
+        Args:
+            alerts (Alerts): The alerts to analyze, e.g. from get_alerts_history(..., columnar=True)
+            until (datetime, optional): End of unfinished alerts, the history's last_updated_at by default
+            backend (AnalyticsBackend, optional): Column backend, NumPy when installed by default
+        """
+        self.alerts = alerts
+        self.backend = backend if backend is not None else default_backend()
+        if until is None:
+            until = alerts.last_updated_at or datetime.datetime.now(datetime.timezone.utc)
+        self.until = until
+        until_us = UaDateParser.kyiv_epoch_us(until)
+        self._starts = alerts._epoch_column('started_at')
+        # Ends before the start (an alert started after `until`) are clamped, so no interval is reversed
+        self._ends = array('q', (
+            max(until_us if end == NO_TIME else end, start)
+            for start, end in zip(self._starts, alerts._epoch_column('finished_at'))
+        ))
+        self._rows = [position for position in range(len(self._starts)) if self._starts[position] != NO_TIME]
+        self._all_columns = (self.backend.column(self._starts), self.backend.column(self._ends))
+        self._columns = self._all_columns
+        if len(self._rows) != len(self._starts):
+            self._columns = tuple(self.backend.take(column, self._rows) for column in self._all_columns)
+        # Dictionary-encoded group fields: field -> (distinct values, backend column of codes per alert)
+        self._groups = {}
+
+    def __repr__(self) -> str:
+        return f"AlertAnalytics({len(self._rows)} alerts, backend={self.backend.name})"
+
+    def _select(self, criteria: Dict) -> Tuple[List[int], object, object]:
+        """Return the positions and the start and end columns of the alerts matching criteria."""
+        if not criteria:
+            return self._rows, self._columns[0], self._columns[1]
+        normalized = [
+            (key, tuple(value) if isinstance(value, (list, tuple, set, frozenset)) else (value,))
+            for key, value in criteria.items()
+        ]
+        rows = [position for position in self.alerts._matching_positions(normalized) if self._starts[position] != NO_TIME]
+        return rows, self.backend.take(self._all_columns[0], rows), self.backend.take(self._all_columns[1], rows)
+
+    def _group(self, field: str, rows: List[int]) -> Tuple[List, object]:
+        """Return the distinct values of a field and the group code of every selected alert."""
+        if field not in self.GROUP_FIELDS:
+            raise ValueError(f"Cannot group by {field!r}, expected one of {', '.join(self.GROUP_FIELDS)}")
+        encoded = self._groups.get(field)
+        if encoded is None:
+            values, codes = self.alerts._group_codes(field)
+            encoded = self._groups[field] = (values, self.backend.column(codes))
+        values, codes = encoded
+        if rows is self._rows and len(rows) == len(self._starts):
+            return values, codes
+        return values, self.backend.take(codes, rows)
+
+    def durations(self, **criteria) -> List[float]:
+        """Return the duration of every alert matching criteria, in history order."""
+        _, starts, ends = self._select(criteria)
+        return self.backend.to_seconds(self.backend.durations(starts, ends))
+
+    def duration_stats(self, **criteria) -> DurationStats:
+        """Return the count, total, mean, median, longest and shortest duration of the alerts matching criteria."""
+        _, starts, ends = self._select(criteria)
+        return self.backend.stats(self.backend.durations(starts, ends))
+
+    def duration_stats_by(self, field: str, **criteria) -> Dict[object, DurationStats]:
+        """
+        Return duration statistics per value of a field.
+
+        Args:
+            field (str): A location or type field, e.g. 'location_oblast' or 'alert_type'
+            **criteria: Restrict to alerts matching Alerts.query() criteria
+
+        Returns:
+            Dict[object, DurationStats]: Statistics for every value occurring in the matching alerts
+        """
+        rows, starts, ends = self._select(criteria)
+        values, codes = self._group(field, rows)
+        parts = self.backend.split(codes, self.backend.durations(starts, ends), len(values))
+        return {value: self.backend.stats(part) for value, part in zip(values, parts) if len(part)}
+
+    def total_duration_by(self, field: str, **criteria) -> Dict[object, float]:
+        """
+        Return the summed duration of the alerts per value of a field.
+        Overlapping alerts are all counted; see coverage_by() for time under any alert.
+        """
+        rows, starts, ends = self._select(criteria)
+        values, codes = self._group(field, rows)
+        counts = self.backend.count_by(codes, len(values))
+        sums = self.backend.sum_by(codes, self.backend.durations(starts, ends), len(values))
+        return {value: total / MICROSECONDS for value, count, total in zip(values, counts, sums) if count}
+
+    def count_by(self, field: str, **criteria) -> Dict[object, int]:
+        """Return the number of alerts per value of a field."""
+        rows, _, _ = self._select(criteria)
+        values, codes = self._group(field, rows)
+        return {value: count for value, count in zip(values, self.backend.count_by(codes, len(values))) if count}
+
+    def counts_per_period(self, period: str = 'day', **criteria) -> Dict[datetime.datetime, int]:
+        """
+        Count the alerts started in each hour, day, week or month, including empty periods.
+
+        Days, weeks (from Monday) and months follow Kyiv local time, so daylight saving
+        changes do not shift the buckets.
+
+        Args:
+            period (str): 'hour', 'day', 'week' or 'month'
+            **criteria: Restrict to alerts matching Alerts.query() criteria
+
+        Returns:
+            Dict[datetime, int]: Start of each period (Kyiv time) to the number of alerts started in it
+        """
+        if period not in self.PERIODS:
+            raise ValueError(f"Unknown period {period!r}, expected one of {', '.join(self.PERIODS)}")
+        rows, starts, _ = self._select(criteria)
+        if not rows:
+            return {}
+        boundaries = self._period_boundaries(self.backend.minimum(starts), self.backend.maximum(starts), period)
+        counts = self.backend.bucket_counts(boundaries, starts)
+        return {UaDateParser.from_epoch_us(boundary): count for boundary, count in zip(boundaries, counts)}
+
+    @staticmethod
+    def _period_boundaries(first: int, last: int, period: str) -> List[int]:
+        # Epoch-microsecond starts of consecutive periods covering [first, last], plus the end of the last one
+        if period == 'hour':
+            # Kyiv offsets are whole hours, so UTC hours are local hours
+            boundary = first - first % HOUR_US
+            boundaries = [boundary]
+            while boundary <= last:
+                boundary += HOUR_US
+                boundaries.append(boundary)
+            return boundaries
+        kyiv_tz = UaDateParser.kyiv_tz()
+        local = UaDateParser.from_epoch_us(first).replace(tzinfo=None)
+        date = local.date()
+        if period == 'week':
+            date -= datetime.timedelta(days=date.weekday())
+        elif period == 'month':
+            date = date.replace(day=1)
+        boundaries = []
+        while True:
+            boundary = UaDateParser.to_epoch_us(kyiv_tz.localize(datetime.datetime(date.year, date.month, date.day)))
+            boundaries.append(boundary)
+            if boundary > last:
+                return boundaries
+            if period == 'day':
+                date += datetime.timedelta(days=1)
+            elif period == 'week':
+                date += datetime.timedelta(days=7)
+            else:
+                date = (date.replace(day=28) + datetime.timedelta(days=4)).replace(day=1)
+
+    def merged_intervals(self, **criteria) -> List[Tuple[datetime.datetime, datetime.datetime]]:
+        """
+        Return the periods covered by at least one alert matching criteria.
+        Overlapping alerts, such as raion alerts inside an oblast alert, merge into one period.
+        """
+        _, starts, ends = self._select(criteria)
+        merged_starts, merged_ends = self.backend.merge(starts, ends)
+        return [
+            (UaDateParser.from_epoch_us(int(start)), UaDateParser.from_epoch_us(int(end)))
+            for start, end in zip(merged_starts, merged_ends)
+        ]
+
+    def coverage(self, **criteria) -> float:
+        """Return the time covered by at least one alert matching criteria; overlaps count once."""
+        _, starts, ends = self._select(criteria)
+        merged_starts, merged_ends = self.backend.merge(starts, ends)
+        return self.backend.total(self.backend.durations(merged_starts, merged_ends)) / MICROSECONDS
+
+    def coverage_by(self, field: str, **criteria) -> Dict[object, float]:
+        """
+        Return the time under at least one alert per value of a field.
+
+        coverage_by('location_oblast') is the alert time of each oblast with nested raion
+        and hromada alerts counted once.
+        """
+        rows, starts, ends = self._select(criteria)
+        values, codes = self._group(field, rows)
+        backend = self.backend
+        start_parts = backend.split(codes, starts, len(values))
+        end_parts = backend.split(codes, ends, len(values))
+        coverage = {}
+        for value, group_starts, group_ends in zip(values, start_parts, end_parts):
+            if len(group_starts):
+                merged_starts, merged_ends = backend.merge(group_starts, group_ends)
+                coverage[value] = backend.total(backend.durations(merged_starts, merged_ends)) / MICROSECONDS
+        return coverage
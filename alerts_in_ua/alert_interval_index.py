@@ -0,0 +1,199 @@
+import datetime
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+from .alert import Alert
+from .ua_date_parser import UaDateParser, NO_TIME
+
+if TYPE_CHECKING:
+    from .alerts import Alerts
+
+# End of alerts that have not finished yet
+OPEN_END = 2 ** 63 - 1
+
+
+class _IntervalTree:
+    """
+    Static centered interval tree over alert positions.
+
+    Every node keeps the intervals containing its center twice: sorted by start and
+    sorted by end. Intervals entirely before the center go to the left child, those
+    entirely after it to the right child. Endpoints are epoch microseconds and both
+    ends are inclusive.
+    """
+
+    __slots__ = ('centers', 'starts', 'by_start', 'ends', 'by_end', 'left', 'right')
+
+    def __init__(self, positions: Sequence[int], starts: Sequence[int], ends: Sequence[int]):
+        self.centers = []
+        self.starts = []
+        self.by_start = []
+        self.ends = []
+        self.by_end = []
+        self.left = []
+        self.right = []
+        # (positions, parent node, is right child); built with a stack instead of recursion
+        pending = [(list(positions), -1, False)]
+        while pending:
+            node_positions, parent, is_right = pending.pop()
+            if not node_positions:
+                continue
+            node = len(self.centers)
+            if parent >= 0:
+                (self.right if is_right else self.left)[parent] = node
+            # The median endpoint leaves at most half of the intervals on either side
+            endpoints = sorted([starts[i] for i in node_positions] + [ends[i] for i in node_positions])
+            center = endpoints[len(endpoints) // 2]
+            here, before, after = [], [], []
+            for i in node_positions:
+                if ends[i] < center:
+                    before.append(i)
+                elif starts[i] > center:
+                    after.append(i)
+                else:
+                    here.append(i)
+            here.sort(key=starts.__getitem__)
+            self.centers.append(center)
+            self.starts.append(array('q', [starts[i] for i in here]))
+            self.by_start.append(array('q', here))
+            here.sort(key=ends.__getitem__)
+            self.ends.append(array('q', [ends[i] for i in here]))
+            self.by_end.append(array('q', here))
+            self.left.append(-1)
+            self.right.append(-1)
+            pending.append((before, node, False))
+            pending.append((after, node, True))
+
+    def __len__(self) -> int:
+        return sum(len(positions) for positions in self.by_start)
+
+    def stab(self, point: int) -> List[int]:
+        """Return the positions of intervals containing point."""
+        result = []
+        node = 0 if self.centers else -1
+        while node >= 0:
+            center = self.centers[node]
+            if point < center:
+                # All intervals here end after point; those starting by then contain it
+                result.extend(self.by_start[node][:bisect_right(self.starts[node], point)])
+                node = self.left[node]
+            elif point > center:
+                result.extend(self.by_end[node][bisect_left(self.ends[node], point):])
+                node = self.right[node]
+            else:
+                result.extend(self.by_start[node])
+                break
+        return result
+
+    def overlap(self, start: int, end: int) -> List[int]:
+        """Return the positions of intervals sharing at least one point with [start, end]."""
+        result = []
+        pending = [0] if self.centers else []
+        while pending:
+            node = pending.pop()
+            center = self.centers[node]
+            if end < center:
+                result.extend(self.by_start[node][:bisect_right(self.starts[node], end)])
+                children = (self.left[node],)
+            elif start > center:
+                result.extend(self.by_end[node][bisect_left(self.ends[node], start):])
+                children = (self.right[node],)
+            else:
+                result.extend(self.by_start[node])
+                children = (self.left[node], self.right[node])
+            pending.extend(child for child in children if child >= 0)
+        return result
+
+
+class AlertIntervalIndex:
+    """
+    Point-in-time and range queries over the alerts of a history.
+
+    Each alert is the closed interval from started_at to finished_at; alerts that have
+    not finished are open-ended. Queries take O(log n + k) for k matching alerts instead
+    of a scan over the whole history. Alerts without started_at are not indexed.
+
+    Use Alerts.interval_index() to get a cached index for an Alerts object.
+    """
+
+    def __init__(self, alerts: 'Alerts'):
+        """
+        Initialize AlertIntervalIndex.
+
+        Args:
+            alerts (Alerts): The alerts to index, e.g. from get_alerts_history()
+        """
+        self._alerts = alerts
+        starts = alerts._epoch_column('started_at')
+        self._ends = ends = array('q', (OPEN_END if value == NO_TIME else value for value in alerts._epoch_column('finished_at')))
+        positions = [position for position in range(len(starts)) if starts[position] != NO_TIME]
+        self._starts = starts
+        self._tree = _IntervalTree(positions, starts, ends)
+        # Trees over the subsets matched by query criteria, built on first use
+        self._subtrees: Dict[tuple, _IntervalTree] = {}
+
+    def __len__(self) -> int:
+        return len(self._tree)
+
+    def __repr__(self) -> str:
+        return f"AlertIntervalIndex({len(self)} alerts)"
+
+    def _for(self, alerts: 'Alerts') -> 'AlertIntervalIndex':
+        """Return an index sharing these trees that answers with the alerts of a copy of the indexed Alerts."""
+        index = AlertIntervalIndex.__new__(AlertIntervalIndex)
+        index.__dict__.update(self.__dict__)
+        index._alerts = alerts
+        return index
+
+    def _tree_for(self, criteria: Dict) -> _IntervalTree:
+        if not criteria:
+            return self._tree
+        normalized = tuple(sorted(
+            (key, tuple(value) if isinstance(value, (list, tuple, set, frozenset)) else (value,))
+            for key, value in criteria.items()
+        ))
+        tree = self._subtrees.get(normalized)
+        if tree is None:
+            positions = [position for position in self._alerts._matching_positions(list(normalized))
+                         if self._starts[position] != NO_TIME]
+            tree = self._subtrees[normalized] = _IntervalTree(positions, self._starts, self._ends)
+        return tree
+
+    def _alerts_at(self, positions: List[int]) -> List[Alert]:
+        # Positions are sorted so results keep the order of the history
+        positions.sort()
+        return [self._alerts[position] for position in positions]
+
+    def active_at(self, when: datetime.datetime, **criteria) -> List[Alert]:
+        """
+        Return the alerts that were active at a moment.
+
+        Args:
+            when (datetime): The moment; naive datetimes are Kyiv local time
+            **criteria: Restrict to alerts matching Alerts.query() criteria, e.g. location_oblast_uid=31
+
+        Returns:
+            List[Alert]: Alerts with started_at <= when <= finished_at, in history order
+        """
+        return self._alerts_at(self._tree_for(criteria).stab(UaDateParser.kyiv_epoch_us(when)))
+
+    def overlapping(self, start: datetime.datetime, end: Optional[datetime.datetime] = None, **criteria) -> List[Alert]:
+        """
+        Return the alerts that were active at any moment of a period.
+
+        overlapping(alert.started_at, alert.finished_at) finds the alerts overlapping another alert.
+
+        Args:
+            start (datetime): Start of the period; naive datetimes are Kyiv local time
+            end (datetime, optional): End of the period, None for a period that has not ended
+            **criteria: Restrict to alerts matching Alerts.query() criteria, e.g. alert_type='air_raid'
+
+        Returns:
+            List[Alert]: Alerts sharing at least one moment with [start, end], in history order
+        """
+        end_us = OPEN_END if end is None else UaDateParser.kyiv_epoch_us(end)
+        return self._alerts_at(self._tree_for(criteria).overlap(UaDateParser.kyiv_epoch_us(start), end_us))
+
+    def count_active_at(self, when: datetime.datetime, **criteria) -> int:
+        """Return the number of alerts active at a moment without building Alert objects."""
+        return len(self._tree_for(criteria).stab(UaDateParser.kyiv_epoch_us(when)))
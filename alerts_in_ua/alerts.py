@@ -1,22 +1,238 @@
 from .alert import Alert
+from .alert_interval_index import AlertIntervalIndex
+from .alert_analytics import AlertAnalytics, AnalyticsBackend
+import copy
+import weakref
+from array import array
 from typing import Optional, Dict, List, Union
-from .ua_date_parser import UaDateParser
+from .ua_date_parser import UaDateParser, NO_TIME
 import datetime
-import pytz
+
+
+class _AlertList(list):
+    """
+    The materialized alerts of an Alerts object. Changing the list in place invalidates
+    the owner's indexes, the same as assigning a new list to Alerts.alerts.
+    """
+
+    __slots__ = ('_owner',)
+
+    def __init__(self, owner: 'Alerts', alerts):
+        super().__init__(alerts)
+        self._owner = weakref.ref(owner)
+
+    def _changed(self) -> None:
+        owner = self._owner()
+        if owner is not None and owner._alerts is self:
+            owner._replace_records()
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def _invalidating(name: str):
+    method = getattr(list, name)
+
+    def mutate(self, *args, **kwargs):
+        self._changed()
+        return method(self, *args, **kwargs)
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend', 'insert', 'pop', 'remove', 'clear', 'sort', 'reverse'):
+    setattr(_AlertList, _name, _invalidating(_name))
+
 
 class Alerts:
+    # Fields whose Alert attribute equals the raw record value, so they can be filtered without building objects
+    PLAIN_FIELDS = frozenset([
+        'id', 'location_title', 'location_type', 'alert_type', 'location_uid', 'location_oblast',
+        'location_oblast_uid', 'location_raion', 'notes', 'calculated',
+    ])
+    # Fields that get a hash index (value -> positions) the first time they are queried
+    INDEXED_FIELDS = frozenset([
+        'location_uid', 'location_oblast_uid', 'alert_type', 'location_type', 'location_title',
+    ])
+
     def __init__(self, data: Dict):
-        self.alerts = [Alert(alert) for alert in data.get('alerts')]
+        # Raw records are kept and Alert objects are built only when accessed
+        self._records = data.get('alerts')
+        self._count = len(self._records)
+        self._built = [None] * self._count
+        self._alerts = None
+        # True while the alerts are the ones built from the records, so indexes over the records describe them
+        self._from_records = True
+        self._indexes = {}
         meta = data.get('meta')
         self.last_updated_at = UaDateParser.parse_date(meta.get('last_updated_at'),"%Y/%m/%d %H:%M:%S %z")
         self.disclaimer = data.get('disclaimer')
 
+    @property
+    def alerts(self) -> List[Alert]:
+        if self._alerts is None:
+            self._alerts = _AlertList(self, [self._alert_at(i) for i in range(self._count)])
+        return self._alerts
+
+    @alerts.setter
+    def alerts(self, alerts: List[Alert]):
+        self._alerts = alerts
+        self._replace_records()
+
+    def _replace_records(self) -> None:
+        # The alerts no longer match the records, so record-based indexes are dropped and not rebuilt
+        self._from_records = False
+        self._indexes = {}
+
+    def _alert_at(self, index: int) -> Alert:
+        alert = self._built[index]
+        if alert is None:
+            alert = self._built[index] = Alert(self._records[index])
+        return alert
+
+    def _at(self, index: int) -> Alert:
+        """Return the alert at a record position, reusing the materialized list when there is one."""
+        if self._alerts is not None:
+            return self._alerts[index]
+        return self._alert_at(index)
+
+    def _field(self, index: int, key: str):
+        """Return a plain field of the alert at index without building it."""
+        return self._records[index].get(key)
+
+    def _is_finished(self, index: int) -> bool:
+        value = self._records[index].get('finished_at')
+        return value is not None and value != ""
+
+    def _index(self, key: str) -> Dict:
+        """Return the hash index of a field, building it in one pass on first use."""
+        index = self._indexes.get(key)
+        if index is None:
+            index = {}
+            for position in range(self._count):
+                index.setdefault(self._field(position, key), []).append(position)
+            self._indexes[key] = index
+        return index
+
+    def _positions(self, criteria: List[tuple]) -> List[int]:
+        # Intersect index hits first, smallest first, then scan the survivors for the remaining criteria
+        indexed = []
+        scanned = []
+        for key, values in criteria:
+            if key in self.INDEXED_FIELDS:
+                index = self._index(key)
+                hits = []
+                for value in values:
+                    hits.extend(index.get(value, ()))
+                indexed.append(hits)
+            else:
+                scanned.append((key, values))
+        if indexed:
+            indexed.sort(key=len)
+            positions = set(indexed[0])
+            for hits in indexed[1:]:
+                positions.intersection_update(hits)
+            positions = sorted(positions)
+        else:
+            positions = range(self._count)
+        for key, values in scanned:
+            if key == 'finished':
+                positions = [position for position in positions if self._is_finished(position) in values]
+            else:
+                positions = [position for position in positions if self._field(position, key) in values]
+        return list(positions)
+
     def filter(self, *args: str) -> List[Alert]:
+        # Indexes describe the original records, so they are used until the alerts list is replaced
+        if self._from_records and all(args[i] in self.PLAIN_FIELDS for i in range(0, len(args), 2)):
+            criteria = [(args[i], (args[i + 1],)) for i in range(0, len(args), 2)]
+            return [self._at(position) for position in self._positions(criteria)]
+
         filtered_alerts = self.alerts
         for i in range(0, len(args), 2):
             filtered_alerts = [alert for alert in filtered_alerts if getattr(alert, args[i]) == args[i + 1]]
         return filtered_alerts
 
+    def query(self, **criteria) -> List[Alert]:
+        """
+        Return alerts matching all criteria, e.g. query(location_oblast_uid=9, alert_type='air_raid', finished=False).
+        A list, tuple or set value matches any of its items. The finished keyword filters on is_finished().
+        """
+        criteria = [
+            (key, tuple(value) if isinstance(value, (list, tuple, set, frozenset)) else (value,))
+            for key, value in criteria.items()
+        ]
+        return [self[position] for position in self._matching_positions(criteria)]
+
+    def _matching_positions(self, criteria: List[tuple]) -> List[int]:
+        """Return the positions of alerts matching (key, values) criteria, using the indexes when possible."""
+        if self._from_records and all(key in self.PLAIN_FIELDS or key == 'finished' for key, _ in criteria):
+            return self._positions(criteria)
+        return [
+            position for position, alert in enumerate(self.alerts)
+            if all((alert.is_finished() if key == 'finished' else getattr(alert, key)) in values for key, values in criteria)
+        ]
+
+    def epoch_column(self, field: str) -> array:
+        """
+        Return a timestamp field of all alerts as epoch microseconds.
+        Missing values (e.g. unfinished alerts) are stored as NO_TIME.
+        The array is the caller's own, so changing it never affects these alerts.
+        """
+        return self._epoch_column(field)
+
+    def _epoch_column(self, field: str) -> array:
+        # Internal readers only: subclasses may return a buffer shared with copies, which must not be changed
+        if self._from_records:
+            return UaDateParser.parse_epoch_column([self._field(position, field) for position in range(self._count)])
+        dates = [getattr(alert, field) for alert in self._alerts]
+        return array('q', [NO_TIME if date is None else UaDateParser.to_epoch_us(date) for date in dates])
+
+    def _group_codes(self, field: str):
+        """Dictionary-encode a field: return its distinct values and the value code of every alert."""
+        if self._from_records:
+            column = (self._field(position, field) for position in range(self._count))
+        else:
+            column = (getattr(alert, field) for alert in self._alerts)
+        lookup = {}
+        codes = array('q', [lookup.setdefault(value, len(lookup)) for value in column])
+        return list(lookup), codes
+
+    def interval_index(self) -> AlertIntervalIndex:
+        """
+        Return an index for "which alerts were active at / during" queries, built on first use.
+
+        Returns:
+            AlertIntervalIndex: Answers active_at(when) and overlapping(start, end) in logarithmic time
+        """
+        # Cached with the field indexes, so replacing the alerts drops it too
+        index = self._indexes.get(AlertIntervalIndex)
+        if index is None:
+            index = self._indexes[AlertIntervalIndex] = AlertIntervalIndex(self)
+        return index
+
+    def analytics(self, until: Optional[datetime.datetime] = None, backend: Optional[AnalyticsBackend] = None) -> AlertAnalytics:
+        """
+        Return duration, count and coverage statistics over these alerts.
+
+        Args:
+            until (datetime, optional): End of unfinished alerts, last_updated_at by default
+            backend (AnalyticsBackend, optional): Column backend, NumPy when installed by default
+
+        Returns:
+            AlertAnalytics: Extracts the timestamp columns once; reuse it for several statistics
+        """
+        return AlertAnalytics(self, until=until, backend=backend)
+
+    def group_by(self, key: str) -> Dict[object, List[Alert]]:
+        """Partition all alerts by the value of a field in a single pass."""
+        if self._from_records and key in self.PLAIN_FIELDS:
+            return {value: [self._at(position) for position in positions] for value, positions in self._index(key).items()}
+        groups = {}
+        for alert in self.alerts:
+            groups.setdefault(getattr(alert, key), []).append(alert)
+        return groups
+
     def get_oblast_alerts(self) -> List[Alert]:
         return self.get_alerts_by_alert_type('oblast')
 
@@ -72,10 +288,49 @@ class Alerts:
         return self.disclaimer
 
     def __iter__(self) -> List[Alert]:
-        return iter(self.alerts)
+        if self._alerts is not None:
+            return iter(self._alerts)
+        return (self._alert_at(i) for i in range(self._count))
+
+    def __getitem__(self, index):
+        if self._alerts is not None:
+            return self._alerts[index]
+        if isinstance(index, slice):
+            return [self._alert_at(i) for i in range(self._count)[index]]
+        return self._alert_at(range(self._count)[index])
 
     def __repr__(self) -> str:
-        return str(self.alerts)
+        return str(list(self))
 
     def __len__(self) -> int:
-        return len(self.alerts)
\ No newline at end of file
+        if self._alerts is not None:
+            return len(self._alerts)
+        return self._count
+
+    def __eq__(self, other) -> bool:
+        # Compares the alerts only, so a refreshed meta.last_updated_at alone is not a change
+        if not isinstance(other, Alerts):
+            return NotImplemented
+        if self._alerts is None and other._alerts is None and type(self) is type(other):
+            return self._source() == other._source()
+        # Alert compares by value, so materialized, copied and columnar alerts compare equal to their records
+        return len(self) == len(other) and list(self) == list(other)
+
+    def _source(self):
+        """Return the underlying data, shared by copies and compared by __eq__."""
+        return self._records
+
+    def __copy__(self) -> 'Alerts':
+        # Shares the read-only records and indexes but never Alert objects, so edits stay within the copy
+        clone = type(self).__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone._indexes = dict(self._indexes)
+        interval_index = self._indexes.get(AlertIntervalIndex)
+        if interval_index is not None:
+            clone._indexes[AlertIntervalIndex] = interval_index._for(clone)
+        if '_built' in self.__dict__:
+            clone._built = [None] * self._count
+        if self._alerts is not None:
+            alerts = [copy.copy(alert) for alert in self._alerts]
+            clone._alerts = _AlertList(clone, alerts) if self._from_records else alerts
+        return clone
\ No newline at end of file
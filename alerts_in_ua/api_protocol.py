@@ -0,0 +1,301 @@
+import copy
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Union
+from .errors import UnauthorizedError, RateLimitError, InternalServerError, ServerError, ForbiddenError, ApiError, InvalidParameterException
+from .alerts import Alerts
+from .columnar_alerts import ColumnarAlerts
+from .user_agent import UserAgent
+from .air_raid_alert_oblast_statuses import AirRaidAlertOblastStatuses
+from .air_raid_alert_oblast_status import AirRaidAlertOblastStatus
+from .air_raid_alert_statuses import AirRaidAlertStatuses
+from .air_raid_alert_status_vector import AirRaidAlertStatusVector
+from .air_raid_alert_status_snapshot import AirRaidAlertStatusSnapshot
+from .air_raid_alert_status_resolver import AirRaidAlertStatusResolver
+from .location_uid_resolver import LocationUidResolver
+from .response_cache import ResponseCache, MemoryResponseCache
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
+from .json_codec import JsonCodec, default_codec
+from .instrumentation import Instrumentation, RequestEvent, current_request_event
+from .transport import TransportResponse
+
+
+class ApiCall:
+    """
+    An endpoint together with the function that builds the returned model from its decoded data.
+    Calls with a model_key have their model memoized in the response cache entry. Without
+    keep_data the decoded data is released once that model is built, for models that hold
+    a compact copy of it.
+    """
+
+    __slots__ = ('endpoint', 'build', 'model_key', 'keep_data')
+
+    def __init__(self, endpoint: str, build: Callable[[Any], Any], model_key: Optional[Hashable] = None, keep_data: bool = True):
+        self.endpoint = endpoint
+        self.build = build
+        self.model_key = model_key
+        self.keep_data = keep_data
+
+    def __repr__(self) -> str:
+        return f"ApiCall({self.endpoint!r})"
+
+
+class ApiRequest:
+    """
+    One request between ApiProtocol.prepare() and ApiProtocol.handle_response().
+
+    When the cached entry is still fresh, `fresh` is True and `cached_data` is the answer;
+    nothing has to be sent.
+    """
+
+    __slots__ = ('endpoint', 'url', 'headers', 'cached_data', 'event', 'fresh', 'use_cache')
+
+    def __init__(self, endpoint: str, url: str, headers: Dict[str, str], cached_data: Optional[Dict] = None,
+                 event: Optional[RequestEvent] = None, use_cache: bool = True):
+        self.endpoint = endpoint
+        self.url = url
+        self.headers = headers
+        self.cached_data = cached_data
+        self.event = event
+        self.fresh = False
+        self.use_cache = use_cache
+
+
+class ApiProtocol:
+    """
+    Transport-agnostic request and response logic shared by Client and AsyncClient.
+
+    The protocol never performs I/O. A client asks it to prepare a request, sends the
+    request with its transport, and hands the response back. Conditional headers,
+    cache updates, retry decisions, status-to-exception mapping, model building and
+    instrumentation all live here, so they behave the same on every client and transport.
+
+    Built models are memoized in the response cache entry they were built from, so an
+    unchanged response (fresh hit or 304) skips parsing and the model is dropped
+    together with its entry. Callers always receive their own copy.
+    """
+
+    API_BASE_URL = "https://api.alerts.in.ua"
+
+    def __init__(self, token: str, cache: ResponseCache = None, codec: JsonCodec = None, rate_limiter: RateLimiter = None,
+                 retry_policy: RetryPolicy = None, instrumentation: Instrumentation = None, base_url: str = API_BASE_URL + "/v1/"):
+        """
+        Args:
+            token (str): The API token
+            cache (ResponseCache, optional): Response cache, an in-memory cache by default
+            codec (JsonCodec, optional): JSON codec, the fastest available by default
+            rate_limiter (RateLimiter, optional): Paused when the API answers 429 with Retry-After
+            retry_policy (RetryPolicy, optional): Decides which failures are retried and when
+            instrumentation (Instrumentation, optional): Listeners for request events
+            base_url (str): The API root all endpoints are relative to
+        """
+        self.base_url = base_url
+        self.headers = {
+            "Accept": "application/json",
+            "Authorization": f"Bearer {token}",
+            "User-Agent": UserAgent.get_user_agent(token)
+        }
+        self.cache = cache if cache is not None else MemoryResponseCache()
+        self.codec = codec if codec is not None else default_codec()
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.instrumentation = instrumentation if instrumentation is not None else Instrumentation()
+        self.location_uid_resolver = LocationUidResolver()
+
+    # Requests and responses
+
+    def prepare(self, endpoint: str, use_cache=True, model_key: Optional[Hashable] = None) -> ApiRequest:
+        """
+        Build the request for an endpoint, answering it from the cache when the entry is fresh.
+
+        Args:
+            endpoint (str): The endpoint relative to base_url
+            use_cache (bool): Use and update the response cache and send a conditional request
+            model_key (Hashable, optional): The memoized model the caller needs from the entry
+
+        Returns:
+            ApiRequest: The request to send, or a fresh answer
+        """
+        event = current_request_event.get()
+        request = ApiRequest(endpoint, self.base_url + endpoint, dict(self.headers), event=event, use_cache=use_cache)
+        cached_data = self.cache.get(endpoint) if use_cache else None
+        if cached_data is not None and cached_data["Data"] is None and model_key not in cached_data.get("Models", ()):
+            # The data was released after building another model, so this one needs a full download
+            cached_data = None
+        if cached_data is not None:
+            if self.cache.is_fresh(cached_data):
+                self.cache.stats.hits += 1
+                if event is not None:
+                    event.cache_outcome = RequestEvent.FRESH
+                request.fresh = True
+                request.cached_data = cached_data
+                return request
+            # Conditional request: a 304 returns cached data, a 200 is consumed directly
+            request.headers["If-Modified-Since"] = cached_data["Last-Modified"]
+            request.cached_data = cached_data
+        return request
+
+    def start_attempt(self, request: ApiRequest) -> None:
+        if request.event is not None:
+            request.event.attempts += 1
+
+    def error_retry_delay(self, attempt: int) -> Optional[float]:
+        """Return the delay before retrying a timeout or connection error, None to give up."""
+        if self.retry_policy is None or not self.retry_policy.should_retry_timeout(attempt):
+            return None
+        return self.retry_policy.delay(attempt)
+
+    def retry_delay(self, request: ApiRequest, response: TransportResponse, attempt: int) -> Optional[float]:
+        """
+        Inspect a response and return the delay before retrying it, None if it is final.
+        A 429 with Retry-After also pauses the rate limiter.
+        """
+        status = response.status
+        if request.event is not None:
+            request.event.status = status
+            request.event.rate_limited += status == 429
+        retry_after = response.headers.get("Retry-After")
+        if status == 429 and retry_after and self.rate_limiter is not None:
+            self.rate_limiter.pause(RetryPolicy.parse_retry_after(retry_after) or 0)
+        if self.retry_policy is None or not self.retry_policy.should_retry_status(status, attempt):
+            return None
+        return self.retry_policy.delay(attempt, retry_after)
+
+    def handle_response(self, request: ApiRequest, response: TransportResponse) -> Dict:
+        """
+        Return the cache entry for a final response, updating the cache, or raise the matching ApiError.
+        The entry's "Data" is the decoded payload; responses that are not cached get a bare {"Data": data}.
+        """
+        event = request.event
+        cached_data = request.cached_data
+        if response.status == 304 and cached_data is not None:
+            self.cache.stats.not_modified += 1
+            self.cache.revalidated(request.endpoint, cached_data)
+            if event is not None:
+                event.cache_outcome = RequestEvent.NOT_MODIFIED
+            return cached_data
+
+        if response.status != 200:
+            self.raise_error(response.status, response.body)
+        body = response.body
+        if event is None:
+            data = self.codec.loads(body)
+        else:
+            started = time.perf_counter()
+            data = self.codec.loads(body)
+            event.parse_time = time.perf_counter() - started
+            event.body_bytes = len(body)
+            event.cache_outcome = RequestEvent.MISS
+        self.cache.stats.misses += 1
+        last_modified = response.headers.get("Last-Modified")
+        if last_modified is not None and request.use_cache:
+            entry = self.cache.store(request.endpoint, data, last_modified, size=len(body), body=body)
+            if entry is not None:
+                return entry
+        return {"Data": data}
+
+    def raise_error(self, status: int, body: bytes):
+        message = None
+        try:
+            data = self.codec.loads(body)
+            json_message = data.get("message")
+            message = f"{json_message} HTTP Code:{status}"
+        except:
+            pass
+        if status == 401:
+            if message is None:
+                message = "Unauthorized: Incorrect token"
+            raise UnauthorizedError(message)
+        elif status == 403:
+            if message is None:
+                message = "Forbidden. API may not be available in some regions. Please ask api@alerts.in.ua for details."
+            raise ForbiddenError(message)
+        elif status == 429:
+            if message is None:
+                message = "Too many requests: Rate limit exceeded"
+            raise RateLimitError(message)
+        elif status == 500:
+            raise InternalServerError("Internal server error")
+        elif 500 < status < 600:
+            raise ServerError(f"Server error. HTTP Code:{status}")
+        else:
+            raise ApiError(f"Unknown error. HTTP Code:{status}")
+
+    def build(self, call: ApiCall, entry: Dict, event: Optional[RequestEvent]):
+        """Build the model of a call from a cache entry, timing it when the call is instrumented."""
+        if event is None:
+            return self._model(call, entry)
+        started = time.perf_counter()
+        model = self._model(call, entry)
+        event.build_time = time.perf_counter() - started
+        return model
+
+    def _model(self, call: ApiCall, entry: Dict):
+        models = entry.get("Models")
+        if call.model_key is None or models is None:
+            return call.build(entry["Data"])
+        model = models.get(call.model_key)
+        if model is None:
+            model = models[call.model_key] = call.build(entry["Data"])
+            if not call.keep_data:
+                self.cache.release_data(call.endpoint, entry)
+        # Callers get their own copy, so changing it never affects the memoized model
+        return copy.copy(model)
+
+    # Endpoints and models
+
+    def resolve_oblast_uid(self, oblast_uid_or_location_title: Union[int, str]):
+        if isinstance(oblast_uid_or_location_title, str):
+            if oblast_uid_or_location_title.isdigit():
+                return int(oblast_uid_or_location_title)
+            oblast_uid = self.location_uid_resolver.registry.uid(oblast_uid_or_location_title)
+            if oblast_uid is None:
+                # Fail locally instead of sending "Unknown UID" to the API
+                raise InvalidParameterException(f"Unknown location: {oblast_uid_or_location_title}")
+            return oblast_uid
+        return oblast_uid_or_location_title
+
+    def alerts_history_endpoint(self, oblast_uid_or_location_title: Union[int, str], period: str) -> str:
+        return f"regions/{self.resolve_oblast_uid(oblast_uid_or_location_title)}/alerts/{period}.json"
+
+    def active_alerts(self) -> ApiCall:
+        return ApiCall("alerts/active.json", Alerts, model_key="alerts")
+
+    def alerts_history(self, oblast_uid_or_location_title: Union[int, str], period: str, columnar: bool = False) -> ApiCall:
+        # Columnar storage trades object access speed for a much smaller footprint on long histories
+        if columnar:
+            return ApiCall(self.alerts_history_endpoint(oblast_uid_or_location_title, period), ColumnarAlerts, model_key="columnar", keep_data=False)
+        return ApiCall(self.alerts_history_endpoint(oblast_uid_or_location_title, period), Alerts, model_key="alerts")
+
+    def air_raid_alert_status(self, oblast_uid_or_location_title: Union[int, str], oblast_level_only=False) -> ApiCall:
+        oblast_uid = self.resolve_oblast_uid(oblast_uid_or_location_title)
+        return ApiCall(
+            f"iot/active_air_raid_alerts/{oblast_uid}.json",
+            lambda data: AirRaidAlertOblastStatus(location_title=self.location_uid_resolver.resolve_location_title(oblast_uid), status=data, oblast_level_only=oblast_level_only),
+        )
+
+    def air_raid_alert_statuses_by_oblast(self, oblast_level_only=False) -> ApiCall:
+        return ApiCall(
+            "iot/active_air_raid_alerts_by_oblast.json",
+            lambda data: AirRaidAlertOblastStatuses(data, oblast_level_only=oblast_level_only),
+            model_key=("oblast_statuses", oblast_level_only),
+        )
+
+    def air_raid_alert_statuses(self) -> ApiCall:
+        return ApiCall("iot/active_air_raid_alerts.json", self._build_air_raid_alert_statuses, model_key="statuses")
+
+    def air_raid_alert_status_vector(self) -> ApiCall:
+        return ApiCall("iot/active_air_raid_alerts.json", self._build_air_raid_alert_status_vector, model_key="vector")
+
+    def air_raid_alert_status_snapshot(self) -> ApiCall:
+        return ApiCall("iot/active_air_raid_alerts.json", self._build_air_raid_alert_status_snapshot, model_key="snapshot")
+
+    def _build_air_raid_alert_statuses(self, data) -> AirRaidAlertStatuses:
+        return self._build_air_raid_alert_status_vector(data).to_statuses(self.location_uid_resolver.uid_to_location)
+
+    def _build_air_raid_alert_status_vector(self, data) -> AirRaidAlertStatusVector:
+        status_string = data if isinstance(data, str) else str(data)
+        return AirRaidAlertStatusResolver.resolve_status_vector(status_string)
+
+    def _build_air_raid_alert_status_snapshot(self, data) -> AirRaidAlertStatusSnapshot:
+        return AirRaidAlertStatusSnapshot(self._build_air_raid_alert_status_vector(data), self.location_uid_resolver.registry)
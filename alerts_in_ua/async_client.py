@@ -1,138 +1,255 @@
-import aiohttp
-from .errors import UnauthorizedError, RateLimitError, InternalServerError, ForbiddenError, ApiError,InvalidParameterException
+import asyncio
 from .alert import Alert
 from .alerts import Alerts
-from .user_agent import UserAgent
 from .air_raid_alert_oblast_statuses import AirRaidAlertOblastStatuses
 from .air_raid_alert_oblast_status import AirRaidAlertOblastStatus
-from .air_raid_alert_status import AirRaidAlertStatus
 from .air_raid_alert_statuses import AirRaidAlertStatuses
-from typing import List, Dict, Union
-from .location_uid_resolver import LocationUidResolver
-from .air_raid_alert_status_resolver import AirRaidAlertStatusResolver
+from .air_raid_alert_status_vector import AirRaidAlertStatusVector
+from .air_raid_alert_status_snapshot import AirRaidAlertStatusSnapshot
+from typing import AsyncIterator, Callable, List, Dict, Iterable, Union
+from .api_protocol import ApiProtocol, ApiCall, ApiRequest
+from .transport import AsyncTransport, TransportResponse
+from .async_single_flight import AsyncSingleFlight
+from .response_cache import ResponseCache
+from .async_watcher import AsyncWatcher
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
+from .batch_result import BatchResult
+from .streaming_alerts_parser import StreamingAlertsParser
+from .json_codec import JsonCodec
+from .instrumentation import Instrumentation, RequestEvent
+
 class AsyncClient:
     REQUEST_TIMEOUT = 5
-    API_BASE_URL = "https://api.alerts.in.ua"
+    API_BASE_URL = ApiProtocol.API_BASE_URL
+    CONNECTION_LIMIT = 100
+    CONNECTION_LIMIT_PER_HOST = 0
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 30
+    BATCH_CONCURRENCY = 8
+    STREAM_CHUNK_SIZE = 65536
 
-    def __init__(self, token: str):
+    def __init__(self, token: str, limit: int = CONNECTION_LIMIT, limit_per_host: int = CONNECTION_LIMIT_PER_HOST,
+                 ttl_dns_cache: int = DNS_CACHE_TTL, keepalive_timeout: float = KEEPALIVE_TIMEOUT,
+                 cache: ResponseCache = None, rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None,
+                 codec: JsonCodec = None, listeners: List[Callable[[RequestEvent], None]] = None, transport: AsyncTransport = None):
         self.token = token
-        self.base_url = "/v1/"
-        self.location_uid_resolver = LocationUidResolver()
+        self.protocol = ApiProtocol(token, cache=cache, codec=codec, rate_limiter=rate_limiter, retry_policy=retry_policy,
+                                    instrumentation=Instrumentation(listeners), base_url=self.API_BASE_URL + "/v1/")
+        if transport is None:
+            # Imported here so that clients with another transport never load aiohttp
+            from .aiohttp_transport import AiohttpTransport
+            transport = AiohttpTransport(limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=ttl_dns_cache,
+                                         keepalive_timeout=keepalive_timeout, timeout=AsyncClient.REQUEST_TIMEOUT,
+                                         instrumentation=self.protocol.instrumentation)
+        self.transport = transport
+        # Shortcuts to the state owned by the protocol
+        self.headers = self.protocol.headers
+        self.cache = self.protocol.cache
+        self.codec = self.protocol.codec
+        self.rate_limiter = self.protocol.rate_limiter
+        self.retry_policy = self.protocol.retry_policy
+        self.instrumentation = self.protocol.instrumentation
+        self.location_uid_resolver = self.protocol.location_uid_resolver
+        self.single_flight = AsyncSingleFlight()
+
+    @property
+    def base_url(self) -> str:
+        return self.protocol.base_url
+
+    @base_url.setter
+    def base_url(self, base_url: str):
+        self.protocol.base_url = base_url
+
+    @property
+    def session(self):
+        # The HTTP library session of the transport, for transports that have one
+        return getattr(self.transport, "session", None)
+
+    async def close(self):
+        await self.transport.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    def add_listener(self, listener: Callable[[RequestEvent], None]) -> Callable[[], None]:
+        """
+        Receive a RequestEvent after every call. Returns a function that removes the listener.
+        DNS and connect timings need the listener to be registered before the first request.
+        """
+        return self.instrumentation.subscribe(listener)
 
-        self.headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {self.token}",
-            "User-Agent": UserAgent.get_user_agent(self.token)
-        }
-        self.cache = {}
+    async def _get(self, call: ApiCall, use_cache=True):
+        # Request the endpoint and build the model, timing both when someone listens
+        if not self.instrumentation:
+            return self.protocol.build(call, await self._request_entry(call, use_cache=use_cache), None)
+        event, token = self.instrumentation.start(call.endpoint)
+        try:
+            return self.protocol.build(call, await self._request_entry(call, use_cache=use_cache), event)
+        except Exception as error:
+            event.error = error
+            raise
+        finally:
+            self.instrumentation.finish(event, token)
 
     async def _request(self, endpoint: str, use_cache=True):
-        async with aiohttp.ClientSession(AsyncClient.API_BASE_URL) as session:
-            # Check if endpoint is in cache and return cached data if not modified
-            if endpoint in self.cache and use_cache == True:
-                cached_data = self.cache[endpoint]
-                headers = {
-                    **self.headers,
-                    **{"If-Modified-Since": cached_data["Last-Modified"]},
-                }
-                response = await session.get(
-                    self.base_url + endpoint,
-                    headers=headers,
-                    timeout=AsyncClient.REQUEST_TIMEOUT,
-                )
-                if response.status == 304:
-                    return cached_data["Data"]
-
-            # Make the request
-            response = await session.get(
-                self.base_url + endpoint,
-                headers=self.headers,
-                timeout=AsyncClient.REQUEST_TIMEOUT,
-            )
-
-            # Check if response is successful
-            if response.status == 200:
-                data = await response.json()
-                self.cache[endpoint] = {
-                    "Data": data,
-                    "Last-Modified": response.headers["Last-Modified"],
-                }
-                return data
-            else:
-                message = None
-                try:
-                    data = await response.json()
-                    json_message = data.get("message")
-                    message = f"{json_message} HTTP Code:{response.status}"
-                except:
-                    pass
-                if response.status == 401:
-                    if message is None:
-                        message = "Unauthorized: Incorrect token"
-                    raise UnauthorizedError(message)
-                elif response.status == 403:
-                    if message is None:
-                        message = "Forbidden. API may not be available in some regions. Please ask api@alerts.in.ua for details."
-                    raise ForbiddenError(message)
-                elif response.status == 429:
-                    if message is None:
-                        message = "Too many requests: Rate limit exceeded"
-                    raise RateLimitError(message)
-                elif response.status == 500:
-                    raise InternalServerError("Internal server error")
-                else:
-                    raise ApiError(f"Unknown error. HTTP Code:{response.status}")
+        # The decoded data alone, for callers that build nothing from it
+        return (await self._request_entry(ApiCall(endpoint, None), use_cache=use_cache))["Data"]
+
+    async def _request_entry(self, call: ApiCall, use_cache=True):
+        # Concurrent calls for the same endpoint and model share one upstream request
+        return await self.single_flight.do((call.endpoint, call.model_key, use_cache), self._fetch, call, use_cache)
+
+    async def _fetch(self, call: ApiCall, use_cache=True):
+        request = self.protocol.prepare(call.endpoint, use_cache=use_cache, model_key=call.model_key)
+        if request.fresh:
+            return request.cached_data
+        return self.protocol.handle_response(request, await self._send(request))
+
+    async def _send(self, request: ApiRequest, stream: bool = False) -> TransportResponse:
+        # Applies the rate limiter and retries 429/5xx/timeouts according to the retry policy
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            self.protocol.start_attempt(request)
+            try:
+                response = await self.transport.send(request.url, request.headers, stream=stream, event=request.event)
+            except self.transport.transient_errors:
+                delay = self.protocol.error_retry_delay(attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+
+            delay = self.protocol.retry_delay(request, response, attempt)
+            if delay is None:
+                return response
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
 
     async def get_active_alerts(self, use_cache=True) -> Alerts:
-        data = await self._request("alerts/active.json", use_cache=use_cache)
-        return Alerts(data)
-
-    async def get_alerts_history(self, oblast_uid_or_location_title: Union[int, str], period: str = 'month_ago', use_cache: bool = True) -> Alerts:
-        if isinstance(oblast_uid_or_location_title, str):
-           if oblast_uid_or_location_title.isdigit():
-              oblast_uid = int(oblast_uid_or_location_title)
-           else:
-              oblast_uid = self.location_uid_resolver.resolve_uid(oblast_uid_or_location_title)
-        else:
-            oblast_uid = oblast_uid_or_location_title
-        url = f"regions/{oblast_uid}/alerts/{period}.json"
-        data = await self._request(url, use_cache=use_cache)
-        return Alerts(data)
+        return await self._get(self.protocol.active_alerts(), use_cache=use_cache)
 
+    async def get_alerts_history(self, oblast_uid_or_location_title: Union[int, str], period: str = 'month_ago', use_cache: bool = True, columnar: bool = False) -> Alerts:
+        return await self._get(self.protocol.alerts_history(oblast_uid_or_location_title, period, columnar=columnar), use_cache=use_cache)
 
     async def get_air_raid_alert_status(self, oblast_uid_or_location_title: Union[int, str], oblast_level_only=False, use_cache=True) -> AirRaidAlertOblastStatus:
-        if isinstance(oblast_uid_or_location_title, str):
-           if oblast_uid_or_location_title.isdigit():
-              oblast_uid = int(oblast_uid_or_location_title)
-           else:
-              oblast_uid = self.location_uid_resolver.resolve_uid(oblast_uid_or_location_title)
-        else:
-            oblast_uid = oblast_uid_or_location_title
-        data = await self._request(f"iot/active_air_raid_alerts/{oblast_uid}.json", use_cache=use_cache)
-        return AirRaidAlertOblastStatus(location_title = self.location_uid_resolver.resolve_location_title(oblast_uid),status=data,oblast_level_only=oblast_level_only)
+        return await self._get(self.protocol.air_raid_alert_status(oblast_uid_or_location_title, oblast_level_only=oblast_level_only), use_cache=use_cache)
+
+    async def iter_alerts_history(self, oblast_uid_or_location_title: Union[int, str], period: str = 'month_ago', raw: bool = False,
+                                  chunk_size: int = STREAM_CHUNK_SIZE) -> AsyncIterator[Union[Alert, Dict]]:
+        """
+        Stream the alerts of a history response as they are downloaded (async generator).
+
+        The body is read in chunks and parsed incrementally, so memory stays bounded
+        regardless of the history window and processing starts before the download
+        finishes. Streaming bypasses the response cache.
+
+        Args:
+            oblast_uid_or_location_title: The oblast UID or location title
+            period (str): The history period, e.g. 'week_ago' or 'month_ago'
+            raw (bool): Yield raw record dictionaries instead of Alert objects
+            chunk_size (int): Bytes read from the connection at a time
+        """
+        endpoint = self.protocol.alerts_history_endpoint(oblast_uid_or_location_title, period)
+        response = await self._send(self.protocol.prepare(endpoint, use_cache=False), stream=True)
+        try:
+            if response.status != 200:
+                self.protocol.raise_error(response.status, b"".join([chunk async for chunk in response.iter_chunks(chunk_size)]))
+            parser = StreamingAlertsParser()
+            async for chunk in response.iter_chunks(chunk_size):
+                for record in parser.feed(chunk):
+                    yield record if raw else Alert(record)
+            for record in parser.close():
+                yield record if raw else Alert(record)
+        finally:
+            await response.aclose()
+
+    async def _run_many(self, keys: Iterable, call, concurrency: int) -> BatchResult:
+        keys = list(dict.fromkeys(keys))
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def run(key):
+            async with semaphore:
+                return await call(key)
+
+        outcomes = await asyncio.gather(*[run(key) for key in keys], return_exceptions=True)
+        results = {}
+        errors = {}
+        for key, outcome in zip(keys, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                raise outcome
+            if isinstance(outcome, Exception):
+                errors[key] = outcome
+            else:
+                results[key] = outcome
+        return BatchResult(results, errors)
+
+    async def get_alerts_history_many(self, oblast_uids_or_location_titles: Iterable[Union[int, str]], period: str = 'month_ago', use_cache: bool = True,
+                                      columnar: bool = False, concurrency: int = BATCH_CONCURRENCY) -> BatchResult:
+        """Fetch the history of several locations with bounded concurrency, keyed by the given UID or title."""
+        return await self._run_many(
+            oblast_uids_or_location_titles,
+            lambda key: self.get_alerts_history(key, period=period, use_cache=use_cache, columnar=columnar),
+            concurrency,
+        )
+
+    async def get_air_raid_alert_status_many(self, oblast_uids_or_location_titles: Iterable[Union[int, str]], oblast_level_only=False, use_cache=True,
+                                             concurrency: int = BATCH_CONCURRENCY) -> BatchResult:
+        """Fetch the status of several locations with bounded concurrency, keyed by the given UID or title."""
+        return await self._run_many(
+            oblast_uids_or_location_titles,
+            lambda key: self.get_air_raid_alert_status(key, oblast_level_only=oblast_level_only, use_cache=use_cache),
+            concurrency,
+        )
 
     async def get_air_raid_alert_statuses_by_oblast(self, oblast_level_only=False, use_cache=True) -> AirRaidAlertOblastStatuses:
-        data = await self._request("iot/active_air_raid_alerts_by_oblast.json", use_cache=use_cache)
-        return AirRaidAlertOblastStatuses(data,oblast_level_only=oblast_level_only)
+        return await self._get(self.protocol.air_raid_alert_statuses_by_oblast(oblast_level_only=oblast_level_only), use_cache=use_cache)
 
     async def get_air_raid_alert_statuses(self, use_cache=True) -> AirRaidAlertStatuses:
+        return await self._get(self.protocol.air_raid_alert_statuses(), use_cache=use_cache)
+
+    async def get_air_raid_alert_status_vector(self, use_cache=True) -> AirRaidAlertStatusVector:
+        return await self._get(self.protocol.air_raid_alert_status_vector(), use_cache=use_cache)
+
+    async def get_air_raid_alert_status_snapshot(self, use_cache=True) -> AirRaidAlertStatusSnapshot:
+        """
+        Fetch the full-country status string once and answer per-location queries from it.
+
+        Args:
+            use_cache (bool): Send a conditional request and reuse the cached snapshot if unchanged
+
+        Returns:
+            AirRaidAlertStatusSnapshot: Statuses of every oblast, raion and city in memory
+        """
+        return await self._get(self.protocol.air_raid_alert_status_snapshot(), use_cache=use_cache)
+
+    def watch(self, method: str = "get_active_alerts", *args, min_interval: float = AsyncWatcher.MIN_INTERVAL,
+              max_interval: float = AsyncWatcher.MAX_INTERVAL, backoff: float = AsyncWatcher.BACKOFF, **kwargs) -> AsyncWatcher:
+        """
+        Watch a getter of this client and receive an event whenever its result changes.
+
+        Args:
+            method (str): Name of the getter, e.g. 'get_active_alerts' or 'get_air_raid_alert_statuses'
+            *args, **kwargs: Arguments passed to the getter on every poll
+            min_interval (float): Seconds between polls while data is changing
+            max_interval (float): Upper bound for the interval during 304 streaks and rate limiting
+            backoff (float): Interval multiplier after an unchanged poll
 
-        data = await self._request("iot/active_air_raid_alerts.json", use_cache=use_cache)
-        
-        status_string = data if isinstance(data, str) else str(data)
-        
-        resolved_statuses = AirRaidAlertStatusResolver.resolve_status_string(
-            status_string, 
-            self.location_uid_resolver.uid_to_location
+        Returns:
+            AsyncWatcher: An async iterator of WatchEvent objects
+        """
+        getter = getattr(self, method)
+        return AsyncWatcher(
+            lambda: getter(*args, **kwargs),
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            transient_errors=self.transport.transient_errors,
         )
-        
-        statuses = []
-        for resolved_status in resolved_statuses:
-            air_raid_status = AirRaidAlertStatus(
-                location_title=resolved_status['location_title'],
-                status=resolved_status['status'],
-                uid=resolved_status['uid']
-            )
-            statuses.append(air_raid_status)
-                
-        return AirRaidAlertStatuses(statuses)
\ No newline at end of file
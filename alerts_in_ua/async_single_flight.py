@@ -0,0 +1,59 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+# Handed to followers when the leading caller is cancelled, so they retry instead of seeing CancelledError
+_LEADER_CANCELLED = object()
+
+
+class AsyncSingleFlight:
+    """
+    Coalesces concurrent coroutine calls that share a key into a single execution.
+    Coroutines arriving while a call for the same key is in flight await it
+    and receive its result or exception instead of running their own.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        Await fn(*args, **kwargs) unless a call for key is already in flight.
+
+        Args:
+            key (Hashable): Identifies equivalent calls (e.g. the endpoint)
+            fn (Callable): The coroutine function to execute
+
+        Returns:
+            Any: The result shared by all callers for this key
+        """
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            # Shield so that one cancelled follower does not cancel the shared call
+            result = await asyncio.shield(future)
+            if result is not _LEADER_CANCELLED:
+                return result
+            # The leader's caller was cancelled, not ours: run the call again (the first follower leads)
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        try:
+            result = await fn(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.set_result(_LEADER_CANCELLED)
+            raise
+        except BaseException as error:
+            future.set_exception(error)
+            # Mark as retrieved so asyncio does not warn when nobody else was waiting
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being fetched."""
+        return len(self._calls)
@@ -0,0 +1,112 @@
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional, Tuple, Type
+from .errors import RateLimitError, ServerError
+from .watcher import WatchEvent
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWatcher:
+    """
+    Polls an AsyncClient getter and emits a WatchEvent only when its result changes.
+
+    Uses the same adaptive interval as Watcher. Use it as an async iterator, or call
+    subscribe() for a queue per consumer and run the polling loop once with start().
+    """
+
+    MIN_INTERVAL = 5
+    MAX_INTERVAL = 60
+    BACKOFF = 1.5
+
+    def __init__(self, poll: Callable[[], Awaitable[Any]], min_interval: float = MIN_INTERVAL, max_interval: float = MAX_INTERVAL,
+                 backoff: float = BACKOFF, transient_errors: Tuple[Type[BaseException], ...] = ()):
+        """
+        Args:
+            poll (Callable): Coroutine function returning the current value
+            min_interval (float): Seconds between polls while data is changing
+            max_interval (float): Upper bound for the adaptive interval
+            backoff (float): Interval multiplier after an unchanged poll
+            transient_errors (tuple): Transport errors retried with backoff, in addition to 429 and 5xx responses
+        """
+        self.poll = poll
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.transient_errors = (RateLimitError, ServerError) + tuple(transient_errors)
+        self.interval = min_interval
+        self.last_value = None
+        self.last_error: Optional[BaseException] = None
+        self._queues: List[asyncio.Queue] = []
+        self._stopped: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _stop_event(self) -> asyncio.Event:
+        # Created lazily so the event binds to the running loop
+        if self._stopped is None:
+            self._stopped = asyncio.Event()
+        return self._stopped
+
+    async def __aiter__(self) -> AsyncIterator[WatchEvent]:
+        stopped = self._stop_event()
+        first = True
+        while not stopped.is_set():
+            try:
+                value = await self.poll()
+            except self.transient_errors as error:
+                self.last_error = error
+                self.interval = min(self.interval * 2, self.max_interval)
+            else:
+                self.last_error = None
+                if first or value != self.last_value:
+                    event = WatchEvent(value, self.last_value, time.time())
+                    self.last_value = value
+                    self.interval = self.min_interval
+                    first = False
+                    yield event
+                else:
+                    self.interval = min(self.interval * self.backoff, self.max_interval)
+            try:
+                await asyncio.wait_for(stopped.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def subscribe(self, maxsize: int = 0) -> asyncio.Queue:
+        """
+        Return a queue receiving every event. Pass it to unsubscribe() when done.
+        """
+        queue = asyncio.Queue(maxsize)
+        self._queues.append(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        self._queues.remove(queue)
+
+    async def run(self) -> None:
+        """
+        Poll until stop() is called, fanning events out to all subscriber queues.
+        A failing delivery is logged and doesn't stop the loop or the other subscribers.
+        """
+        async for event in self:
+            for queue in list(self._queues):
+                try:
+                    if queue.full():
+                        # A slow subscriber only loses its oldest event
+                        queue.get_nowait()
+                    queue.put_nowait(event)
+                except Exception:
+                    logger.exception("AsyncWatcher subscriber %r failed", queue)
+
+    def start(self) -> asyncio.Task:
+        """Run the polling loop as a task on the current event loop."""
+        if self._task is None or self._task.done():
+            self._stop_event().clear()
+            self._task = asyncio.get_running_loop().create_task(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        self._stop_event().set()
+        if self._task is not None:
+            await self._task
+        self._task = None
@@ -0,0 +1,47 @@
+from typing import Any, Dict, Hashable, Iterator
+
+
+class BatchResult:
+    """
+    Results of a bulk call keyed by the requested UID (or location title).
+    Failures are reported per key instead of failing the whole batch.
+    """
+
+    def __init__(self, results: Dict[Hashable, Any], errors: Dict[Hashable, BaseException]):
+        """
+        Args:
+            results (dict): Successful results by key
+            errors (dict): Exceptions by key for the calls that failed
+        """
+        self.results = results
+        self.errors = errors
+
+    def is_complete(self) -> bool:
+        """Return True if every call succeeded."""
+        return not self.errors
+
+    def raise_for_errors(self) -> None:
+        """Raise the first error of the batch, if any."""
+        for error in self.errors.values():
+            raise error
+
+    def __getitem__(self, key: Hashable) -> Any:
+        # A failed key re-raises its own error
+        if key in self.errors:
+            raise self.errors[key]
+        return self.results[key]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.results
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self.results)
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def items(self):
+        return self.results.items()
+
+    def __repr__(self) -> str:
+        return f"BatchResult(results={len(self.results)}, errors={self.errors!r})"
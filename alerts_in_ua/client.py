@@ -1,134 +1,242 @@
-import requests
-from .errors import UnauthorizedError, RateLimitError, InternalServerError, ForbiddenError, ApiError
+import time
 from .alert import Alert
 from .alerts import Alerts
-from .user_agent import UserAgent
-from typing import List, Dict, Union
+from typing import Callable, List, Dict, Iterable, Iterator, Union
 from .air_raid_alert_oblast_statuses import AirRaidAlertOblastStatuses
 from .air_raid_alert_oblast_status import AirRaidAlertOblastStatus
-from .air_raid_alert_status import AirRaidAlertStatus
 from .air_raid_alert_statuses import AirRaidAlertStatuses
-from .location_uid_resolver import LocationUidResolver
-from .air_raid_alert_status_resolver import AirRaidAlertStatusResolver
+from .air_raid_alert_status_vector import AirRaidAlertStatusVector
+from .air_raid_alert_status_snapshot import AirRaidAlertStatusSnapshot
+from .api_protocol import ApiProtocol, ApiCall, ApiRequest
+from .transport import Transport, TransportResponse
+from .single_flight import SingleFlight
+from .response_cache import ResponseCache
+from .watcher import Watcher
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy
+from .batch_result import BatchResult
+from .streaming_alerts_parser import StreamingAlertsParser
+from .json_codec import JsonCodec
+from .instrumentation import Instrumentation, RequestEvent
 class Client:
     REQUEST_TIMEOUT = 5
-    API_BASE_URL = "https://api.alerts.in.ua"
-    def __init__(self, token: str):
+    API_BASE_URL = ApiProtocol.API_BASE_URL
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
+    BATCH_CONCURRENCY = 8
+    STREAM_CHUNK_SIZE = 65536
+    def __init__(self, token: str, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE, cache: ResponseCache = None,
+                 rate_limiter: RateLimiter = None, retry_policy: RetryPolicy = None, codec: JsonCodec = None,
+                 listeners: List[Callable[[RequestEvent], None]] = None, transport: Transport = None):
         self.token = token
-        self.base_url = Client.API_BASE_URL + "/v1/"
-        self.location_uid_resolver = LocationUidResolver()
-        self.headers = {
-            "Accept": "application/json",
-            "Authorization": f"Bearer {self.token}",
-            "User-Agent": UserAgent.get_user_agent(self.token)
-        }
-        self.cache = {}
+        self.protocol = ApiProtocol(token, cache=cache, codec=codec, rate_limiter=rate_limiter, retry_policy=retry_policy,
+                                    instrumentation=Instrumentation(listeners), base_url=self.API_BASE_URL + "/v1/")
+        if transport is None:
+            # Imported here so that clients with another transport never load requests
+            from .requests_transport import RequestsTransport
+            transport = RequestsTransport(pool_connections=pool_connections, pool_maxsize=pool_maxsize, timeout=Client.REQUEST_TIMEOUT)
+        self.transport = transport
+        # Shortcuts to the state owned by the protocol
+        self.headers = self.protocol.headers
+        self.cache = self.protocol.cache
+        self.codec = self.protocol.codec
+        self.rate_limiter = self.protocol.rate_limiter
+        self.retry_policy = self.protocol.retry_policy
+        self.instrumentation = self.protocol.instrumentation
+        self.location_uid_resolver = self.protocol.location_uid_resolver
+        self.single_flight = SingleFlight()
+
+    @property
+    def base_url(self) -> str:
+        return self.protocol.base_url
+
+    @base_url.setter
+    def base_url(self, base_url: str):
+        self.protocol.base_url = base_url
+
+    @property
+    def session(self):
+        # The HTTP library session of the transport, for transports that have one
+        return getattr(self.transport, "session", None)
+
+    def close(self):
+        self.transport.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def add_listener(self, listener: Callable[[RequestEvent], None]) -> Callable[[], None]:
+        """
+        Receive a RequestEvent after every call. Returns a function that removes the listener.
+        """
+        return self.instrumentation.subscribe(listener)
+
+    def _get(self, call: ApiCall, use_cache=True):
+        # Request the endpoint and build the model, timing both when someone listens
+        if not self.instrumentation:
+            return self.protocol.build(call, self._request_entry(call, use_cache=use_cache), None)
+        event, token = self.instrumentation.start(call.endpoint)
+        try:
+            return self.protocol.build(call, self._request_entry(call, use_cache=use_cache), event)
+        except Exception as error:
+            event.error = error
+            raise
+        finally:
+            self.instrumentation.finish(event, token)
 
     def _request(self, endpoint: str, use_cache=True):
-        # Check if endpoint is in cache and return cached data if not modified
-        if endpoint in self.cache and use_cache == True:
-            cached_data = self.cache[endpoint]
-            headers = {
-                **self.headers,
-                **{"If-Modified-Since": cached_data["Last-Modified"]},
-            }
-            response = requests.get(
-                self.base_url + endpoint,
-                headers=headers,
-                timeout=Client.REQUEST_TIMEOUT,
-            )
-            if response.status_code == 304:
-                return cached_data["Data"]
-
-        # Make the request
-        response = requests.get(
-            self.base_url + endpoint,
-            headers=self.headers,
-            timeout=Client.REQUEST_TIMEOUT,
-        )
+        # The decoded data alone, for callers that build nothing from it
+        return self._request_entry(ApiCall(endpoint, None), use_cache=use_cache)["Data"]
+
+    def _request_entry(self, call: ApiCall, use_cache=True):
+        # Concurrent calls for the same endpoint and model share one upstream request
+        return self.single_flight.do((call.endpoint, call.model_key, use_cache), self._fetch, call, use_cache)
 
-        # Check if response is successful
-        if response.status_code == 200:
-            data = response.json()
-            self.cache[endpoint] = {
-                "Data": data,
-                "Last-Modified": response.headers["Last-Modified"],
-            }
-            return data
-        else:
-            message = None
+    def _fetch(self, call: ApiCall, use_cache=True):
+        request = self.protocol.prepare(call.endpoint, use_cache=use_cache, model_key=call.model_key)
+        if request.fresh:
+            return request.cached_data
+        return self.protocol.handle_response(request, self._send(request))
+
+    def _send(self, request: ApiRequest, stream: bool = False) -> TransportResponse:
+        # Applies the rate limiter and retries 429/5xx/timeouts according to the retry policy
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            self.protocol.start_attempt(request)
             try:
-                data = response.json()
-                json_message = data.get("message")
-                message = f"{json_message} HTTP Code:{response.status_code}"
-            except:
-                pass
-            if response.status_code == 401:
-                if message is None:
-                    message = "Unauthorized: Incorrect token"
-                raise UnauthorizedError(message)
-            elif response.status_code == 403:
-                if message is None:
-                    message = "Forbidden. API may not be available in some regions. Please ask api@alerts.in.ua for details."
-                raise ForbiddenError(message)
-            elif response.status_code == 429:
-                if message is None:
-                    message = "Too many requests: Rate limit exceeded"
-                raise RateLimitError(message)
-            elif response.status_code == 500:
-                raise InternalServerError("Internal server error")
-            else:
-                raise ApiError(f"Unknown error. HTTP Code:{response.status_code}")
+                response = self.transport.send(request.url, request.headers, stream=stream, event=request.event)
+            except self.transport.transient_errors:
+                delay = self.protocol.error_retry_delay(attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+
+            delay = self.protocol.retry_delay(request, response, attempt)
+            if delay is None:
+                return response
+            response.close()
+            time.sleep(delay)
+            attempt += 1
 
     def get_active_alerts(self, use_cache=True) -> Alerts:
-        data = self._request("alerts/active.json", use_cache=use_cache)
-        return Alerts(data)
-
-    def get_alerts_history(self, oblast_uid_or_location_title: Union[int, str], period: str = 'week_ago', use_cache: bool = True) -> Alerts:
-        if isinstance(oblast_uid_or_location_title, str):
-           if oblast_uid_or_location_title.isdigit():
-              oblast_uid = int(oblast_uid_or_location_title)
-           else:
-              oblast_uid = self.location_uid_resolver.resolve_uid(oblast_uid_or_location_title)
-        else:
-            oblast_uid = oblast_uid_or_location_title
-
-        url = f"regions/{oblast_uid}/alerts/{period}.json"
-        data = self._request(url, use_cache=use_cache)
-        return Alerts(data)
+        return self._get(self.protocol.active_alerts(), use_cache=use_cache)
+
+    def get_alerts_history(self, oblast_uid_or_location_title: Union[int, str], period: str = 'week_ago', use_cache: bool = True, columnar: bool = False) -> Alerts:
+        return self._get(self.protocol.alerts_history(oblast_uid_or_location_title, period, columnar=columnar), use_cache=use_cache)
 
     def get_air_raid_alert_status(self, oblast_uid_or_location_title: Union[int, str], oblast_level_only=False, use_cache=True) -> AirRaidAlertOblastStatus:
-         if isinstance(oblast_uid_or_location_title, str):
-           if oblast_uid_or_location_title.isdigit():
-              oblast_uid = int(oblast_uid_or_location_title)
-           else:
-              oblast_uid = self.location_uid_resolver.resolve_uid(oblast_uid_or_location_title)
-         else:
-            oblast_uid = oblast_uid_or_location_title
-         data = self._request(f"iot/active_air_raid_alerts/{oblast_uid}.json", use_cache=use_cache)
-         return AirRaidAlertOblastStatus(location_title = self.location_uid_resolver.resolve_location_title(oblast_uid),status=data,oblast_level_only=oblast_level_only)
-  
+        return self._get(self.protocol.air_raid_alert_status(oblast_uid_or_location_title, oblast_level_only=oblast_level_only), use_cache=use_cache)
+
+    def iter_alerts_history(self, oblast_uid_or_location_title: Union[int, str], period: str = 'week_ago', raw: bool = False,
+                            chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[Union[Alert, Dict]]:
+        """
+        Stream the alerts of a history response as they are downloaded.
+
+        The body is read in chunks and parsed incrementally, so memory stays bounded
+        regardless of the history window and processing starts before the download
+        finishes. Streaming bypasses the response cache.
+
+        Args:
+            oblast_uid_or_location_title: The oblast UID or location title
+            period (str): The history period, e.g. 'week_ago' or 'month_ago'
+            raw (bool): Yield raw record dictionaries instead of Alert objects
+            chunk_size (int): Bytes read from the connection at a time
+        """
+        endpoint = self.protocol.alerts_history_endpoint(oblast_uid_or_location_title, period)
+        response = self._send(self.protocol.prepare(endpoint, use_cache=False), stream=True)
+        try:
+            if response.status != 200:
+                self.protocol.raise_error(response.status, b"".join(response.iter_chunks(chunk_size)))
+            parser = StreamingAlertsParser()
+            for chunk in response.iter_chunks(chunk_size):
+                for record in parser.feed(chunk):
+                    yield record if raw else Alert(record)
+            for record in parser.close():
+                yield record if raw else Alert(record)
+        finally:
+            response.close()
+
+    def _run_many(self, keys: Iterable, call, concurrency: int) -> BatchResult:
+        from concurrent.futures import ThreadPoolExecutor  # Only bulk calls need the thread pool
+        keys = list(dict.fromkeys(keys))
+        results = {}
+        errors = {}
+        # One worker thread per concurrent request, never more than there are keys
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(keys) or 1))) as executor:
+            futures = {key: executor.submit(call, key) for key in keys}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as error:
+                    errors[key] = error
+        return BatchResult(results, errors)
+
+    def get_alerts_history_many(self, oblast_uids_or_location_titles: Iterable[Union[int, str]], period: str = 'week_ago', use_cache: bool = True,
+                                columnar: bool = False, concurrency: int = BATCH_CONCURRENCY) -> BatchResult:
+        """Fetch the history of several locations concurrently over a thread pool, keyed by the given UID or title."""
+        return self._run_many(
+            oblast_uids_or_location_titles,
+            lambda key: self.get_alerts_history(key, period=period, use_cache=use_cache, columnar=columnar),
+            concurrency,
+        )
+
+    def get_air_raid_alert_status_many(self, oblast_uids_or_location_titles: Iterable[Union[int, str]], oblast_level_only=False, use_cache=True,
+                                       concurrency: int = BATCH_CONCURRENCY) -> BatchResult:
+        """Fetch the status of several locations concurrently over a thread pool, keyed by the given UID or title."""
+        return self._run_many(
+            oblast_uids_or_location_titles,
+            lambda key: self.get_air_raid_alert_status(key, oblast_level_only=oblast_level_only, use_cache=use_cache),
+            concurrency,
+        )
+
     def get_air_raid_alert_statuses_by_oblast(self, oblast_level_only=False, use_cache=True) -> AirRaidAlertOblastStatuses:
-        data = self._request("iot/active_air_raid_alerts_by_oblast.json", use_cache=use_cache)
-        return AirRaidAlertOblastStatuses(data,oblast_level_only=oblast_level_only)
+        return self._get(self.protocol.air_raid_alert_statuses_by_oblast(oblast_level_only=oblast_level_only), use_cache=use_cache)
 
     def get_air_raid_alert_statuses(self, use_cache=True) -> AirRaidAlertStatuses:
-        data = self._request("iot/active_air_raid_alerts.json", use_cache=use_cache)
-        
-        status_string = data if isinstance(data, str) else str(data)
-        
-        resolved_statuses = AirRaidAlertStatusResolver.resolve_status_string(
-            status_string, 
-            self.location_uid_resolver.uid_to_location
+        return self._get(self.protocol.air_raid_alert_statuses(), use_cache=use_cache)
+
+    def get_air_raid_alert_status_vector(self, use_cache=True) -> AirRaidAlertStatusVector:
+        return self._get(self.protocol.air_raid_alert_status_vector(), use_cache=use_cache)
+
+    def get_air_raid_alert_status_snapshot(self, use_cache=True) -> AirRaidAlertStatusSnapshot:
+        """
+        Fetch the full-country status string once and answer per-location queries from it.
+
+        Args:
+            use_cache (bool): Send a conditional request and reuse the cached snapshot if unchanged
+
+        Returns:
+            AirRaidAlertStatusSnapshot: Statuses of every oblast, raion and city in memory
+        """
+        return self._get(self.protocol.air_raid_alert_status_snapshot(), use_cache=use_cache)
+
+    def watch(self, method: str = "get_active_alerts", *args, min_interval: float = Watcher.MIN_INTERVAL,
+              max_interval: float = Watcher.MAX_INTERVAL, backoff: float = Watcher.BACKOFF, **kwargs) -> Watcher:
+        """
+        Watch a getter of this client and receive an event whenever its result changes.
+
+        Args:
+            method (str): Name of the getter, e.g. 'get_active_alerts' or 'get_air_raid_alert_statuses'
+            *args, **kwargs: Arguments passed to the getter on every poll
+            min_interval (float): Seconds between polls while data is changing
+            max_interval (float): Upper bound for the interval during 304 streaks and rate limiting
+            backoff (float): Interval multiplier after an unchanged poll
+
+        Returns:
+            Watcher: An iterator of WatchEvent objects
+        """
+        getter = getattr(self, method)
+        return Watcher(
+            lambda: getter(*args, **kwargs),
+            min_interval=min_interval,
+            max_interval=max_interval,
+            backoff=backoff,
+            transient_errors=self.transport.transient_errors,
         )
-        
-        statuses = []
-        for resolved_status in resolved_statuses:
-            air_raid_status = AirRaidAlertStatus(
-                location_title=resolved_status['location_title'],
-                status=resolved_status['status'],
-                uid=resolved_status['uid']
-            )
-            statuses.append(air_raid_status)
-                
-        return AirRaidAlertStatuses(statuses)
\ No newline at end of file
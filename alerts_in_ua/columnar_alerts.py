@@ -0,0 +1,164 @@
+import sys
+from array import array
+from typing import Dict, List, Optional
+from .alert import Alert
+from .alerts import Alerts
+from .ua_date_parser import UaDateParser, NO_TIME
+
+
+class _StringColumn:
+    """Dictionary-encoded string column: each distinct value is stored once."""
+
+    __slots__ = ('values', 'codes')
+
+    def __init__(self):
+        self.values = []
+        self.codes = array('i')
+
+    def build(self, column: List[Optional[str]]) -> None:
+        lookup = {}
+        for value in column:
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(self.values)
+                self.values.append(sys.intern(value) if isinstance(value, str) else value)
+            self.codes.append(code)
+
+    def __getitem__(self, index: int):
+        return self.values[self.codes[index]]
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _StringColumn) and self.values == other.values and self.codes == other.codes
+
+
+class _UidColumn:
+    """
+    Integer UID column. The API sends some UIDs as numeric strings, so the type is
+    encoded in the value: n >= 0 is the int n, -1 is None and n < -1 is str(-n - 2).
+    Columns holding anything else fall back to a string column.
+    """
+
+    __slots__ = ('codes', 'fallback')
+
+    def __init__(self):
+        self.codes = array('q')
+        self.fallback = None
+
+    def build(self, column: List) -> None:
+        try:
+            for value in column:
+                self.codes.append(_UidColumn._encode(value))
+        except ValueError:
+            self.codes = array('q')
+            self.fallback = _StringColumn()
+            self.fallback.build(column)
+
+    @staticmethod
+    def _encode(value) -> int:
+        if value is None:
+            return -1
+        if type(value) is int and value >= 0:
+            return value
+        if type(value) is str and value.isdigit() and str(int(value)) == value:
+            return -int(value) - 2
+        raise ValueError(value)
+
+    def __getitem__(self, index: int):
+        if self.fallback is not None:
+            return self.fallback[index]
+        code = self.codes[index]
+        if code >= 0:
+            return code
+        if code == -1:
+            return None
+        return str(-code - 2)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _UidColumn) and self.codes == other.codes and self.fallback == other.fallback
+
+
+class ColumnarAlerts(Alerts):
+    """
+    Column-oriented Alerts storage for large histories.
+
+    Titles and types are dictionary-encoded interned strings, UIDs are integers and
+    timestamps are epoch microseconds in array buffers. Alert objects are built as
+    views on demand and are not retained, so memory stays proportional to the
+    columns rather than to the number of Alert objects handed out.
+    """
+
+    STRING_FIELDS = ('location_title', 'location_type', 'alert_type', 'location_oblast', 'location_raion')
+    UID_FIELDS = ('id', 'location_uid', 'location_oblast_uid')
+    TIME_FIELDS = ('started_at', 'finished_at', 'updated_at')
+
+    def __init__(self, data: Dict):
+        records = data.get('alerts')
+        self._count = len(records)
+        self._alerts = None
+        self._from_records = True
+        self._indexes = {}
+        self._columns = {}
+        for field in self.STRING_FIELDS:
+            column = self._columns[field] = _StringColumn()
+            column.build([record.get(field) for record in records])
+        for field in self.UID_FIELDS:
+            column = self._columns[field] = _UidColumn()
+            column.build([record.get(field) if field != 'id' else record['id'] for record in records])
+        for field in self.TIME_FIELDS:
+            self._columns[field] = UaDateParser.parse_epoch_column([record.get(field) for record in records])
+        # Notes are rare, so only the non-empty ones are stored
+        self._notes = {i: record.get('notes') for i, record in enumerate(records) if record.get('notes') is not None}
+        self._calculated = array('b', [-1 if record.get('calculated') is None else int(bool(record.get('calculated'))) for record in records])
+        meta = data.get('meta')
+        self.last_updated_at = UaDateParser.parse_date(meta.get('last_updated_at'),"%Y/%m/%d %H:%M:%S %z")
+        self.disclaimer = data.get('disclaimer')
+
+    def _alert_at(self, index: int) -> Alert:
+        alert = Alert.__new__(Alert)
+        columns = self._columns
+        for field in self.STRING_FIELDS:
+            setattr(alert, field, columns[field][index])
+        for field in self.UID_FIELDS:
+            setattr(alert, field, columns[field][index])
+        # Epoch integers are converted to datetimes by Alert on first access
+        for field in self.TIME_FIELDS:
+            value = columns[field][index]
+            setattr(alert, '_' + field, None if value == NO_TIME else value)
+        alert.notes = self._notes.get(index)
+        calculated = self._calculated[index]
+        alert.calculated = None if calculated == -1 else bool(calculated)
+        return alert
+
+    def _field(self, index: int, key: str):
+        if key == 'notes':
+            return self._notes.get(index)
+        if key == 'calculated':
+            calculated = self._calculated[index]
+            return None if calculated == -1 else bool(calculated)
+        return self._columns[key][index]
+
+    def _source(self):
+        return (self._columns, self._notes, self._calculated)
+
+    def _is_finished(self, index: int) -> bool:
+        return self._columns['finished_at'][index] != NO_TIME
+
+    def _group_codes(self, field: str):
+        column = self._columns.get(field)
+        if self._from_records and isinstance(column, _StringColumn):
+            # Already dictionary-encoded
+            return list(column.values), array('q', column.codes)
+        return super()._group_codes(field)
+
+    def epoch_column(self, field: str) -> array:
+        """
+        Return a copy of the epoch-microsecond buffer of a timestamp field.
+        Missing values (e.g. unfinished alerts) are stored as NO_TIME.
+        """
+        return array('q', self._epoch_column(field))
+
+    def _epoch_column(self, field: str) -> array:
+        # The live column, shared by every copy of a memoized model
+        if not self._from_records:
+            return super()._epoch_column(field)
+        return self._columns[field]
@@ -9,7 +9,11 @@ class UnauthorizedError(ApiError):
 class RateLimitError(ApiError):
     pass
 
-class InternalServerError(ApiError):
+class ServerError(ApiError):
+    """Any 5xx response; usually temporary."""
+    pass
+
+class InternalServerError(ServerError):
     pass
 
 class ForbiddenError(ApiError):
@@ -0,0 +1,105 @@
+import time
+from typing import Dict, Optional
+from .instrumentation import RequestEvent
+from .transport import AsyncTransport, Transport, TransportResponse
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as error:
+        raise ImportError("The httpx transports require httpx: pip install 'httpx[http2]'") from error
+    return httpx
+
+
+class HttpxTransport(Transport):
+    """
+    Transport on httpx with HTTP/2 (requires `pip install 'httpx[http2]'`).
+
+    Over HTTP/2 concurrent requests to the API, such as the per-region calls of
+    get_alerts_history_many, are multiplexed as streams on one connection instead
+    of each taking a pooled connection.
+    """
+
+    MAX_CONNECTIONS = 10
+    REQUEST_TIMEOUT = 5
+
+    def __init__(self, http2: bool = True, max_connections: int = MAX_CONNECTIONS, timeout: float = REQUEST_TIMEOUT,
+                 client=None):
+        """
+        Args:
+            http2 (bool): Negotiate HTTP/2 (needs the h2 package), otherwise use HTTP/1.1
+            max_connections (int): Maximum number of open connections
+            timeout (float): Connect, read and pool timeout in seconds
+            client (httpx.Client, optional): Use this client instead of creating one
+        """
+        httpx = _import_httpx()
+        self.transient_errors = (httpx.TransportError,)
+        self.client = client if client is not None else httpx.Client(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    def send(self, url: str, headers: Dict[str, str], stream: bool = False,
+             event: Optional[RequestEvent] = None) -> TransportResponse:
+        started = time.perf_counter()
+        # send(stream=True) returns once the headers are in, which gives the time to first byte
+        response = self.client.send(self.client.build_request("GET", url, headers=headers), stream=True)
+        if event is not None:
+            event.ttfb = time.perf_counter() - started
+        if stream:
+            return TransportResponse(response.status_code, response.headers, iter_chunks=response.iter_bytes, close=response.close)
+        try:
+            body = response.read()
+        finally:
+            response.close()
+        return TransportResponse(response.status_code, response.headers, body)
+
+    def close(self) -> None:
+        self.client.close()
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    """
+    Asynchronous transport on httpx with HTTP/2 (requires `pip install 'httpx[http2]'`).
+
+    Concurrent coroutines share one multiplexed connection instead of opening one each.
+    """
+
+    MAX_CONNECTIONS = 10
+    REQUEST_TIMEOUT = 5
+
+    def __init__(self, http2: bool = True, max_connections: int = MAX_CONNECTIONS, timeout: float = REQUEST_TIMEOUT,
+                 client=None):
+        """
+        Args:
+            http2 (bool): Negotiate HTTP/2 (needs the h2 package), otherwise use HTTP/1.1
+            max_connections (int): Maximum number of open connections
+            timeout (float): Connect, read and pool timeout in seconds
+            client (httpx.AsyncClient, optional): Use this client instead of creating one
+        """
+        httpx = _import_httpx()
+        self.transient_errors = (httpx.TransportError,)
+        self.client = client if client is not None else httpx.AsyncClient(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+        )
+
+    async def send(self, url: str, headers: Dict[str, str], stream: bool = False,
+                   event: Optional[RequestEvent] = None) -> TransportResponse:
+        started = time.perf_counter()
+        response = await self.client.send(self.client.build_request("GET", url, headers=headers), stream=True)
+        if event is not None:
+            event.ttfb = time.perf_counter() - started
+        if stream:
+            return TransportResponse(response.status_code, response.headers, iter_chunks=response.aiter_bytes, close=response.aclose)
+        try:
+            body = await response.aread()
+        finally:
+            await response.aclose()
+        return TransportResponse(response.status_code, response.headers, body)
+
+    async def close(self) -> None:
+        await self.client.aclose()
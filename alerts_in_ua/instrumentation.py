@@ -0,0 +1,104 @@
+import contextvars
+import logging
+import time
+from typing import Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class RequestEvent:
+    """
+    What happened during one client call: transport, cache outcome, sizes and timings.
+
+    All durations are in seconds. Timings that do not apply to the call (no new
+    connection, a fresh cache hit) or that the transport cannot observe are None;
+    the requests based Client cannot see DNS and connect phases, for example.
+    """
+
+    FRESH = 'fresh'
+    NOT_MODIFIED = 'not_modified'
+    MISS = 'miss'
+    COALESCED = 'coalesced'
+    ERROR = 'error'
+
+    __slots__ = ('endpoint', 'status', 'cache_outcome', 'attempts', 'rate_limited', 'body_bytes', 'dns_time',
+                 'connect_time', 'ttfb', 'parse_time', 'build_time', 'total_time', 'started_at', 'error')
+
+    def __init__(self, endpoint: str):
+        """
+        Args:
+            endpoint (str): The API endpoint relative to /v1/
+        """
+        self.endpoint = endpoint
+        self.status: Optional[int] = None
+        self.cache_outcome: Optional[str] = None
+        self.attempts = 0
+        self.rate_limited = 0
+        self.body_bytes = 0
+        self.dns_time: Optional[float] = None
+        self.connect_time: Optional[float] = None
+        self.ttfb: Optional[float] = None
+        self.parse_time: Optional[float] = None
+        self.build_time: Optional[float] = None
+        self.total_time: Optional[float] = None
+        self.started_at = time.perf_counter()
+        self.error: Optional[BaseException] = None
+
+    def add_time(self, phase: str, seconds: float) -> None:
+        """Accumulate a phase duration, e.g. DNS lookups across retries."""
+        previous = getattr(self, phase)
+        setattr(self, phase, seconds if previous is None else previous + seconds)
+
+    def __repr__(self) -> str:
+        return (f"RequestEvent(endpoint={self.endpoint!r}, status={self.status!r}, cache_outcome={self.cache_outcome!r}, "
+                f"body_bytes={self.body_bytes}, total_time={self.total_time!r})")
+
+
+# The event of the call in progress in the current thread or task, None when nobody listens
+current_request_event: contextvars.ContextVar = contextvars.ContextVar('alerts_in_ua_request_event', default=None)
+
+
+class Instrumentation:
+    """
+    Listeners for RequestEvent objects, shared by a client and its transport hooks.
+
+    With no listeners the client skips event creation and timing entirely, so
+    instrumentation costs nothing unless it is used. Listeners run synchronously
+    in the calling thread or task once a call finishes and should return quickly.
+    """
+
+    def __init__(self, listeners: Optional[List[Callable[[RequestEvent], None]]] = None):
+        """
+        Args:
+            listeners (list, optional): Callables receiving each finished RequestEvent
+        """
+        self.listeners: List[Callable[[RequestEvent], None]] = list(listeners or ())
+
+    def __bool__(self) -> bool:
+        return bool(self.listeners)
+
+    def subscribe(self, listener: Callable[[RequestEvent], None]) -> Callable[[], None]:
+        """
+        Register a listener invoked for every finished call. Returns a function that unsubscribes it.
+        """
+        self.listeners.append(listener)
+        return lambda: self.listeners.remove(listener)
+
+    def start(self, endpoint: str) -> Tuple[RequestEvent, contextvars.Token]:
+        event = RequestEvent(endpoint)
+        return event, current_request_event.set(event)
+
+    def finish(self, event: RequestEvent, token: contextvars.Token) -> None:
+        current_request_event.reset(token)
+        event.total_time = time.perf_counter() - event.started_at
+        if event.error is not None:
+            event.cache_outcome = RequestEvent.ERROR
+        elif event.cache_outcome is None:
+            # Another caller's request for the same endpoint was shared
+            event.cache_outcome = RequestEvent.COALESCED
+        # Runs in the client's finally block, so a failing listener must not replace the call's result or error
+        for listener in list(self.listeners):
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Request listener %r failed", listener)
@@ -0,0 +1,44 @@
+import json
+from typing import Any, Union
+
+
+class JsonCodec:
+    """
+    Decodes response bodies and encodes cache snapshots.
+    Works on raw bytes so no intermediate str copy of the body is needed.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson, used automatically when it is installed."""
+
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+        self._orjson = orjson
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+def default_codec() -> JsonCodec:
+    """Return the fastest available codec: orjson if installed, otherwise the standard library."""
+    try:
+        return OrjsonCodec()
+    except ImportError:
+        return JsonCodec()
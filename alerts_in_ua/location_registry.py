@@ -0,0 +1,129 @@
+import pkgutil
+import re
+import threading
+from array import array
+from typing import Dict, List, Optional
+
+
+class LocationRegistry:
+    """
+    Registry of known locations (oblasts, raions and cities) with their hierarchy.
+
+    The data ships with the package as data/locations.tsv and is loaded lazily,
+    once per process, by LocationRegistry.default(). Lookups by UID use dense
+    arrays indexed by UID; title lookups are normalized, so case, apostrophe
+    variants and the "м." city prefix don't matter.
+    """
+
+    DATA_FILE = 'data/locations.tsv'
+    NO_PARENT = -1
+
+    _default = None
+    _default_lock = threading.Lock()
+
+    _APOSTROPHES = re.compile(r"[’ʼ‘`´′]")
+    _CITY_PREFIX = re.compile(r"^м\.\s*|^м\s+")
+    _SPACES = re.compile(r"\s+")
+
+    def __init__(self, rows: List[tuple]):
+        """
+        Args:
+            rows (list): (uid, parent_uid or None, location_type, title) tuples
+        """
+        size = max((row[0] for row in rows), default=-1) + 1
+        self._titles: List[Optional[str]] = [None] * size
+        self._types: List[Optional[str]] = [None] * size
+        self._parents = array('i', [self.NO_PARENT]) * size
+        self._children: Dict[int, List[int]] = {}
+        self._by_title: Dict[str, int] = {}
+        self.uid_to_location: Dict[int, str] = {}
+        self._location_to_uid: Optional[Dict[str, int]] = None
+        for uid, parent_uid, location_type, title in rows:
+            self._titles[uid] = title
+            self._types[uid] = location_type
+            self.uid_to_location[uid] = title
+            self._by_title[self.normalize_title(title)] = uid
+            if parent_uid is not None:
+                self._parents[uid] = parent_uid
+                self._children.setdefault(parent_uid, []).append(uid)
+
+    @classmethod
+    def default(cls) -> 'LocationRegistry':
+        """Return the packaged registry, loading it on first use and sharing it afterwards."""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls.from_tsv(pkgutil.get_data(__package__, cls.DATA_FILE).decode('utf-8'))
+        return cls._default
+
+    @classmethod
+    def from_tsv(cls, text: str) -> 'LocationRegistry':
+        rows = []
+        for line in text.splitlines():
+            if not line or line.startswith('#'):
+                continue
+            uid, parent_uid, location_type, title = line.split('\t')
+            rows.append((int(uid), int(parent_uid) if parent_uid else None, location_type, title))
+        return cls(rows)
+
+    @classmethod
+    def normalize_title(cls, title: str) -> str:
+        title = cls._APOSTROPHES.sub("'", title.strip().casefold())
+        title = cls._CITY_PREFIX.sub('', title)
+        return cls._SPACES.sub(' ', title)
+
+    def __contains__(self, uid: int) -> bool:
+        return isinstance(uid, int) and 0 <= uid < len(self._titles) and self._titles[uid] is not None
+
+    def __len__(self) -> int:
+        return len(self.uid_to_location)
+
+    @property
+    def location_to_uid(self) -> Dict[str, int]:
+        """Exact title to UID mapping, built on first use."""
+        if self._location_to_uid is None:
+            self._location_to_uid = {title: uid for uid, title in self.uid_to_location.items()}
+        return self._location_to_uid
+
+    def title(self, uid: int) -> Optional[str]:
+        """Return the title of a UID, None if it is unknown."""
+        return self._titles[uid] if uid in self else None
+
+    def location_type(self, uid: int) -> Optional[str]:
+        """Return 'oblast', 'raion' or 'city', None if the UID is unknown."""
+        return self._types[uid] if uid in self else None
+
+    def uid(self, title: str) -> Optional[int]:
+        """Return the UID of a title, None if it is unknown."""
+        return self._by_title.get(self.normalize_title(title))
+
+    def parent(self, uid: int) -> Optional[int]:
+        """Return the UID of the parent location, None for top-level locations."""
+        if uid not in self:
+            return None
+        parent_uid = self._parents[uid]
+        return None if parent_uid == self.NO_PARENT else parent_uid
+
+    def children(self, uid: int) -> List[int]:
+        """Return the UIDs of the locations directly under uid."""
+        return list(self._children.get(uid, ()))
+
+    def ancestors(self, uid: int) -> List[int]:
+        """Return the parent chain of uid, nearest first."""
+        chain = []
+        parent_uid = self.parent(uid)
+        while parent_uid is not None:
+            chain.append(parent_uid)
+            parent_uid = self.parent(parent_uid)
+        return chain
+
+    def oblast_of(self, uid: int) -> Optional[int]:
+        """Return the top-level location (oblast, Kyiv or Sevastopol) containing uid."""
+        if uid not in self:
+            return None
+        chain = self.ancestors(uid)
+        return chain[-1] if chain else uid
+
+    def oblasts(self) -> List[int]:
+        """Return the UIDs of all top-level locations."""
+        return [uid for uid in self.uid_to_location if self._parents[uid] == self.NO_PARENT]
@@ -1,170 +1,21 @@
+from .location_registry import LocationRegistry
+
 class LocationUidResolver:
-    def __init__(self):
-        self.uid_to_location = {
-            31: "м. Київ",
-            30: "м. Севастополь",
-            8: "Волинська область",
-            38: "Володимирський район",
-            41: "Камінь-Каширський район",
-            40: "Ковельський район",
-            39: "Луцький район",
-            4: "Вінницька область",
-            36: "Вінницький район",
-            37: "Гайсинський район",
-            35: "Жмеринський район",
-            33: "Могилів-Подільський район",
-            32: "Тульчинський район",
-            34: "Хмільницький район",
-            9: "Дніпропетровська область",
-            44: "Дніпровський район",
-            42: "Кам'янський район",
-            46: "Криворізький район",
-            47: "Нікопольський район",
-            45: "Павлоградський район",
-            43: "Самарівський район",
-            48: "Синельниківський район",
-            28: "Донецька область",
-            54: "Бахмутський район",
-            55: "Волноваський район",
-            51: "Горлівський район",
-            53: "Донецький район",
-            49: "Кальміуський район",
-            50: "Краматорський район",
-            52: "Маріупольський район",
-            56: "Покровський район",
-            10: "Житомирська область",
-            57: "Бердичівський район",
-            59: "Житомирський район",
-            60: "Звягельський район",
-            58: "Коростенський район",
-            11: "Закарпатська область",
-            61: "Берегівський район",
-            65: "Мукачівський район",
-            63: "Рахівський район",
-            64: "Тячівський район",
-            66: "Ужгородський район",
-            62: "Хустський район",
-            12: "Запорізька область",
-            147: "Бердянський район",
-            146: "Василівський район",
-            149: "Запорізький район",
-            148: "Мелітопольський район",
-            145: "Пологівський район",
-            14: "Київська область",
-            78: "Бориспільський район",
-            79: "Броварський район",
-            75: "Бучанський район",
-            73: "Білоцерківський район",
-            74: "Вишгородський район",
-            76: "Обухівський район",
-            77: "Фастівський район",
-            15: "Кіровоградська область",
-            82: "Голованівський район",
-            81: "Кропивницький район",
-            83: "Новоукраїнський район",
-            80: "Олександрійський район",
-            16: "Луганська область",
-            1803: "Алчевський район",
-            1804: "Довжанський район",
-            1801: "Луганський район",
-            1802: "Ровеньківський район",
-            85: "Сватівський район",
-            86: "Старобільський район",
-            84: "Сіверськодонецький район",
-            87: "Щастинський район",
-            27: "Львівська область",
-            91: "Дрогобицький район",
-            94: "Золочівський район",
-            90: "Львівський район",
-            88: "Самбірський район",
-            89: "Стрийський район",
-            92: "Шептицький район",
-            93: "Яворівський район",
-            17: "Миколаївська область",
-            96: "Баштанський район",
-            95: "Вознесенський район",
-            98: "Миколаївський район",
-            97: "Первомайський район",
-            18: "Одеська область",
-            100: "Березівський район",
-            105: "Болградський район",
-            102: "Білгород-Дністровський район",
-            104: "Одеський район",
-            99: "Подільський район",
-            103: "Роздільнянський район",
-            101: "Ізмаїльський район",
-            19: "Полтавська область",
-            107: "Кременчуцький район",
-            106: "Лубенський район",
-            108: "Миргородський район",
-            109: "Полтавський район",
-            5: "Рівненська область",
-            110: "Вараський район",
-            111: "Дубенський район",
-            112: "Рівненський район",
-            113: "Сарненський район",
-            20: "Сумська область",
-            117: "Конотопський район",
-            118: "Охтирський район",
-            116: "Роменський район",
-            114: "Сумський район",
-            115: "Шосткинський район",
-            21: "Тернопільська область",
-            120: "Кременецький район",
-            119: "Тернопільський район",
-            121: "Чортківський район",
-            22: "Харківська область",
-            127: "Берестинський район",
-            126: "Богодухівський район",
-            123: "Куп'янський район",
-            128: "Лозівський район",
-            124: "Харківський район",
-            122: "Чугуївський район",
-            125: "Ізюмський район",
-            23: "Херсонська область",
-            129: "Бериславський район",
-            133: "Генічеський район",
-            131: "Каховський район",
-            130: "Скадовський район",
-            132: "Херсонський район",
-            3: "Хмельницька область",
-            135: "Кам'янець-Подільський район",
-            134: "Хмельницький район",
-            136: "Шепетівський район",
-            24: "Черкаська область",
-            150: "Звенигородський район",
-            153: "Золотоніський район",
-            151: "Уманський район",
-            152: "Черкаський район",
-            26: "Чернівецька область",
-            138: "Вижницький район",
-            139: "Дністровський район",
-            137: "Чернівецький район",
-            25: "Чернігівська область",
-            144: "Корюківський район",
-            141: "Новгород-Сіверський район",
-            142: "Ніжинський район",
-            143: "Прилуцький район",
-            140: "Чернігівський район",
-            13: "Івано-Франківська область",
-            67: "Верховинський район",
-            71: "Калуський район",
-            70: "Коломийський район",
-            69: "Косівський район",
-            72: "Надвірнянський район",
-            68: "Івано-Франківський район",
-            1293: 'м. Харків',
-            564: 'м. Запоріжжя',
-            29: 'Автономна Республіка Крим'
+    def __init__(self, registry: LocationRegistry = None):
+        # The registry is loaded once per process and shared by every resolver
+        self.registry = registry if registry is not None else LocationRegistry.default()
+        self.uid_to_location = self.registry.uid_to_location
 
-        }
-        # Inverse mapping from location to UID
-        self.location_to_uid = {v: k for k, v in self.uid_to_location.items()}
+    @property
+    def location_to_uid(self):
+        """Inverse mapping from location to UID."""
+        return self.registry.location_to_uid
 
     def resolve_uid(self, uid):
         """Resolve location to UID."""
-        return self.location_to_uid.get(uid, "Unknown UID")
+        resolved = self.registry.uid(uid)
+        return "Unknown UID" if resolved is None else resolved
 
     def resolve_location_title(self, uid):
         """Resolve UID to location."""
-        return self.uid_to_location.get(int(uid), "Unknown location")
\ No newline at end of file
+        return self.uid_to_location.get(int(uid), "Unknown location")
@@ -0,0 +1,115 @@
+import bisect
+import re
+import threading
+from typing import Dict, List, Tuple
+from .instrumentation import RequestEvent
+
+
+class PrometheusAggregator:
+    """
+    Aggregates RequestEvent objects into Prometheus style counters and histograms.
+
+    Register it as a client listener and serve export() from a metrics endpoint.
+    Numeric path segments are replaced by {uid}, so the endpoint label has one
+    value per endpoint kind rather than one per location.
+    """
+
+    PREFIX = 'alerts_in_ua'
+    BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+    _COUNTERS = {
+        'requests_total': 'Client calls by endpoint, HTTP status and cache outcome.',
+        'response_bytes_total': 'Response body bytes received.',
+        'rate_limited_total': 'Responses with HTTP 429.',
+        'retries_total': 'Requests repeated by the retry policy.',
+    }
+    _HISTOGRAMS = {
+        'request_duration_seconds': ('total_time', 'Total duration of client calls, including parsing and model building.'),
+        'dns_seconds': ('dns_time', 'DNS resolution time.'),
+        'connect_seconds': ('connect_time', 'Time to establish new connections.'),
+        'ttfb_seconds': ('ttfb', 'Time from sending a request to receiving the response headers.'),
+        'parse_seconds': ('parse_time', 'Time to decode response bodies.'),
+        'build_seconds': ('build_time', 'Time to build models from decoded data.'),
+    }
+    _NUMBERS = re.compile(r'\d+')
+
+    def __init__(self, buckets: Tuple[float, ...] = BUCKETS):
+        """
+        Args:
+            buckets (tuple): Upper bounds of the histogram buckets in seconds
+        """
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Tuple], float] = {}
+        # (name, labels) -> [per bucket counts..., +Inf count, sum]
+        self._histograms: Dict[Tuple[str, Tuple], List[float]] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        endpoint = self._NUMBERS.sub('{uid}', event.endpoint)
+        labels = (('endpoint', endpoint),)
+        status = '' if event.status is None else str(event.status)
+        with self._lock:
+            self._increment('requests_total', labels + (('status', status), ('cache_outcome', event.cache_outcome)), 1)
+            if event.body_bytes:
+                self._increment('response_bytes_total', labels, event.body_bytes)
+            if event.rate_limited:
+                self._increment('rate_limited_total', labels, event.rate_limited)
+            if event.attempts > 1:
+                self._increment('retries_total', labels, event.attempts - 1)
+            for name, (attribute, _) in self._HISTOGRAMS.items():
+                value = getattr(event, attribute)
+                if value is not None:
+                    self._observe(name, labels, value)
+
+    def _increment(self, name: str, labels: Tuple, amount: float) -> None:
+        key = (name, labels)
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def _observe(self, name: str, labels: Tuple, value: float) -> None:
+        key = (name, labels)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = [0] * (len(self.buckets) + 2)
+        histogram[bisect.bisect_left(self.buckets, value)] += 1
+        histogram[-1] += value
+
+    @staticmethod
+    def _format_labels(labels: Tuple) -> str:
+        if not labels:
+            return ''
+        escaped = ('%s="%s"' % (name, str(value).replace('\\', '\\\\').replace('"', '\\"')) for name, value in labels)
+        return '{' + ','.join(escaped) + '}'
+
+    def export(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: list(value) for key, value in self._histograms.items()}
+        for name, help_text in self._COUNTERS.items():
+            metric = f'{self.PREFIX}_{name}'
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} counter')
+            for (key_name, labels), value in sorted(counters.items()):
+                if key_name == name:
+                    lines.append(f'{metric}{self._format_labels(labels)} {value:g}')
+        for name, (_, help_text) in self._HISTOGRAMS.items():
+            metric = f'{self.PREFIX}_{name}'
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} histogram')
+            for (key_name, labels), histogram in sorted(histograms.items()):
+                if key_name != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), histogram):
+                    cumulative += count
+                    le = '+Inf' if bound == float('inf') else f'{bound:g}'
+                    lines.append(f'{metric}_bucket{self._format_labels(labels + (("le", le),))} {cumulative}')
+                lines.append(f'{metric}_sum{self._format_labels(labels)} {histogram[-1]:.6g}')
+                lines.append(f'{metric}_count{self._format_labels(labels)} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
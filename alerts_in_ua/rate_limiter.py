@@ -0,0 +1,108 @@
+import threading
+import time
+from typing import Dict
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the request rate of a client.
+
+    The bucket holds up to burst tokens and refills at rate tokens per second.
+    Every request takes one token; when the bucket is empty the request waits
+    until a token is due. The same limiter can be shared by several clients,
+    sync or async, to stay under one API quota.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Args:
+            rate (float): Tokens added per second, i.e. sustained requests per second
+            burst (int): Bucket capacity, the number of requests allowed back to back
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.total_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def reserve(self) -> float:
+        """
+        Take a token and return how many seconds the caller must wait before using it.
+        The token is reserved even when the wait is positive, so callers are served in order.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            wait = max(wait, self._blocked_until - now)
+            self.acquired += 1
+            self.total_wait += wait
+            return wait
+
+    def acquire(self) -> None:
+        """Block the current thread until a request may be sent."""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Suspend the current coroutine until a request may be sent."""
+        import asyncio  # Kept out of module import so sync-only programs do not load asyncio
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def try_acquire(self) -> bool:
+        """Take a token only if one is available right now."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens < 1 or self._blocked_until > now:
+                return False
+            self._tokens -= 1
+            self.acquired += 1
+            return True
+
+    def pause(self, seconds: float) -> None:
+        """Hold back all requests for the given time, e.g. after a 429 with Retry-After."""
+        with self._lock:
+            self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available (negative while requests are queued)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+    def time_until_available(self) -> float:
+        """Seconds until the next request could be sent without waiting."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            return max(wait, self._blocked_until - now)
+
+    def state(self) -> Dict[str, float]:
+        """Return a snapshot of the limiter for schedulers and monitoring."""
+        return {
+            "rate": self.rate,
+            "burst": self.burst,
+            "tokens": self.tokens,
+            "time_until_available": self.time_until_available(),
+            "acquired": self.acquired,
+            "total_wait": self.total_wait,
+        }
+
+    def __repr__(self) -> str:
+        return f"RateLimiter({self.state()})"
@@ -0,0 +1,54 @@
+from typing import Dict, Optional
+import requests
+import requests.adapters
+from .instrumentation import RequestEvent
+from .transport import Transport, TransportResponse
+
+
+class RequestsTransport(Transport):
+    """
+    Transport on requests, the default for Client.
+
+    One long-lived session keeps TCP/TLS connections alive between polls.
+    """
+
+    POOL_CONNECTIONS = 10
+    POOL_MAXSIZE = 10
+    REQUEST_TIMEOUT = 5
+
+    transient_errors = (requests.Timeout, requests.ConnectionError)
+
+    def __init__(self, pool_connections: int = POOL_CONNECTIONS, pool_maxsize: int = POOL_MAXSIZE,
+                 timeout: float = REQUEST_TIMEOUT, session: Optional[requests.Session] = None):
+        """
+        Args:
+            pool_connections (int): Number of connection pools to cache
+            pool_maxsize (int): Maximum connections kept per pool
+            timeout (float): Connect and read timeout in seconds
+            session (requests.Session, optional): Use this session instead of creating one
+        """
+        self.timeout = timeout
+        self.session = session
+        if self.session is None:
+            self.session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+
+    def send(self, url: str, headers: Dict[str, str], stream: bool = False,
+             event: Optional[RequestEvent] = None) -> TransportResponse:
+        response = self.session.get(url, headers=headers, timeout=self.timeout, stream=stream)
+        if event is not None:
+            # requests measures from sending the request until the headers are parsed
+            event.ttfb = response.elapsed.total_seconds()
+        if stream:
+            return TransportResponse(
+                response.status_code,
+                response.headers,
+                iter_chunks=lambda chunk_size: response.iter_content(chunk_size=chunk_size),
+                close=response.close,
+            )
+        return TransportResponse(response.status_code, response.headers, response.content)
+
+    def close(self) -> None:
+        self.session.close()
@@ -0,0 +1,168 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+
+class CacheStats:
+    """Counters describing how a response cache served requests."""
+
+    def __init__(self):
+        self.hits = 0           # Served from a fresh entry without touching the network
+        self.misses = 0         # Full response downloaded
+        self.not_modified = 0   # Revalidated with If-Modified-Since and got 304
+        self.evictions = 0      # Entries dropped to respect size limits
+
+    def as_dict(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "evictions": self.evictions,
+        }
+
+    def __repr__(self) -> str:
+        return f"CacheStats({self.as_dict()})"
+
+
+class ResponseCache:
+    """
+    Base class for response caches used by Client and AsyncClient.
+
+    Entries are dictionaries with the keys:
+        Data: The decoded JSON payload
+        Last-Modified: The Last-Modified header used for revalidation
+        Size: The size of the raw response body in bytes
+        Stored-At: Unix timestamp of the last download or revalidation
+        Models: Optional dictionary of models built from Data, dropped together with the entry
+    """
+
+    def __init__(self, ttl: Optional[float] = None):
+        """
+        Args:
+            ttl (float, optional): Seconds an entry is served without revalidation.
+                None always revalidates with the server.
+        """
+        self.ttl = ttl
+        self.stats = CacheStats()
+
+    def get(self, key: str) -> Optional[Dict]:
+        raise NotImplementedError
+
+    def set(self, key: str, entry: Dict) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def is_fresh(self, entry: Dict) -> bool:
+        """Return True if the entry may be served without contacting the server."""
+        if self.ttl is None:
+            return False
+        return time.time() - entry.get("Stored-At", 0) < self.ttl
+
+    def store(self, key: str, data, last_modified: str, size: int = 0, body: Optional[bytes] = None) -> Dict:
+        """
+        Store a freshly downloaded response and return its entry.
+        Caches that persist bodies may keep the raw body instead of serializing data again.
+        """
+        entry = {
+            "Data": data,
+            "Last-Modified": last_modified,
+            "Size": size,
+            "Stored-At": time.time(),
+            "Models": {},
+        }
+        self.set(key, entry)
+        return entry
+
+    def revalidated(self, key: str, entry: Dict) -> None:
+        """Mark an entry as confirmed by a 304 response, restarting its freshness TTL."""
+        self.set(key, {**entry, "Stored-At": time.time()})
+
+    def release_data(self, key: str, entry: Dict) -> None:
+        """
+        Drop the decoded data of an entry whose models no longer need it, keeping the entry
+        for revalidation. Caches that can't release data keep it.
+        """
+
+
+class MemoryResponseCache(ResponseCache):
+    """
+    In-memory LRU response cache bounded by entry count and/or total body size.
+    """
+
+    MAX_ENTRIES = 256
+
+    def __init__(self, max_entries: Optional[int] = MAX_ENTRIES, max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        """
+        Args:
+            max_entries (int, optional): Maximum number of cached endpoints, None for unlimited
+            max_bytes (int, optional): Maximum total size of cached bodies, None for unlimited
+            ttl (float, optional): Seconds an entry is served without revalidation
+        """
+        super().__init__(ttl=ttl)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self._entries: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Dict) -> None:
+        size = entry.get("Size", 0)
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes is not None and size > self.max_bytes:
+                # Never cache a body that alone exceeds the limit
+                self.stats.evictions += 1
+                return
+            self._entries[key] = entry
+            self.total_bytes += size
+            while self._over_limit():
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats.evictions += 1
+
+    def release_data(self, key: str, entry: Dict) -> None:
+        # Replaced rather than changed in place, so callers still holding the entry keep its data
+        with self._lock:
+            if self._entries.get(key) is entry:
+                self._entries[key] = {**entry, "Data": None}
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry.get("Size", 0)
+
+    def _over_limit(self) -> bool:
+        if self.max_entries is not None and len(self._entries) > self.max_entries:
+            return True
+        return self.max_bytes is not None and self.total_bytes > self.max_bytes
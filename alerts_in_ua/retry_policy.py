@@ -0,0 +1,73 @@
+import email.utils
+import random
+import time
+from typing import Optional, Tuple
+
+
+class RetryPolicy:
+    """
+    Retries rate-limited (429), server error (5xx) and timed out requests with
+    jittered exponential backoff. A Retry-After header sent by the server takes
+    precedence over the computed backoff.
+    """
+
+    MAX_RETRIES = 3
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 30
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_retries: int = MAX_RETRIES, backoff_base: float = BACKOFF_BASE, backoff_max: float = BACKOFF_MAX,
+                 retry_statuses: Tuple[int, ...] = RETRY_STATUSES, retry_timeouts: bool = True):
+        """
+        Args:
+            max_retries (int): Retries after the first attempt
+            backoff_base (float): Backoff of the first retry in seconds, doubled on every further retry
+            backoff_max (float): Upper bound for a single backoff and for a honored Retry-After
+            retry_statuses (tuple): HTTP status codes that are retried
+            retry_timeouts (bool): Whether timeouts and connection errors are retried
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_timeouts = retry_timeouts
+
+    def should_retry(self, attempt: int) -> bool:
+        """Return True if another retry is allowed after the given (zero-based) attempt."""
+        return attempt < self.max_retries
+
+    def should_retry_status(self, status: int, attempt: int) -> bool:
+        return status in self.retry_statuses and self.should_retry(attempt)
+
+    def should_retry_timeout(self, attempt: int) -> bool:
+        return self.retry_timeouts and self.should_retry(attempt)
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """
+        Return the seconds to wait before the next attempt.
+
+        Args:
+            attempt (int): Zero-based number of the attempt that failed
+            retry_after (str, optional): Value of the Retry-After header (seconds or HTTP date)
+        """
+        parsed = self.parse_retry_after(retry_after)
+        if parsed is not None:
+            return min(parsed, self.backoff_max)
+        # "Full jitter": spreads retries of many workers over the whole backoff window
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    @staticmethod
+    def parse_retry_after(retry_after: Optional[str]) -> Optional[float]:
+        if not retry_after:
+            return None
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        return max(0.0, retry_at.timestamp() - time.time())
@@ -0,0 +1,60 @@
+import threading
+from typing import Any, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+    Threads arriving while a call for the same key is in flight wait for it
+    and receive its result or exception instead of running their own.
+    """
+
+    class _Call:
+        __slots__ = ("event", "result", "error")
+
+        def __init__(self):
+            self.event = threading.Event()
+            self.result = None
+            self.error = None
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "SingleFlight._Call"] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) unless a call for key is already in flight.
+
+        Args:
+            key (Hashable): Identifies equivalent calls (e.g. the endpoint)
+            fn (Callable): The function to execute
+
+        Returns:
+            Any: The result shared by all callers for this key
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = SingleFlight._Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def in_flight(self) -> int:
+        """Return the number of keys currently being fetched."""
+        return len(self._calls)
@@ -0,0 +1,199 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from .response_cache import ResponseCache
+from .json_codec import JsonCodec, default_codec
+
+
+class SqliteResponseCache(ResponseCache):
+    """
+    Persistent response cache stored in a local SQLite database.
+
+    The raw body and Last-Modified header are kept per endpoint, so a freshly
+    started process can revalidate with If-Modified-Since immediately and get
+    304 responses instead of full bodies. The database runs in WAL mode and
+    may be shared by several processes on the same host.
+    """
+
+    BUSY_TIMEOUT = 5
+    MAX_DECODED_ENTRIES = 32
+    MAX_DECODED_BYTES = 32 * 1024 * 1024
+    # Reads refresh accessed_at only when it is older than this, so most reads stay read-only
+    ACCESS_RESOLUTION = 60
+
+    def __init__(self, path: str, max_entries: Optional[int] = None, ttl: Optional[float] = None, codec: JsonCodec = None,
+                 max_decoded_entries: int = MAX_DECODED_ENTRIES, max_decoded_bytes: int = MAX_DECODED_BYTES):
+        """
+        Args:
+            path (str): Path of the SQLite database file (created if missing)
+            max_entries (int, optional): Maximum number of cached endpoints, None for unlimited
+            ttl (float, optional): Seconds an entry is served without revalidation
+            codec (JsonCodec, optional): Decodes stored bodies, the fastest available by default
+            max_decoded_entries (int): Decoded bodies kept in this process to skip decoding on reads
+            max_decoded_bytes (int): Limit on the raw size of the decoded bodies kept in this process
+        """
+        super().__init__(ttl=ttl)
+        self.path = path
+        self.codec = codec if codec is not None else default_codec()
+        self.max_entries = max_entries
+        self.max_decoded_entries = max_decoded_entries
+        self.max_decoded_bytes = max_decoded_bytes
+        self._lock = threading.Lock()
+        self._connection = None
+        self._pid = None
+        # LRU of decoded bodies keyed by endpoint: (last_modified, data, size), reused while Last-Modified is unchanged
+        self._decoded: "OrderedDict[str, tuple]" = OrderedDict()
+        self._decoded_bytes = 0
+        with self._lock:
+            self._connect().execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " body BLOB NOT NULL,"
+                " last_modified TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections must not cross a fork, so each process opens its own
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path,
+                timeout=SqliteResponseCache.BUSY_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, key: str) -> Optional[Dict]:
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(
+                "SELECT last_modified, size, stored_at, accessed_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._forget(key)
+                return None
+            last_modified, size, stored_at, accessed_at = row
+            decoded = self._decoded.get(key)
+            if decoded is None or decoded[0] != last_modified:
+                body = connection.execute("SELECT body FROM responses WHERE key = ?", (key,)).fetchone()
+                if body is None:
+                    self._forget(key)
+                    return None
+                data = self.codec.loads(body[0])
+                models = self._remember(key, last_modified, data, len(body[0]))
+            else:
+                data, models = decoded[1], decoded[3]
+                self._decoded.move_to_end(key)
+            now = time.time()
+            if self.max_entries is not None and now - accessed_at >= SqliteResponseCache.ACCESS_RESOLUTION:
+                connection.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+            entry = {
+                "Data": data,
+                "Last-Modified": last_modified,
+                "Size": size,
+                "Stored-At": stored_at,
+            }
+            if models is not None:
+                entry["Models"] = models
+            return entry
+
+    def set(self, key: str, entry: Dict) -> None:
+        self._write(key, entry, self.codec.dumps(entry["Data"]))
+
+    def store(self, key: str, data, last_modified: str, size: int = 0, body: Optional[bytes] = None) -> Dict:
+        # The downloaded body is stored as is; only callers without one pay for serializing data
+        entry = {"Data": data, "Last-Modified": last_modified, "Size": size, "Stored-At": time.time()}
+        models = self._write(key, entry, body if body is not None else self.codec.dumps(data))
+        if models is not None:
+            entry["Models"] = models
+        return entry
+
+    def _write(self, key: str, entry: Dict, body: bytes) -> Optional[Dict]:
+        size = entry.get("Size") or len(body)
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO responses (key, body, last_modified, size, stored_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (key, body, entry["Last-Modified"], size, entry.get("Stored-At", time.time()), time.time()),
+            )
+            models = self._remember(key, entry["Last-Modified"], entry["Data"], size)
+            if self.max_entries is not None:
+                evicted = self._evict(connection)
+                self.stats.evictions += len(evicted)
+            return models
+
+    def _evict(self, connection: sqlite3.Connection) -> List[str]:
+        # Selected first so the evicted keys can also be dropped from the decoded bodies
+        evicted = [row[0] for row in connection.execute(
+            "SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?", (self.max_entries,)
+        )]
+        if evicted:
+            connection.executemany("DELETE FROM responses WHERE key = ?", [(key,) for key in evicted])
+            for key in evicted:
+                self._forget(key)
+        return evicted
+
+    def _remember(self, key: str, last_modified: str, data, size: int) -> Optional[Dict]:
+        # Models built from a decoded body live and die with it; bodies too large to keep get none
+        self._forget(key)
+        if size > self.max_decoded_bytes:
+            return None
+        models = {}
+        self._decoded[key] = (last_modified, data, size, models)
+        self._decoded_bytes += size
+        while len(self._decoded) > self.max_decoded_entries or self._decoded_bytes > self.max_decoded_bytes:
+            _, (_, _, oldest_size, _) = self._decoded.popitem(last=False)
+            self._decoded_bytes -= oldest_size
+        return models if key in self._decoded else None
+
+    def _forget(self, key: str) -> None:
+        decoded = self._decoded.pop(key, None)
+        if decoded is not None:
+            self._decoded_bytes -= decoded[2]
+
+    def revalidated(self, key: str, entry: Dict) -> None:
+        # Only the timestamp changes on a 304, so avoid rewriting the body
+        with self._lock:
+            self._connect().execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (time.time(), time.time(), key),
+            )
+
+    def release_data(self, key: str, entry: Dict) -> None:
+        # The body stays on disk; only the decoded copy is dropped and the models are kept
+        with self._lock:
+            decoded = self._decoded.get(key)
+            if decoded is not None and decoded[3] is entry.get("Models"):
+                self._decoded[key] = (decoded[0], None, decoded[2], decoded[3])
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._forget(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connect().execute("DELETE FROM responses")
+            self._decoded.clear()
+            self._decoded_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+            self._connection = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
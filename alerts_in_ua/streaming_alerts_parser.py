@@ -0,0 +1,124 @@
+import codecs
+import json
+from typing import Dict, Iterator
+
+
+class StreamingAlertsParser:
+    """
+    Incremental parser for alert list responses ({"alerts": [...], "meta": ..., ...}).
+
+    Feed it the response body chunk by chunk and it yields each record of the
+    "alerts" array as soon as the record is complete, so memory stays bounded by
+    the chunk size and the largest single record rather than by the whole body.
+    Other top-level fields (meta, disclaimer) are collected into `extra`.
+    The parser does no I/O and works with any transport.
+    """
+
+    _WHITESPACE = ' \t\n\r'
+    # Drop consumed text once this much of the buffer has been parsed
+    _COMPACT_THRESHOLD = 65536
+
+    def __init__(self):
+        self.extra: Dict = {}
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buffer = ''
+        self._position = 0
+        self._state = 'start'
+        self._key = None
+
+    def feed(self, chunk: bytes) -> Iterator[Dict]:
+        """
+        Add a chunk of the body and yield the alert records completed by it.
+
+        Args:
+            chunk (bytes): The next piece of the response body
+        """
+        self._buffer += self._decoder.decode(chunk)
+        yield from self._parse(final=False)
+
+    def close(self) -> Iterator[Dict]:
+        """Signal the end of the body, yielding any remaining records and validating the document."""
+        self._buffer += self._decoder.decode(b'', final=True)
+        yield from self._parse(final=True)
+        if self._state != 'done':
+            raise ValueError("Incomplete alerts document")
+
+    def _skip_whitespace(self) -> bool:
+        buffer = self._buffer
+        position = self._position
+        while position < len(buffer) and buffer[position] in self._WHITESPACE:
+            position += 1
+        self._position = position
+        return position < len(buffer)
+
+    def _expect(self, char: str) -> None:
+        if self._buffer[self._position] != char:
+            raise ValueError(f"Expected {char!r} at position {self._position} of the alerts document")
+        self._position += 1
+
+    def _decode_value(self, final: bool):
+        """Decode the JSON value at the current position, or return (False, None) if it is not complete yet."""
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._position)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return False, None
+        # A number at the end of the buffer may continue in the next chunk
+        if end == len(self._buffer) and not final and self._buffer[end - 1] not in '}]"':
+            return False, None
+        self._position = end
+        return True, value
+
+    def _parse(self, final: bool) -> Iterator[Dict]:
+        while self._skip_whitespace():
+            state = self._state
+            if state == 'start':
+                self._expect('{')
+                self._state = 'key'
+            elif state == 'key':
+                if self._buffer[self._position] == '}':
+                    self._position += 1
+                    self._state = 'done'
+                    continue
+                if self._buffer[self._position] == ',':
+                    self._position += 1
+                    continue
+                complete, key = self._decode_value(final)
+                if not complete:
+                    break
+                self._key = key
+                self._state = 'colon'
+            elif state == 'colon':
+                self._expect(':')
+                self._state = 'value'
+            elif state == 'value':
+                if self._key == 'alerts' and self._buffer[self._position] == '[':
+                    self._position += 1
+                    self._state = 'alerts'
+                    continue
+                complete, value = self._decode_value(final)
+                if not complete:
+                    break
+                self.extra[self._key] = value
+                self._state = 'key'
+            elif state == 'alerts':
+                char = self._buffer[self._position]
+                if char == ']':
+                    self._position += 1
+                    self._state = 'key'
+                    continue
+                if char == ',':
+                    self._position += 1
+                    continue
+                complete, record = self._decode_value(final)
+                if not complete:
+                    break
+                yield record
+            else:
+                raise ValueError(f"Unexpected data after the alerts document at position {self._position}")
+
+            if self._position > self._COMPACT_THRESHOLD:
+                self._buffer = self._buffer[self._position:]
+                self._position = 0
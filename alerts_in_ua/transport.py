@@ -0,0 +1,87 @@
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Type
+from .instrumentation import RequestEvent
+
+
+class TransportResponse:
+    """
+    A response as returned by a transport, independent of the HTTP library.
+
+    Regular responses carry the whole body. Streamed responses leave body empty and
+    expose iter_chunks(chunk_size) instead; they must be closed (close() for sync
+    transports, aclose() for async ones) to release the connection.
+    """
+
+    __slots__ = ('status', 'headers', 'body', 'iter_chunks', '_close')
+
+    def __init__(self, status: int, headers: Mapping[str, str], body: bytes = b'',
+                 iter_chunks: Optional[Callable[[int], Any]] = None, close: Optional[Callable[[], Any]] = None):
+        """
+        Args:
+            status (int): The HTTP status code
+            headers (Mapping): Case-insensitive response headers
+            body (bytes): The complete body, empty for streamed responses
+            iter_chunks (Callable, optional): Returns an (async) iterator over body chunks of the given size
+            close (Callable, optional): Releases the connection of a streamed response
+        """
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.iter_chunks = iter_chunks
+        self._close = close
+
+    def close(self) -> None:
+        if self._close is not None:
+            self._close()
+
+    async def aclose(self) -> None:
+        if self._close is not None:
+            await self._close()
+
+    def __repr__(self) -> str:
+        return f"TransportResponse(status={self.status}, body_bytes={len(self.body)})"
+
+
+class Transport:
+    """
+    Sends GET requests for Client. Implementations wrap one HTTP library.
+
+    transient_errors lists the library's exceptions for timeouts and failed
+    connections; the client retries those according to its retry policy.
+    """
+
+    transient_errors: Tuple[Type[BaseException], ...] = ()
+
+    def send(self, url: str, headers: Dict[str, str], stream: bool = False,
+             event: Optional[RequestEvent] = None) -> TransportResponse:
+        """
+        Send a GET request.
+
+        Args:
+            url (str): The absolute URL
+            headers (dict): All request headers
+            stream (bool): Return as soon as the headers arrive and stream the body
+            event (RequestEvent, optional): Timings the transport can observe are recorded here
+
+        Returns:
+            TransportResponse: The response
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncTransport:
+    """
+    Sends GET requests for AsyncClient. Implementations wrap one HTTP library.
+    """
+
+    transient_errors: Tuple[Type[BaseException], ...] = ()
+
+    async def send(self, url: str, headers: Dict[str, str], stream: bool = False,
+                   event: Optional[RequestEvent] = None) -> TransportResponse:
+        """Send a GET request; see Transport.send. iter_chunks of streamed responses returns an async iterator."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        pass
@@ -1,19 +1,125 @@
 import datetime
-import pytz
-from typing import Optional
+import functools
+import re
+from array import array
+from typing import Iterable, List, Optional
+
+ISO_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+EPOCH = datetime.datetime(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+DAY_US = 86400 * 10 ** 6
+# The exact layout the API sends, e.g. '2024-03-31T01:30:00.123Z'; re.ASCII keeps \d to the digits 0-9
+ISO_PATTERN = re.compile(r'\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d\.\d{1,6}Z', re.ASCII)
+PARSE_CACHE_SIZE = 8192
+# Epoch-microsecond sentinel for a missing timestamp
+NO_TIME = -2 ** 63
+
+
+def _load_kyiv_tz():
+    # pytz is imported on first use; loading its zone database is the slow part of startup
+    import pytz
+    try:
+        return pytz.timezone('Europe/Kyiv')
+    except pytz.UnknownTimeZoneError:
+        return pytz.timezone('Europe/Kiev') # KyivNotKiev. Hopefully remove this method in future
+
 
 class UaDateParser:
+    _kyiv_tz = None
+
+    @classmethod
+    def kyiv_tz(cls):
+        """Return the Kyiv timezone, resolved once per process."""
+        if cls._kyiv_tz is None:
+            cls._kyiv_tz = _load_kyiv_tz()
+        return cls._kyiv_tz
+
     @staticmethod
-    def parse_date(date_string: Optional[str], time_format: str='%Y-%m-%dT%H:%M:%S.%fZ' ) -> Optional[datetime.datetime]:
+    def parse_date(date_string: Optional[str], time_format: str=ISO_FORMAT ) -> Optional[datetime.datetime]:
         if date_string:
-            kyiv_tz = None
-            try:
-                kyiv_tz = pytz.timezone('Europe/Kyiv')
-            except pytz.UnknownTimeZoneError:
-                kyiv_tz = pytz.timezone('Europe/Kiev') # KyivNotKiev. Hopefully remove this method in future
-
+            if time_format == ISO_FORMAT:
+                return _parse_iso_date(date_string)
+            kyiv_tz = UaDateParser.kyiv_tz()
             utc_dt = datetime.datetime.strptime(date_string, time_format)
-            local_dt = utc_dt.replace(tzinfo=pytz.utc).astimezone(kyiv_tz)
+            local_dt = utc_dt.replace(tzinfo=datetime.timezone.utc).astimezone(kyiv_tz)
             return kyiv_tz.normalize(local_dt)
         return None
 
+    @staticmethod
+    def to_epoch_us(date: datetime.datetime) -> int:
+        """Convert an aware datetime to integer microseconds since the Unix epoch."""
+        return (date.astimezone(datetime.timezone.utc).replace(tzinfo=None) - EPOCH) // datetime.timedelta(microseconds=1)
+
+    @staticmethod
+    def kyiv_epoch_us(date: datetime.datetime) -> int:
+        """Like to_epoch_us, but a naive datetime is read as Kyiv local time."""
+        if date.tzinfo is None:
+            date = UaDateParser.kyiv_tz().localize(date)
+        return UaDateParser.to_epoch_us(date)
+
+    @staticmethod
+    def from_epoch_us(epoch_us: int) -> datetime.datetime:
+        """Convert integer microseconds since the Unix epoch to an aware Kyiv datetime."""
+        kyiv_tz = UaDateParser.kyiv_tz()
+        utc_dt = EPOCH + datetime.timedelta(microseconds=epoch_us)
+        return kyiv_tz.fromutc(utc_dt.replace(tzinfo=kyiv_tz))
+
+    @staticmethod
+    def parse_dates(date_strings: Iterable[Optional[str]], time_format: str=ISO_FORMAT) -> List[Optional[datetime.datetime]]:
+        """Parse a column of timestamps; the same as calling parse_date on each value."""
+        return [UaDateParser.parse_date(date_string, time_format) for date_string in date_strings]
+
+    @staticmethod
+    def parse_epoch_column(date_strings: Iterable[Optional[str]]) -> array:
+        """
+        Parse a column of ISO timestamps straight to epoch microseconds, NO_TIME for missing values.
+
+        No datetime or timezone work is done per value: each distinct calendar day is
+        converted once and the time of day is added arithmetically. Values that don't
+        have the exact API layout go through parse_date and raise the same errors.
+        """
+        days = {}
+        column = array('q')
+        append = column.append
+        match = ISO_PATTERN.fullmatch
+        for date_string in date_strings:
+            if not date_string:
+                append(NO_TIME)
+                continue
+            if match(date_string) is not None:
+                hour, minute, second = int(date_string[11:13]), int(date_string[14:16]), int(date_string[17:19])
+                day = days.get(date_string[:10])
+                if day is None:
+                    try:
+                        day = days[date_string[:10]] = (datetime.date(
+                            int(date_string[0:4]), int(date_string[5:7]), int(date_string[8:10]),
+                        ).toordinal() - EPOCH_ORDINAL) * DAY_US
+                    except ValueError:
+                        pass
+                if day is not None and hour < 24 and minute < 60 and second < 60:
+                    append(day + ((hour * 60 + minute) * 60 + second) * 10 ** 6 + int(date_string[20:-1].ljust(6, '0')))
+                    continue
+            append(UaDateParser.to_epoch_us(UaDateParser.parse_date(date_string)))
+        return column
+
+
+@functools.lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_iso_date(date_string: str) -> datetime.datetime:
+    # Fixed-layout parser for 'YYYY-MM-DDTHH:MM:SS.fffZ', much cheaper than strptime
+    if ISO_PATTERN.fullmatch(date_string) is not None:
+        try:
+            utc_dt = datetime.datetime(
+                int(date_string[0:4]), int(date_string[5:7]), int(date_string[8:10]),
+                int(date_string[11:13]), int(date_string[14:16]), int(date_string[17:19]),
+                int(date_string[20:-1].ljust(6, '0')),
+            )
+        except ValueError:
+            utc_dt = None
+        if utc_dt is not None:
+            kyiv_tz = UaDateParser.kyiv_tz()
+            return kyiv_tz.fromutc(utc_dt.replace(tzinfo=kyiv_tz))
+    # Anything unusual goes through strptime so errors stay the same as before
+    kyiv_tz = UaDateParser.kyiv_tz()
+    utc_dt = datetime.datetime.strptime(date_string, ISO_FORMAT)
+    local_dt = utc_dt.replace(tzinfo=datetime.timezone.utc).astimezone(kyiv_tz)
+    return kyiv_tz.normalize(local_dt)
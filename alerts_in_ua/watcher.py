@@ -0,0 +1,123 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Iterator, List, Optional, Tuple, Type
+from .errors import RateLimitError, ServerError
+
+logger = logging.getLogger(__name__)
+
+
+class WatchEvent:
+    """
+    Emitted by a watcher when the watched data changed.
+    """
+
+    __slots__ = ('value', 'previous', 'received_at')
+
+    def __init__(self, value: Any, previous: Any, received_at: float):
+        """
+        Args:
+            value: The new result of the watched getter
+            previous: The previous result, None for the first event
+            received_at (float): Unix timestamp when the change was received
+        """
+        self.value = value
+        self.previous = previous
+        self.received_at = received_at
+
+    def __repr__(self) -> str:
+        return f"WatchEvent(received_at={self.received_at!r}, value={self.value!r})"
+
+
+class Watcher:
+    """
+    Polls a client getter and emits a WatchEvent only when its result changes.
+
+    The interval adapts between min_interval and max_interval: it is multiplied by
+    backoff after every unchanged poll (304 streaks), doubled on rate limits and
+    transient errors, and reset to min_interval as soon as the data changes. The
+    delay from an upstream change to the event is therefore at most the current
+    interval, never more than max_interval plus one request.
+
+    Iterate over the watcher directly, or register callbacks with subscribe() and
+    call start() to poll in a background thread shared by all subscribers.
+    """
+
+    MIN_INTERVAL = 5
+    MAX_INTERVAL = 60
+    BACKOFF = 1.5
+
+    def __init__(self, poll: Callable[[], Any], min_interval: float = MIN_INTERVAL, max_interval: float = MAX_INTERVAL,
+                 backoff: float = BACKOFF, transient_errors: Tuple[Type[BaseException], ...] = ()):
+        """
+        Args:
+            poll (Callable): Returns the current value, e.g. a bound client getter
+            min_interval (float): Seconds between polls while data is changing
+            max_interval (float): Upper bound for the adaptive interval
+            backoff (float): Interval multiplier after an unchanged poll
+            transient_errors (tuple): Transport errors retried with backoff, in addition to 429 and 5xx responses
+        """
+        self.poll = poll
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.transient_errors = (RateLimitError, ServerError) + tuple(transient_errors)
+        self.interval = min_interval
+        self.last_value = None
+        self.last_error: Optional[BaseException] = None
+        self._subscribers: List[Callable[[WatchEvent], None]] = []
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __iter__(self) -> Iterator[WatchEvent]:
+        first = True
+        while not self._stopped.is_set():
+            try:
+                value = self.poll()
+            except self.transient_errors as error:
+                self.last_error = error
+                self.interval = min(self.interval * 2, self.max_interval)
+            else:
+                self.last_error = None
+                if first or value != self.last_value:
+                    event = WatchEvent(value, self.last_value, time.time())
+                    self.last_value = value
+                    self.interval = self.min_interval
+                    first = False
+                    yield event
+                else:
+                    self.interval = min(self.interval * self.backoff, self.max_interval)
+            self._stopped.wait(self.interval)
+
+    def subscribe(self, callback: Callable[[WatchEvent], None]) -> Callable[[], None]:
+        """
+        Register a callback invoked for every event. Returns a function that unsubscribes it.
+        """
+        self._subscribers.append(callback)
+        return lambda: self._subscribers.remove(callback)
+
+    def run(self) -> None:
+        """
+        Poll until stop() is called, dispatching events to all subscribers.
+        A failing callback is logged and doesn't stop the loop or the other subscribers.
+        """
+        for event in self:
+            for callback in list(self._subscribers):
+                try:
+                    callback(event)
+                except Exception:
+                    logger.exception("Watcher subscriber %r failed", callback)
+
+    def start(self) -> 'Watcher':
+        """Run the polling loop in a daemon thread."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self.run, name="alerts-in-ua-watcher", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
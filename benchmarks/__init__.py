@@ -0,0 +1 @@
+"""Offline benchmarks for alerts_in_ua, run against a local stand-in API server."""
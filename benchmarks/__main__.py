@@ -0,0 +1,103 @@
+"""
+Run the alerts_in_ua benchmarks and compare result files.
+
+    python -m benchmarks run --suite all -o results.json
+    python -m benchmarks compare baseline.json results.json
+"""
+import argparse
+import datetime
+import json
+import platform
+import sys
+from typing import Dict
+
+import alerts_in_ua
+from . import http_benchmarks, import_benchmarks, micro_benchmarks
+
+# Metrics where a larger value is an improvement; for all others smaller is better
+HIGHER_IS_BETTER = {"throughput_rps"}
+COMPARED_METRICS = ("throughput_rps", "p50_ms", "p99_ms", "per_op_us")
+
+
+def run(args) -> Dict:
+    results = {}
+    if args.suite in ("all", "import"):
+        results.update(import_benchmarks.run(repeat=args.repeat, only=args.only))
+    if args.suite in ("all", "micro"):
+        results.update(micro_benchmarks.run(history_count=args.history, status_length=args.status_length,
+                                            repeat=args.repeat, only=args.only))
+    if args.suite in ("all", "http"):
+        results.update(http_benchmarks.run(requests=args.requests, concurrency=args.concurrency, alert_count=args.alerts,
+                                           history_count=args.history, status_length=args.status_length, only=args.only))
+    return {
+        "version": alerts_in_ua.__version__,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "parameters": {key: value for key, value in vars(args).items() if key not in ("command", "output")},
+        "results": results,
+    }
+
+
+def compare(baseline: Dict, current: Dict, threshold: float) -> int:
+    """Print per-metric changes between two result files; return the number of regressions beyond threshold."""
+    regressions = 0
+    print(f"{'benchmark':<48} {'metric':<15} {baseline['version']:>12} {current['version']:>12} {'change':>9}")
+    for name, result in current["results"].items():
+        previous = baseline["results"].get(name)
+        if previous is None:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = previous.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = new / old - 1
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            flag = " !" if worse > threshold else ""
+            regressions += bool(flag)
+            print(f"{name:<48} {metric:<15} {old:>12} {new:>12} {change:>+8.1%}{flag}")
+        added = set(result.get("modules", ())) - set(previous.get("modules", ()))
+        if added:
+            # A module newly loaded by an import scenario is a lazy loading regression
+            regressions += 1
+            print(f"{name:<48} {'modules':<15} now also imports {', '.join(sorted(added))} !")
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command")
+    run_parser = subparsers.add_parser("run", help="run the benchmarks and write JSON results")
+    run_parser.add_argument("--suite", choices=("all", "import", "micro", "http"), default="all")
+    run_parser.add_argument("--only", default="", help="run only benchmarks whose name contains this string")
+    run_parser.add_argument("--requests", type=int, default=500, help="requests per HTTP scenario")
+    run_parser.add_argument("--concurrency", type=int, default=8, help="threads or tasks issuing requests")
+    run_parser.add_argument("--alerts", type=int, default=100, help="records in alerts/active.json")
+    run_parser.add_argument("--history", type=int, default=1000, help="records in an alerts history")
+    run_parser.add_argument("--status-length", type=int, default=1900, help="length of the IoT status string")
+    run_parser.add_argument("--repeat", type=int, default=20, help="repetitions of each micro benchmark")
+    run_parser.add_argument("--output", "-o", help="write results to this file instead of stdout")
+    compare_parser = subparsers.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.10, help="relative change reported as a regression")
+    args = parser.parse_args(argv)
+
+    if args.command == "compare":
+        with open(args.baseline) as baseline, open(args.current) as current:
+            return 1 if compare(json.load(baseline), json.load(current), args.threshold) else 0
+    if args.command is None:
+        args = parser.parse_args(["run"] + list(argv if argv is not None else sys.argv[1:]))
+    report = json.dumps(run(args), indent=2, ensure_ascii=False)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(report + "\n")
+    else:
+        print(report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
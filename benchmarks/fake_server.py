@@ -0,0 +1,161 @@
+import datetime
+import http.server
+import json
+import socketserver
+import threading
+import time
+from email.utils import formatdate
+from typing import Dict, Optional
+
+OBLAST_UIDS = [29, 8, 4, 9, 28, 10, 11, 12, 13, 31, 14, 15, 16, 27, 17, 18, 19, 5, 30, 20, 21, 22, 23, 3, 24, 26, 25]
+
+
+def synthetic_alerts(count: int) -> Dict:
+    """Build an alerts document shaped like alerts/active.json with `count` records."""
+    start = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    records = []
+    for i in range(count):
+        started_at = start + datetime.timedelta(minutes=7 * i)
+        finished = i % 5 != 0
+        records.append({
+            "id": 100000 + i,
+            "location_title": "Луцький район",
+            "location_type": "raion" if i % 4 else "oblast",
+            "started_at": started_at.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "finished_at": (started_at + datetime.timedelta(minutes=45)).strftime("%Y-%m-%dT%H:%M:%S.000Z") if finished else None,
+            "updated_at": started_at.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
+            "alert_type": "air_raid" if i % 3 else "artillery_shelling",
+            "location_uid": str(38 + i % 4),
+            "location_oblast": "Волинська область",
+            "location_oblast_uid": 8,
+            "location_raion": "Луцький район",
+            "notes": None,
+            "calculated": False,
+        })
+    return {
+        "alerts": records,
+        "meta": {"last_updated_at": "2025/01/01 11:30:00 +0000", "type": "full"},
+        "disclaimer": "Synthetic data for benchmarks",
+    }
+
+
+def synthetic_status_string(length: int) -> str:
+    """Build an iot/active_air_raid_alerts.json status string of the given length."""
+    return "".join("NAPN "[(i * 7) % 5] for i in range(length))
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; split writes stall on delayed ACKs
+    wbufsize = 1 << 16
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body: bytes = b"", headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+        with server.lock:
+            server.requests += 1
+            throttled = server.rate_limit_every and server.requests % server.rate_limit_every == 0
+        if throttled:
+            self._send(429, b'{"message": "API rate limit exceeded"}', {"Retry-After": "0"})
+            return
+
+        body = server.body_for(self.path.split("?", 1)[0])
+        if body is None:
+            self._send(404, b'{"message": "Not found"}')
+            return
+        if server.last_modified and self.headers.get("If-Modified-Since") == server.last_modified:
+            self._send(304)
+            return
+        headers = {"Last-Modified": server.last_modified} if server.last_modified else None
+        self._send(200, body, headers)
+
+
+class FakeAlertsServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    """
+    Local stand-in for the alerts.in.ua API, serving synthetic payloads of configurable size.
+
+    Bodies are serialized once up front so the server adds as little as possible to the
+    measured latency. With last_modified set, requests carrying a matching
+    If-Modified-Since get a 304; with rate_limit_every=N every N-th request gets a 429
+    with Retry-After: 0.
+    """
+
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, alert_count: int = 100, history_count: int = 1000, status_length: int = 1900,
+                 last_modified: Optional[str] = None, rate_limit_every: int = 0, latency: float = 0.0):
+        """
+        Args:
+            alert_count (int): Records in alerts/active.json
+            history_count (int): Records in every regions/{uid}/alerts/{period}.json
+            status_length (int): Length of the iot/active_air_raid_alerts.json status string
+            last_modified (str, optional): Last-Modified header value; enables 304 responses
+            rate_limit_every (int): Answer every N-th request with 429, 0 to disable
+            latency (float): Seconds to sleep before answering each request
+        """
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.last_modified = last_modified
+        self.rate_limit_every = rate_limit_every
+        self.latency = latency
+        status_string = synthetic_status_string(status_length)
+        self.bodies = {
+            "active": json.dumps(synthetic_alerts(alert_count)).encode(),
+            "history": json.dumps(synthetic_alerts(history_count)).encode(),
+            "status": json.dumps(status_string).encode(),
+            "by_oblast": json.dumps("".join(status_string[uid] if status_string[uid] != " " else "N" for uid in OBLAST_UIDS)).encode(),
+            "oblast": json.dumps("A").encode(),
+        }
+        self._thread: Optional[threading.Thread] = None
+
+    @staticmethod
+    def http_date(timestamp: Optional[float] = None) -> str:
+        return formatdate(timestamp, usegmt=True)
+
+    @property
+    def url(self) -> str:
+        return "http://%s:%d" % self.server_address[:2]
+
+    def body_for(self, path: str) -> Optional[bytes]:
+        if path.endswith("/alerts/active.json"):
+            return self.bodies["active"]
+        if "/regions/" in path and "/alerts/" in path:
+            return self.bodies["history"]
+        if path.endswith("/iot/active_air_raid_alerts_by_oblast.json"):
+            return self.bodies["by_oblast"]
+        if path.endswith("/iot/active_air_raid_alerts.json"):
+            return self.bodies["status"]
+        if "/iot/active_air_raid_alerts/" in path:
+            return self.bodies["oblast"]
+        return None
+
+    def start(self) -> 'FakeAlertsServer':
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-alerts-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def __enter__(self) -> 'FakeAlertsServer':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,140 @@
+import asyncio
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from alerts_in_ua import Client, AsyncClient, RetryPolicy
+from .fake_server import FakeAlertsServer, OBLAST_UIDS
+
+LAST_MODIFIED = FakeAlertsServer.http_date(1735689600)
+
+# name -> (server options, getter name, getter kwargs, use a retry policy)
+# Concurrent calls for the same endpoint are coalesced by the client, so scenarios with
+# one endpoint measure coalescing too; server_requests in the results shows how many
+# requests actually reached the server. alerts_history_200 spreads calls over all
+# oblasts to measure real concurrent transfers.
+SCENARIOS = {
+    "active_alerts_200": ({}, "get_active_alerts", {"use_cache": False}, False),
+    "active_alerts_304": ({"last_modified": LAST_MODIFIED}, "get_active_alerts", {"use_cache": True}, False),
+    "alerts_history_200": ({}, "get_alerts_history", {"oblast_uid_or_location_title": OBLAST_UIDS, "use_cache": False}, False),
+    "status_vector_200": ({}, "get_air_raid_alert_status_vector", {"use_cache": False}, False),
+    "oblast_status_429": ({"rate_limit_every": 10}, "get_air_raid_alert_status", {"oblast_uid_or_location_title": 8, "use_cache": False}, True),
+}
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    rank = max(int(round(percent / 100 * len(sorted_values) + 0.5)) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def summarize(latencies: List[float], elapsed: float, errors: int, server: FakeAlertsServer, concurrency: int) -> Dict:
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies) + errors,
+        "concurrency": concurrency,
+        "errors": errors,
+        "server_requests": server.requests,
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "mean_ms": round(statistics.mean(latencies) * 1000, 3) if latencies else None,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+    }
+
+
+def _arguments(kwargs: Dict, i: int) -> Dict:
+    """Pick the i-th value for arguments given as a list, so calls can target different endpoints."""
+    return {key: value[i % len(value)] if isinstance(value, list) else value for key, value in kwargs.items()}
+
+
+def _client_options(use_retry_policy: bool) -> Dict:
+    # Retry-After: 0 from the fake server keeps retries off the sleep path
+    return {"retry_policy": RetryPolicy(backoff_base=0, backoff_max=0)} if use_retry_policy else {}
+
+
+def run_sync(server: FakeAlertsServer, getter: str, kwargs: Dict, use_retry_policy: bool, requests: int, concurrency: int) -> Dict:
+    client = Client("benchmark", pool_connections=concurrency, pool_maxsize=concurrency, **_client_options(use_retry_policy))
+    client.base_url = server.url + "/v1/"
+    call = getattr(client, getter)
+    call(**_arguments(kwargs, 0))  # warm up the connection pool and the cache
+    server.requests = 0
+    latencies: List[float] = []
+    errors = [0]
+    lock = threading.Lock()
+
+    def timed(i):
+        arguments = _arguments(kwargs, i)
+        started = time.perf_counter()
+        try:
+            call(**arguments)
+        except Exception:
+            with lock:
+                errors[0] += 1
+            return
+        latency = time.perf_counter() - started
+        with lock:
+            latencies.append(latency)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(requests)))
+    elapsed = time.perf_counter() - started
+    client.close()
+    return summarize(latencies, elapsed, errors[0], server, concurrency)
+
+
+def run_async(server: FakeAlertsServer, getter: str, kwargs: Dict, use_retry_policy: bool, requests: int, concurrency: int) -> Dict:
+    async def main():
+        client = AsyncClient("benchmark", limit=concurrency, **_client_options(use_retry_policy))
+        client.base_url = server.url + "/v1/"
+        async with client:
+            call = getattr(client, getter)
+            await call(**_arguments(kwargs, 0))
+            server.requests = 0
+            latencies: List[float] = []
+            errors = 0
+            remaining = iter(range(requests))
+
+            async def worker():
+                nonlocal errors
+                for i in remaining:
+                    arguments = _arguments(kwargs, i)
+                    started = time.perf_counter()
+                    try:
+                        await call(**arguments)
+                    except Exception:
+                        errors += 1
+                        continue
+                    latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            elapsed = time.perf_counter() - started
+        return summarize(latencies, elapsed, errors, server, concurrency)
+
+    return asyncio.run(main())
+
+
+RUNNERS: Dict[str, Callable[..., Dict]] = {"sync": run_sync, "async": run_async}
+
+
+def run(requests: int = 500, concurrency: int = 8, alert_count: int = 100, history_count: int = 1000,
+        status_length: int = 1900, only: str = "") -> Dict[str, Dict]:
+    """
+    Run every HTTP scenario against a fresh fake server with Client and AsyncClient.
+
+    Returns:
+        dict: Results keyed by "http.<sync|async>.<scenario>"
+    """
+    results = {}
+    for scenario, (server_options, getter, kwargs, use_retry_policy) in SCENARIOS.items():
+        for mode, runner in RUNNERS.items():
+            name = f"http.{mode}.{scenario}"
+            if only and only not in name:
+                continue
+            server = FakeAlertsServer(alert_count=alert_count, history_count=history_count, status_length=status_length, **server_options)
+            with server:
+                results[name] = runner(server, getter, kwargs, use_retry_policy, requests, concurrency)
+    return results
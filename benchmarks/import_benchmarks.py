@@ -0,0 +1,60 @@
+import json
+import statistics
+import subprocess
+import sys
+from typing import Dict
+
+# Modules whose presence after a scenario shows that lazy loading regressed
+HEAVY_MODULES = ('requests', 'aiohttp', 'pytz', 'asyncio', 'sqlite3', 'concurrent.futures')
+
+# name -> statement executed after `import alerts_in_ua` in a fresh interpreter
+SCENARIOS = {
+    "package": "",
+    "client": "alerts_in_ua.Client",
+    "client_init": "alerts_in_ua.Client('benchmark')",
+    "async_client": "alerts_in_ua.AsyncClient",
+    "all_exports": "[getattr(alerts_in_ua, name) for name in alerts_in_ua.__all__]",
+}
+
+_PROBE = '''
+import sys, time, json
+started = time.perf_counter()
+import alerts_in_ua
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "modules": [name for name in {heavy!r} if name in sys.modules]}}))
+'''
+
+
+def probe(statement: str) -> Dict:
+    """Run the statement in a fresh interpreter and return its import time and the heavy modules it loaded."""
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(statement=statement, heavy=HEAVY_MODULES)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(repeat: int = 10, only: str = "") -> Dict[str, Dict]:
+    """
+    Time cold imports of the package in fresh interpreters.
+
+    Returns:
+        dict: Results keyed by "import.<scenario>", with the heavy modules each scenario loaded
+    """
+    results = {}
+    for scenario, statement in SCENARIOS.items():
+        name = f"import.{scenario}"
+        if only and only not in name:
+            continue
+        probes = [probe(statement) for _ in range(repeat)]
+        timings = [result["seconds"] for result in probes]
+        results[name] = {
+            "ops": 1,
+            "repeat": repeat,
+            "best_ms": round(min(timings) * 1000, 3),
+            "median_ms": round(statistics.median(timings) * 1000, 3),
+            "per_op_us": round(min(timings) * 1e6, 1),
+            "modules": probes[-1]["modules"],
+        }
+    return results
@@ -0,0 +1,134 @@
+import datetime
+import json
+import pkgutil
+import statistics
+import time
+from typing import Callable, Dict
+
+from alerts_in_ua.alerts import Alerts
+from alerts_in_ua.columnar_alerts import ColumnarAlerts
+from alerts_in_ua.alert_interval_index import AlertIntervalIndex
+from alerts_in_ua.alert_analytics import AnalyticsBackend, default_backend
+from alerts_in_ua.ua_date_parser import UaDateParser, _parse_iso_date
+from alerts_in_ua.air_raid_alert_status import AirRaidAlertStatus
+from alerts_in_ua.air_raid_alert_statuses import AirRaidAlertStatuses
+from alerts_in_ua.air_raid_alert_status_resolver import AirRaidAlertStatusResolver
+from alerts_in_ua.location_registry import LocationRegistry
+from alerts_in_ua.location_uid_resolver import LocationUidResolver
+from alerts_in_ua.json_codec import default_codec
+from .fake_server import synthetic_alerts, synthetic_status_string
+
+
+def measure(function: Callable[[], object], ops: int, repeat: int) -> Dict:
+    """
+    Time `function` `repeat` times; each call performs `ops` operations.
+
+    Returns:
+        dict: Best and median wall time per call and the best time per operation
+    """
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    best = min(timings)
+    return {
+        "ops": ops,
+        "repeat": repeat,
+        "best_ms": round(best * 1000, 4),
+        "median_ms": round(statistics.median(timings) * 1000, 4),
+        "per_op_us": round(best / ops * 1e6, 4),
+    }
+
+
+def _distinct_timestamps(count: int):
+    # Distinct strings, so the parser's memo does not turn the benchmark into dict lookups
+    start = datetime.datetime(2024, 1, 1)
+    return [(start + datetime.timedelta(seconds=37 * i)).strftime("%Y-%m-%dT%H:%M:%S.000Z") for i in range(count)]
+
+
+def run(history_count: int = 1000, status_length: int = 1900, repeat: int = 20, only: str = "") -> Dict[str, Dict]:
+    """
+    Time model construction and the parsing and resolving helpers without any I/O.
+
+    Returns:
+        dict: Results keyed by "micro.<name>"
+    """
+    data = synthetic_alerts(history_count)
+    body = json.dumps(data).encode()
+    codec = default_codec()
+    timestamps = _distinct_timestamps(history_count)
+    status_string = synthetic_status_string(status_length)
+    resolver = LocationUidResolver()
+    uids = list(resolver.uid_to_location)
+    titles = list(resolver.uid_to_location.values())
+    registry_data = pkgutil.get_data('alerts_in_ua', LocationRegistry.DATA_FILE).decode('utf-8')
+
+    def build_alerts():
+        _parse_iso_date.cache_clear()
+        alerts = Alerts(data)
+        for alert in alerts:
+            alert.started_at
+
+    def build_columnar_alerts():
+        _parse_iso_date.cache_clear()
+        alerts = ColumnarAlerts(data)
+        for alert in alerts:
+            alert.started_at
+
+    history = Alerts(data)
+    interval_index = history.interval_index()
+    moments = [alert.started_at + datetime.timedelta(minutes=3) for alert in history]
+
+    analytics = {backend.name: history.analytics(backend=backend) for backend in (AnalyticsBackend(), default_backend())}
+
+    def history_analytics(backend_name: str):
+        def compute():
+            history_stats = analytics[backend_name]
+            history_stats.duration_stats_by('location_uid')
+            history_stats.counts_per_period('day')
+            history_stats.coverage_by('location_oblast')
+        return compute
+
+    def build_interval_index():
+        AlertIntervalIndex(history)
+
+    def parse_epoch_column():
+        UaDateParser.parse_epoch_column(timestamps)
+
+    def parse_dates_one_by_one():
+        _parse_iso_date.cache_clear()
+        for timestamp in timestamps:
+            UaDateParser.parse_date(timestamp)
+
+    # Both status benchmarks end with the AirRaidAlertStatuses the client returns, so they compare like for like
+    def statuses_from_string():
+        resolved = AirRaidAlertStatusResolver.resolve_status_string(status_string, resolver.uid_to_location)
+        return AirRaidAlertStatuses([AirRaidAlertStatus(**status) for status in resolved])
+
+    def statuses_from_vector():
+        return AirRaidAlertStatusResolver.resolve_status_vector(status_string).to_statuses(resolver.uid_to_location)
+
+    benchmarks = {
+        "json_decode_history": (lambda: codec.loads(body), 1),
+        "alerts_build": (build_alerts, history_count),
+        "columnar_alerts_build": (build_columnar_alerts, history_count),
+        "interval_index_build": (build_interval_index, history_count),
+        "interval_index_active_at": (lambda: [interval_index.active_at(moment) for moment in moments], history_count),
+        **{f"analytics_{name}": (history_analytics(name), history_count) for name in analytics},
+        "date_parser_parse_date": (parse_dates_one_by_one, history_count),
+        "date_parser_parse_epoch_column": (parse_epoch_column, history_count),
+        "status_resolver_string": (statuses_from_string, status_length),
+        "status_resolver_vector": (statuses_from_vector, status_length),
+        "location_registry_load": (lambda: LocationRegistry.from_tsv(registry_data), len(uids)),
+        "location_resolver_title": (lambda: [resolver.resolve_location_title(uid) for uid in uids], len(uids)),
+        "location_resolver_uid": (lambda: [resolver.resolve_uid(title) for title in titles], len(titles)),
+    }
+    results = {}
+    for name, (function, ops) in benchmarks.items():
+        name = f"micro.{name}"
+        if only and only not in name:
+            continue
+        function()  # warm up
+        results[name] = measure(function, ops, repeat)
+    return results
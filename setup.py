@@ -26,13 +26,18 @@ setup(
     description='Python library for alerts.in.ua API',
     long_description=long_description,
     long_description_content_type="text/markdown",
-    packages=find_packages(),
+    packages=find_packages(exclude=['benchmarks', 'benchmarks.*', 'tests', 'tests.*']),
+    package_data={'alerts_in_ua': ['data/*.tsv']},
+    python_requires='>=3.7',
     install_requires=[
         'aiohttp', 'requests','pytz'
     ],
+    extras_require={
+        'http2': ['httpx[http2]'],
+        'numpy': ['numpy'],
+    },
     classifiers=[
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
     ],
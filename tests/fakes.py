@@ -0,0 +1,81 @@
+import asyncio
+import json
+import threading
+from typing import Dict, List, Optional
+from alerts_in_ua.transport import AsyncTransport, Transport, TransportResponse
+
+LAST_MODIFIED = "Wed, 01 Jan 2025 00:00:00 GMT"
+
+
+def alert_records(count: int) -> Dict:
+    """Build an alerts document shaped like alerts/active.json with `count` records."""
+    return {
+        "alerts": [
+            {
+                "id": 100000 + i,
+                "location_title": "Луцький район",
+                "location_type": "raion",
+                "started_at": "2025-01-01T%02d:00:00.000Z" % (i % 24),
+                "finished_at": None if i % 2 else "2025-01-01T%02d:30:00.000Z" % (i % 24),
+                "updated_at": "2025-01-01T%02d:30:00.000Z" % (i % 24),
+                "alert_type": "air_raid" if i % 3 else "artillery_shelling",
+                "location_uid": str(38 + i % 3),
+                "location_oblast": "Волинська область",
+                "location_oblast_uid": 8,
+                "location_raion": "Луцький район",
+                "notes": None,
+                "calculated": False,
+            }
+            for i in range(count)
+        ],
+        "meta": {"last_updated_at": "2025/01/01 11:30:00 +0000"},
+        "disclaimer": "test",
+    }
+
+
+class FakeServer:
+    """
+    In-memory API: endpoint (URL suffix) -> JSON document, answering If-Modified-Since with 304.
+    """
+
+    def __init__(self, documents: Optional[Dict[str, object]] = None):
+        self.documents = dict(documents or {})
+        self.statuses: Dict[str, int] = {}
+        self.last_modified = LAST_MODIFIED
+        self.requests: List[Dict[str, str]] = []
+        self.release = threading.Event()
+        self.release.set()
+
+    def respond(self, url: str, headers: Dict[str, str]) -> TransportResponse:
+        self.requests.append(dict(headers, url=url))
+        self.release.wait(5)
+        for endpoint, document in self.documents.items():
+            if url.endswith(endpoint):
+                status = self.statuses.get(endpoint, 200)
+                if status != 200:
+                    return TransportResponse(status, {}, b'{"message": "failed"}')
+                if headers.get("If-Modified-Since") == self.last_modified:
+                    return TransportResponse(304, {"Last-Modified": self.last_modified})
+                return TransportResponse(200, {"Last-Modified": self.last_modified}, json.dumps(document).encode())
+        return TransportResponse(404, {}, b'{}')
+
+
+class FakeTransport(Transport):
+    def __init__(self, server: FakeServer):
+        self.server = server
+
+    def send(self, url, headers, stream=False, event=None) -> TransportResponse:
+        return self.server.respond(url, headers)
+
+
+class FakeAsyncTransport(AsyncTransport):
+    def __init__(self, server: FakeServer):
+        self.server = server
+        self.gate: Optional[asyncio.Event] = None
+
+    async def send(self, url, headers, stream=False, event=None) -> TransportResponse:
+        # Yield to the loop so concurrent calls overlap, waiting on the gate when a test holds it
+        await asyncio.sleep(0)
+        if self.gate is not None:
+            await self.gate.wait()
+        return self.server.respond(url, headers)
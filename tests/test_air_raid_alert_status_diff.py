@@ -0,0 +1,43 @@
+import pytest
+from alerts_in_ua.air_raid_alert_status_diff import AirRaidAlertStatusChange, AirRaidAlertStatusDiff
+from alerts_in_ua.air_raid_alert_status_vector import AirRaidAlertStatusVector
+
+QUIET_OBLASTS = "N" * 27
+QUIET_COUNTRY = " " * 3 + "N" * 30
+
+
+def test_full_country_strings_are_indexed_by_uid():
+    diff = AirRaidAlertStatusDiff(QUIET_COUNTRY, QUIET_COUNTRY[:8] + "A" + QUIET_COUNTRY[9:])
+    assert [(change.uid, change.kind) for change in diff] == [(8, AirRaidAlertStatusChange.STARTED)]
+    assert diff.started()[0].location_title == "Волинська область"
+
+
+def test_by_oblast_strings_are_mapped_to_uids():
+    # Position 1 of the by-oblast string is Волинська область, UID 8
+    diff = AirRaidAlertStatusDiff(QUIET_OBLASTS, "NA" + "N" * 25, by_oblast=True)
+    assert [(change.uid, change.kind) for change in diff] == [(8, AirRaidAlertStatusChange.STARTED)]
+    assert AirRaidAlertStatusDiff(None, "NP" + "N" * 25, by_oblast=True).started()[0].uid == 8
+
+
+def test_by_oblast_string_matches_its_vector():
+    current = "NA" + "N" * 25
+    from_strings = AirRaidAlertStatusDiff(QUIET_OBLASTS, current, by_oblast=True)
+    from_vectors = AirRaidAlertStatusDiff(AirRaidAlertStatusVector.from_oblast_string(QUIET_OBLASTS),
+                                          AirRaidAlertStatusVector.from_oblast_string(current))
+    assert [(change.uid, change.kind) for change in from_strings] == [(change.uid, change.kind) for change in from_vectors]
+
+
+@pytest.mark.parametrize("snapshot", ["N" * 26, "N" * 28, QUIET_COUNTRY])
+def test_by_oblast_rejects_other_lengths(snapshot):
+    with pytest.raises(ValueError):
+        AirRaidAlertStatusDiff(QUIET_OBLASTS, snapshot, by_oblast=True)
+
+
+def test_by_oblast_string_needs_the_flag():
+    with pytest.raises(ValueError, match="by_oblast=True"):
+        AirRaidAlertStatusDiff(QUIET_OBLASTS, QUIET_OBLASTS)
+
+
+def test_identical_strings_have_no_changes():
+    assert not AirRaidAlertStatusDiff(QUIET_COUNTRY, QUIET_COUNTRY)
+    assert not AirRaidAlertStatusDiff(QUIET_OBLASTS, QUIET_OBLASTS, by_oblast=True)
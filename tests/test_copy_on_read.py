@@ -0,0 +1,44 @@
+from alerts_in_ua import Client
+from tests.fakes import FakeServer, FakeTransport, alert_records
+
+HISTORY = "regions/8/alerts/week_ago.json"
+
+
+def make_client() -> Client:
+    server = FakeServer({
+        "alerts/active.json": alert_records(20),
+        HISTORY: alert_records(20),
+        "iot/active_air_raid_alerts.json": "ANP " * 10,
+        "iot/active_air_raid_alerts_by_oblast.json": "ANPNNNNNNNNNNNNNNNNNNNNNNNN",
+    })
+    return Client("token", transport=FakeTransport(server))
+
+
+def test_changing_alerts_does_not_affect_the_next_call():
+    client = make_client()
+    alerts = client.get_active_alerts()
+    alerts[0].location_title = "changed"
+    alerts.alerts[1].alert_type = "changed"
+    alerts.alerts.pop()
+    again = client.get_active_alerts()
+    assert again[0].location_title == "Луцький район"
+    assert again[1].alert_type != "changed"
+    assert len(again) == 20
+
+
+def test_changing_statuses_does_not_affect_the_next_call():
+    client = make_client()
+    client.get_air_raid_alert_statuses().statuses[0].status = "changed"
+    client.get_air_raid_alert_statuses_by_oblast().oblast_statuses[0].status = "changed"
+    assert client.get_air_raid_alert_statuses().statuses[0].status == "active"
+    assert client.get_air_raid_alert_statuses_by_oblast().oblast_statuses[0].status == "active"
+
+
+def test_changing_a_columnar_epoch_column_does_not_affect_the_next_call():
+    client = make_client()
+    history = client.get_alerts_history(8, "week_ago", columnar=True)
+    started_at = history[0].started_at
+    history.epoch_column('started_at')[0] = 0
+    again = client.get_alerts_history(8, "week_ago", columnar=True)
+    assert again[0].started_at == started_at
+    assert again.interval_index().count_active_at(started_at) == history.interval_index().count_active_at(started_at)
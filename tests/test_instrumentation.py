@@ -0,0 +1,24 @@
+import pytest
+from alerts_in_ua import Client
+from alerts_in_ua.errors import UnauthorizedError
+from tests.fakes import FakeServer, FakeTransport, alert_records
+
+
+def failing_listener(event):
+    raise RuntimeError("listener bug")
+
+
+def test_failing_listener_does_not_replace_the_result():
+    server = FakeServer({"alerts/active.json": alert_records(3)})
+    events = []
+    client = Client("token", transport=FakeTransport(server), listeners=[failing_listener, events.append])
+    assert len(client.get_active_alerts()) == 3
+    assert [event.endpoint for event in events] == ["alerts/active.json"]
+
+
+def test_failing_listener_does_not_hide_the_api_error():
+    server = FakeServer({"alerts/active.json": alert_records(3)})
+    server.statuses["alerts/active.json"] = 401
+    client = Client("token", transport=FakeTransport(server), listeners=[failing_listener])
+    with pytest.raises(UnauthorizedError):
+        client.get_active_alerts()
@@ -0,0 +1,13 @@
+import pytest
+from alerts_in_ua.location_registry import LocationRegistry
+
+
+@pytest.mark.parametrize('title', ['м. Київ', 'м.Київ', 'м Київ', 'М. КИЇВ', '  м.  Київ '])
+def test_city_prefix_is_optional(title):
+    registry = LocationRegistry.default()
+    assert registry.uid(title) == registry.uid('Київ') == 31
+
+
+def test_city_prefix_needs_a_separator():
+    assert LocationRegistry.normalize_title('Миколаївська область') == 'миколаївська область'
+    assert LocationRegistry.normalize_title('мала виска') == 'мала виска'
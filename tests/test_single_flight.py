@@ -0,0 +1,139 @@
+import asyncio
+import threading
+import time
+import pytest
+from alerts_in_ua import AsyncClient, Client
+from alerts_in_ua.async_single_flight import AsyncSingleFlight
+from alerts_in_ua.errors import ServerError
+from alerts_in_ua.single_flight import SingleFlight
+from tests.fakes import FakeAsyncTransport, FakeServer, FakeTransport, alert_records
+
+ACTIVE = "alerts/active.json"
+CALLERS = 5
+
+
+def run_threads(target, count=CALLERS):
+    outcomes = [None] * count
+
+    def worker(index):
+        try:
+            outcomes[index] = target()
+        except Exception as error:
+            outcomes[index] = error
+
+    threads = [threading.Thread(target=worker, args=(index,)) for index in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, outcomes
+
+
+def test_sync_followers_share_the_leaders_error():
+    single_flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def failing():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        raise ValueError("boom")
+
+    leader, outcomes = run_threads(lambda: single_flight.do("key", failing), count=1)
+    assert started.wait(5)
+    followers, follower_outcomes = run_threads(lambda: single_flight.do("key", failing))
+    # Give the followers time to join the call in flight
+    time.sleep(0.1)
+    release.set()
+    for thread in leader + followers:
+        thread.join(5)
+    assert len(calls) == 1
+    assert all(outcome is outcomes[0] for outcome in follower_outcomes)
+    assert isinstance(outcomes[0], ValueError)
+    assert single_flight.in_flight() == 0
+
+
+def test_sync_key_is_free_again_after_an_error():
+    single_flight = SingleFlight()
+    with pytest.raises(ValueError):
+        single_flight.do("key", int, "not a number")
+    assert single_flight.do("key", int, "42") == 42
+
+
+def test_sync_client_coalesces_a_failing_request():
+    server = FakeServer({ACTIVE: alert_records(3)})
+    server.statuses[ACTIVE] = 500
+    server.release.clear()
+    client = Client("token", transport=FakeTransport(server))
+    threads, outcomes = run_threads(client.get_active_alerts)
+    time.sleep(0.1)
+    server.release.set()
+    for thread in threads:
+        thread.join(5)
+    assert len(server.requests) == 1
+    assert all(isinstance(outcome, ServerError) for outcome in outcomes)
+
+
+def test_async_followers_share_the_leaders_error():
+    async def scenario():
+        single_flight = AsyncSingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def failing():
+            calls.append(1)
+            await release.wait()
+            raise ValueError("boom")
+
+        tasks = [asyncio.ensure_future(single_flight.do("key", failing)) for _ in range(CALLERS)]
+        await asyncio.sleep(0)
+        release.set()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        assert len(calls) == 1
+        assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+        assert single_flight.in_flight() == 0
+
+    asyncio.run(scenario())
+
+
+def test_async_client_coalesces_a_failing_request():
+    async def scenario():
+        server = FakeServer({ACTIVE: alert_records(3)})
+        server.statuses[ACTIVE] = 500
+        transport = FakeAsyncTransport(server)
+        transport.gate = asyncio.Event()
+        client = AsyncClient("token", transport=transport)
+        tasks = [asyncio.ensure_future(client.get_active_alerts()) for _ in range(CALLERS)]
+        for _ in range(3):
+            await asyncio.sleep(0)
+        transport.gate.set()
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        assert len(server.requests) == 1
+        assert all(isinstance(outcome, ServerError) for outcome in outcomes)
+
+    asyncio.run(scenario())
+
+
+def test_async_follower_retries_when_the_leader_is_cancelled():
+    async def scenario():
+        single_flight = AsyncSingleFlight()
+        release = asyncio.Event()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await release.wait()
+            return len(calls)
+
+        leader = asyncio.ensure_future(single_flight.do("key", fetch))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(single_flight.do("key", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        # The follower runs the call itself instead of seeing the leader's CancelledError
+        assert await follower == 2
+        assert leader.cancelled()
+        assert single_flight.in_flight() == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,78 @@
+import pytest
+from alerts_in_ua import Client
+from alerts_in_ua.errors import ServerError
+from alerts_in_ua.sqlite_response_cache import SqliteResponseCache
+from tests.fakes import LAST_MODIFIED, FakeServer, FakeTransport, alert_records
+
+ACTIVE = "alerts/active.json"
+
+
+@pytest.fixture
+def server():
+    return FakeServer({ACTIVE: alert_records(10)})
+
+
+def make_client(server, path, **kwargs) -> Client:
+    return Client("token", cache=SqliteResponseCache(str(path), **kwargs), transport=FakeTransport(server))
+
+
+def test_second_request_revalidates_and_gets_304(server, tmp_path):
+    client = make_client(server, tmp_path / "cache.db")
+    first = client.get_active_alerts()
+    second = client.get_active_alerts()
+    assert "If-Modified-Since" not in server.requests[0]
+    assert server.requests[1]["If-Modified-Since"] == LAST_MODIFIED
+    assert client.cache.stats.as_dict() == {"hits": 0, "misses": 1, "not_modified": 1, "evictions": 0}
+    assert [alert.id for alert in second] == [alert.id for alert in first]
+
+
+def test_new_cache_instance_revalidates_from_disk(server, tmp_path):
+    path = tmp_path / "cache.db"
+    make_client(server, path).get_active_alerts()
+    # A fresh process starts with nothing decoded but can still send If-Modified-Since
+    client = make_client(server, path)
+    alerts = client.get_active_alerts()
+    assert server.requests[-1]["If-Modified-Since"] == LAST_MODIFIED
+    assert client.cache.stats.not_modified == 1
+    assert client.cache.stats.misses == 0
+    assert len(alerts) == 10
+    assert alerts[0].location_title == "Луцький район"
+
+
+def test_changed_response_replaces_the_entry(server, tmp_path):
+    client = make_client(server, tmp_path / "cache.db")
+    client.get_active_alerts()
+    server.documents[ACTIVE] = alert_records(3)
+    server.last_modified = "Thu, 02 Jan 2025 00:00:00 GMT"
+    assert len(client.get_active_alerts()) == 3
+    assert client.cache.stats.misses == 2
+    assert client.cache.get("alerts/active.json")["Last-Modified"] == server.last_modified
+    assert len(make_client(server, tmp_path / "cache.db").get_active_alerts()) == 3
+
+
+def test_fresh_entry_is_served_without_a_request(server, tmp_path):
+    client = make_client(server, tmp_path / "cache.db", ttl=60)
+    client.get_active_alerts()
+    assert len(client.get_active_alerts()) == 10
+    assert len(server.requests) == 1
+    assert client.cache.stats.hits == 1
+
+
+def test_failed_request_keeps_the_cached_entry(server, tmp_path):
+    client = make_client(server, tmp_path / "cache.db")
+    client.get_active_alerts()
+    server.statuses[ACTIVE] = 500
+    with pytest.raises(ServerError):
+        client.get_active_alerts()
+    server.statuses[ACTIVE] = 200
+    assert len(client.get_active_alerts()) == 10
+    assert client.cache.stats.not_modified == 1
+
+
+def test_max_entries_bounds_the_database(tmp_path):
+    cache = SqliteResponseCache(str(tmp_path / "cache.db"), max_entries=2)
+    for key in ("a", "b", "c"):
+        cache.store(key, {"key": key}, LAST_MODIFIED)
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert sum(cache.get(key) is not None for key in ("a", "b", "c")) == 2
@@ -0,0 +1,53 @@
+import json
+import pytest
+from alerts_in_ua.streaming_alerts_parser import StreamingAlertsParser
+from tests.fakes import alert_records
+
+DOCUMENT = alert_records(5)
+DOCUMENT["alerts"][0]["id"] = 1234567890123
+DOCUMENT["alerts"][1]["notes"] = "Запорізька \"область\" — ✓ 🚨"
+
+
+def parse(body: bytes, chunk_size: int):
+    parser = StreamingAlertsParser()
+    records = []
+    for start in range(0, len(body), chunk_size):
+        records.extend(parser.feed(body[start:start + chunk_size]))
+    records.extend(parser.close())
+    return records, parser.extra
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_every_chunk_boundary(indent):
+    # Chunk sizes from a single byte up cover splits inside numbers, strings, escapes and multi-byte UTF-8
+    body = json.dumps(DOCUMENT, ensure_ascii=False, indent=indent).encode()
+    for chunk_size in list(range(1, 64)) + [len(body)]:
+        records, extra = parse(body, chunk_size)
+        assert records == DOCUMENT["alerts"], chunk_size
+        assert extra == {"meta": DOCUMENT["meta"], "disclaimer": DOCUMENT["disclaimer"]}
+
+
+def test_records_are_yielded_before_the_body_ends():
+    body = json.dumps(DOCUMENT).encode()
+    cut = body.index(b'}', body.index(b'"alerts"')) + 1
+    parser = StreamingAlertsParser()
+    assert list(parser.feed(body[:cut])) == DOCUMENT["alerts"][:1]
+
+
+def test_number_at_the_end_of_a_chunk_waits_for_the_next():
+    parser = StreamingAlertsParser()
+    assert list(parser.feed(b'{"alerts": [1')) == []
+    assert list(parser.feed(b'23, 4]}')) == [123, 4]
+    assert list(parser.close()) == []
+
+
+def test_empty_alerts():
+    records, extra = parse(b'{"alerts": [], "meta": {}}', 1)
+    assert records == []
+    assert extra == {"meta": {}}
+
+
+@pytest.mark.parametrize("body", [b'{"alerts": [{"id": 1}', b'{"alerts": [{"id": 1}]', b'[]', b'{"alerts": []} {}'])
+def test_malformed_documents_raise(body):
+    with pytest.raises(ValueError):
+        parse(body, 3)
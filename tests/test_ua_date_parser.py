@@ -0,0 +1,72 @@
+import datetime
+import pytest
+from alerts_in_ua.ua_date_parser import ISO_FORMAT, NO_TIME, UaDateParser
+
+# Around both 2024 DST switches in Kyiv, plus every fraction width the API may send
+DATES = [
+    "2024-03-31T00:59:59.999Z",
+    "2024-03-31T01:00:00.000Z",
+    "2024-03-31T01:30:00.5Z",
+    "2024-10-27T00:00:00.000Z",
+    "2024-10-27T00:30:00.12Z",
+    "2024-10-27T01:00:00.123456Z",
+    "2024-02-29T23:59:59.1234Z",
+    "2025-01-01T00:00:00.000Z",
+    "1999-12-31T22:00:00.00001Z",
+]
+
+
+def parse_with_strptime(date_string: str) -> datetime.datetime:
+    # The generic path every value used to take
+    kyiv_tz = UaDateParser.kyiv_tz()
+    utc_dt = datetime.datetime.strptime(date_string, ISO_FORMAT)
+    return kyiv_tz.normalize(utc_dt.replace(tzinfo=datetime.timezone.utc).astimezone(kyiv_tz))
+
+
+@pytest.mark.parametrize("date_string", DATES)
+def test_fast_path_matches_strptime(date_string):
+    parsed = UaDateParser.parse_date(date_string)
+    expected = parse_with_strptime(date_string)
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+    assert parsed.tzname() == expected.tzname()
+
+
+@pytest.mark.parametrize("date_string", ["2024-02-30T00:00:00.000Z", "2024-01-01T24:00:00.000Z", "2024-01-01T00:00:00Z",
+                                         "2024-01-01 00:00:00.000Z", "٢٠٢٤-01-01T00:00:00.000Z"])
+def test_unusual_values_behave_like_strptime(date_string):
+    try:
+        expected = parse_with_strptime(date_string)
+    except ValueError:
+        with pytest.raises(ValueError):
+            UaDateParser.parse_date(date_string)
+    else:
+        assert UaDateParser.parse_date(date_string) == expected
+
+
+def test_other_formats_use_strptime():
+    parsed = UaDateParser.parse_date("2024/03/31 01:30:00", "%Y/%m/%d %H:%M:%S")
+    assert parsed == parse_with_strptime("2024-03-31T01:30:00.000Z")
+
+
+def test_missing_values():
+    assert UaDateParser.parse_date(None) is None
+    assert UaDateParser.parse_date("") is None
+
+
+def test_epoch_column_matches_parse_dates():
+    values = DATES + [None, "", "2024-10-27T00:30:00.12Z"]
+    column = UaDateParser.parse_epoch_column(values)
+    expected = [NO_TIME if date is None else UaDateParser.to_epoch_us(date) for date in UaDateParser.parse_dates(values)]
+    assert list(column) == expected
+
+
+def test_epoch_column_round_trips():
+    for date_string in DATES:
+        epoch_us = UaDateParser.parse_epoch_column([date_string])[0]
+        assert UaDateParser.from_epoch_us(epoch_us) == UaDateParser.parse_date(date_string)
+
+
+def test_epoch_column_rejects_invalid_values():
+    with pytest.raises(ValueError):
+        UaDateParser.parse_epoch_column(["2024-02-30T00:00:00.000Z"])